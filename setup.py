@@ -30,9 +30,19 @@ setup(
         "pydantic>2",
     ],
     extras_require={
+        "numpy": [
+            "numpy",
+        ],
+        "orjson": [
+            "orjson",
+        ],
+        "msgspec": [
+            "msgspec",
+        ],
         "test": [
             "jsonschema",
             "numpy",
+            "orjson",
             "pre-commit",
             "pytest",
             "pytest-cov",
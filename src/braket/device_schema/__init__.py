@@ -11,43 +11,79 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License
 
-from braket.device_schema.blackbird_device_action_properties import (  # noqa: F401
-    BlackbirdDeviceActionProperties,
-)
-from braket.device_schema.continuous_variable_qpu_paradigm_properties_v1 import (  # noqa: F401
-    ContinuousVariableQpuParadigmProperties,
-)
-from braket.device_schema.device_action_properties import (  # noqa: F401
-    DeviceActionProperties,
-    DeviceActionType,
-)
-from braket.device_schema.device_capabilities import DeviceCapabilities  # noqa: F401
-from braket.device_schema.device_connectivity import DeviceConnectivity  # noqa: F401
-from braket.device_schema.device_execution_window import (  # noqa: F401
-    DeviceExecutionWindow,
-    ExecutionDay,
-)
-from braket.device_schema.device_service_properties_v1 import DeviceServiceProperties  # noqa: F401
-from braket.device_schema.gate_model_parameters_v1 import GateModelParameters  # noqa: F401
-from braket.device_schema.gate_model_qpu_paradigm_properties_v1 import (  # noqa: F401
-    GateModelQpuParadigmProperties,
-)
-from braket.device_schema.jaqcd_device_action_properties import (  # noqa: F401
-    JaqcdDeviceActionProperties,
-)
-from braket.device_schema.openqasm_device_action_properties import (  # noqa: F401
-    OpenQASMDeviceActionProperties,
-)
-from braket.device_schema.openqasm_program_set_device_action_properties import (  # noqa: F401
-    OpenQASMProgramSetDeviceActionProperties,
-)
-from braket.device_schema.result_type import ResultType  # noqa: F401
-from braket.device_schema.standardized_gate_model_qpu_device_properties_v1 import (  # noqa: F401
-    StandardizedGateModelQpuDeviceProperties,
-)
-from braket.device_schema.standardized_gate_model_qpu_device_properties_v2 import (  # noqa: F401
-    StandardizedGateModelQpuDeviceProperties as StandardizedGateModelQpuDevicePropertiesV2,
-)
-from braket.device_schema.standardized_gate_model_qpu_device_properties_v3 import (  # noqa: F401
-    StandardizedGateModelQpuDeviceProperties as StandardizedGateModelQpuDevicePropertiesV3,
+from typing import TYPE_CHECKING
+
+from braket.schema_common._lazy_exports import lazy_exports
+
+# For type checkers only; at runtime each export is imported on first access
+if TYPE_CHECKING:
+    from braket.device_schema.blackbird_device_action_properties import (  # noqa: F401
+        BlackbirdDeviceActionProperties,
+    )
+    from braket.device_schema.continuous_variable_qpu_paradigm_properties_v1 import (  # noqa: F401
+        ContinuousVariableQpuParadigmProperties,
+    )
+    from braket.device_schema.device_action_properties import (  # noqa: F401
+        DeviceActionProperties,
+        DeviceActionType,
+    )
+    from braket.device_schema.device_capabilities import DeviceCapabilities  # noqa: F401
+    from braket.device_schema.device_connectivity import DeviceConnectivity  # noqa: F401
+    from braket.device_schema.device_execution_window import (  # noqa: F401
+        DeviceExecutionWindow,
+        ExecutionDay,
+    )
+    from braket.device_schema.device_service_properties_v1 import DeviceServiceProperties  # noqa: F401
+    from braket.device_schema.gate_model_parameters_v1 import GateModelParameters  # noqa: F401
+    from braket.device_schema.gate_model_qpu_paradigm_properties_v1 import (  # noqa: F401
+        GateModelQpuParadigmProperties,
+    )
+    from braket.device_schema.jaqcd_device_action_properties import (  # noqa: F401
+        JaqcdDeviceActionProperties,
+    )
+    from braket.device_schema.openqasm_device_action_properties import (  # noqa: F401
+        OpenQASMDeviceActionProperties,
+    )
+    from braket.device_schema.openqasm_program_set_device_action_properties import (  # noqa: F401
+        OpenQASMProgramSetDeviceActionProperties,
+    )
+    from braket.device_schema.result_type import ResultType  # noqa: F401
+    from braket.device_schema.standardized_gate_model_qpu_device_properties_v1 import (  # noqa: F401
+        StandardizedGateModelQpuDeviceProperties,
+    )
+    from braket.device_schema.standardized_gate_model_qpu_device_properties_v2 import (  # noqa: F401
+        StandardizedGateModelQpuDeviceProperties as StandardizedGateModelQpuDevicePropertiesV2,
+    )
+    from braket.device_schema.standardized_gate_model_qpu_device_properties_v3 import (  # noqa: F401
+        StandardizedGateModelQpuDeviceProperties as StandardizedGateModelQpuDevicePropertiesV3,
+    )
+
+__getattr__, __dir__, __all__ = lazy_exports(
+    __name__,
+    {
+        "BlackbirdDeviceActionProperties": "blackbird_device_action_properties",
+        "ContinuousVariableQpuParadigmProperties": "continuous_variable_qpu_paradigm_properties_v1",
+        "DeviceActionProperties": "device_action_properties",
+        "DeviceActionType": "device_action_properties",
+        "DeviceCapabilities": "device_capabilities",
+        "DeviceConnectivity": "device_connectivity",
+        "DeviceExecutionWindow": "device_execution_window",
+        "ExecutionDay": "device_execution_window",
+        "DeviceServiceProperties": "device_service_properties_v1",
+        "GateModelParameters": "gate_model_parameters_v1",
+        "GateModelQpuParadigmProperties": "gate_model_qpu_paradigm_properties_v1",
+        "JaqcdDeviceActionProperties": "jaqcd_device_action_properties",
+        "OpenQASMDeviceActionProperties": "openqasm_device_action_properties",
+        "OpenQASMProgramSetDeviceActionProperties": "openqasm_program_set_device_action_properties",
+        "ResultType": "result_type",
+        "StandardizedGateModelQpuDeviceProperties": "standardized_gate_model_qpu_device_properties_v1",
+        "StandardizedGateModelQpuDevicePropertiesV2": (
+            "standardized_gate_model_qpu_device_properties_v2",
+            "StandardizedGateModelQpuDeviceProperties",
+        ),
+        "StandardizedGateModelQpuDevicePropertiesV3": (
+            "standardized_gate_model_qpu_device_properties_v3",
+            "StandardizedGateModelQpuDeviceProperties",
+        ),
+    },
 )
@@ -11,7 +11,6 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
-import json
 
 from pydantic.v1 import Field
 
@@ -29,14 +28,14 @@ from braket.device_schema.openqasm_program_set_device_action_properties import (
 from braket.device_schema.standardized_gate_model_qpu_device_properties_v3 import (
     StandardizedGateModelQpuDeviceProperties,
 )
-from braket.schema_common import BraketSchemaBase, BraketSchemaHeader
+from braket.schema_common import BraketSchemaBase, BraketSchemaHeader, json_backend
 
 
 def _loads_with_provider(serialized: str) -> dict:
-    deserialized = json.loads(serialized)
+    deserialized = json_backend.loads(serialized)
     provider = deserialized.get("provider")
     deserialized["provider"] = (
-        IonqProviderProperties.parse_raw(json.dumps(provider)).dict() if provider else None
+        IonqProviderProperties.parse_raw(json_backend.dumps(provider)).dict() if provider else None
     )
     return deserialized
 
@@ -44,9 +43,9 @@ def _loads_with_provider(serialized: str) -> dict:
 def _dumps_with_provider(payload: dict, **kwargs):
     provider = payload.get("provider")
     payload["provider"] = (
-        json.loads(IonqProviderProperties.parse_obj(provider).json()) if provider else None
+        json_backend.loads(IonqProviderProperties.parse_obj(provider).json()) if provider else None
     )
-    return json.dumps(payload, **kwargs)
+    return json_backend.dumps(payload, **kwargs)
 
 
 class IonqDeviceCapabilities(BraketSchemaBase, DeviceCapabilities):
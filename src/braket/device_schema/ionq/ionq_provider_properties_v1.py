@@ -11,7 +11,6 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
-import json
 from importlib import import_module
 
 from pydantic.v1 import Field
@@ -20,11 +19,11 @@ from braket.device_schema.error_mitigation.error_mitigation_properties import (
     ErrorMitigationProperties,
 )
 from braket.device_schema.error_mitigation.error_mitigation_scheme import ErrorMitigationScheme
-from braket.schema_common import BraketSchemaBase, BraketSchemaHeader
+from braket.schema_common import BraketSchemaBase, BraketSchemaHeader, json_backend
 
 
 def _loads_with_error_mitigation(serialized: str) -> dict:
-    deserialized = json.loads(serialized)
+    deserialized = json_backend.loads(serialized)
     em = deserialized.get("errorMitigation") or {}
     em_with_types = {}
     for k, v in em.items():
@@ -38,7 +37,7 @@ def _dumps_with_error_mitigation(payload: dict, **kwargs):
     em = payload.get("errorMitigation") or {}
     em_serialized = {f"{k.__module__}.{k.__name__}": v for k, v in em.items()}
     payload["errorMitigation"] = em_serialized or None
-    return json.dumps(payload, **kwargs)
+    return json_backend.dumps(payload, **kwargs)
 
 
 class IonqProviderProperties(BraketSchemaBase):
@@ -19,6 +19,7 @@ from pydantic.v1 import BaseModel, Field
 from braket.ir.ahs.atom_arrangement import AtomArrangement
 from braket.ir.ahs.hamiltonian import Hamiltonian
 from braket.schema_common import BraketSchemaBase, BraketSchemaHeader
+from braket.schema_common.content_hash import ContentHashMixin
 
 
 class Setup(BaseModel):
@@ -31,7 +32,7 @@ class Setup(BaseModel):
     ahs_register: AtomArrangement
 
 
-class Program(BraketSchemaBase):
+class Program(ContentHashMixin, BraketSchemaBase):
     """Specifies an AHS program
 
     Attributes:
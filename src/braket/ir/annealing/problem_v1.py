@@ -16,6 +16,7 @@ from enum import Enum
 from pydantic.v1 import Field, conint
 
 from braket.schema_common import BraketSchemaBase, BraketSchemaHeader
+from braket.schema_common.content_hash import ContentHashMixin
 
 
 class ProblemType(str, Enum):
@@ -29,7 +30,7 @@ class ProblemType(str, Enum):
     ISING = "ISING"
 
 
-class Problem(BraketSchemaBase):
+class Problem(ContentHashMixin, BraketSchemaBase):
     """Specifies a quantum annealing problem.
 
     Attributes:
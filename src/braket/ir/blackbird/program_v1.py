@@ -14,9 +14,10 @@
 from pydantic.v1 import Field
 
 from braket.schema_common import BraketSchemaBase, BraketSchemaHeader
+from braket.schema_common.content_hash import ContentHashMixin
 
 
-class Program(BraketSchemaBase):
+class Program(ContentHashMixin, BraketSchemaBase):
     """
     Root object of the Blackbird IR.
 
@@ -0,0 +1,233 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from pydantic.v1.validators import str_validator
+
+from braket.ir.gate_model_shared.matrices import to_complex_array
+
+# The observables a qubit of a term can be acted on by, indexed by their code
+OBSERVABLE_CODES = ("i", "x", "y", "z", "h", "hermitian")
+HERMITIAN_CODE = OBSERVABLE_CODES.index("hermitian")
+
+# The pattern of Hamiltonian strings in the JSON schema, which matches the strings that
+# parse_hamiltonian accepts
+_sign_regex = r"-\s*"
+_coef_regex = r"\d*(\.\d*)?\s*\*\s*"
+_factor_regex = rf"({_sign_regex})?({_coef_regex})?[ixyzh]\s*"
+_hamiltonian_regex = rf"^{_factor_regex}([@+-]\s*{_factor_regex})*$"
+
+# One factor of a term and the operator after it. The possessive quantifiers never
+# backtrack, so each match takes time linear in the length of the factor.
+_factor = re.compile(r"(-\s*+)?(?:(\d*+(?:\.\d*+)?)\s*+\*\s*+)?([ixyzh])\s*+([@+-]?)\s*+")
+_codes = {observable: code for code, observable in enumerate(OBSERVABLE_CODES[:HERMITIAN_CODE])}
+
+# The longest Hamiltonian whose terms are cached, so that the cache holds little memory
+_CACHED_LENGTH = 1024
+
+
+@dataclass(frozen=True, eq=False)
+class ObservableTerms:
+    """
+    The decomposition of an observable into a sum of tensor product terms. A list
+    observable is a single term with coefficient 1, and a string in Hamiltonian format,
+    such as `"2 * x @ y - 0.5 * z"`, has a term for each summand.
+
+    Attributes:
+        coefficients (tuple[float, ...]): The coefficient of each term.
+        codes (tuple[bytes, ...]): For each term, the observable acting on each of its
+            qubits, in order, as indices into `OBSERVABLE_CODES`: 0 for `i`, 1 for `x`,
+            2 for `y`, 3 for `z`, 4 for `h` and 5 for a Hermitian matrix. A matrix acting
+            on k qubits has k consecutive codes of 5.
+        matrices (tuple[numpy.ndarray, ...]): The Hermitian matrices of the terms in order,
+            as read-only complex128 arrays.
+
+    Terms are equal, and hash equally, if their coefficients, codes and the elements of
+    their matrices are equal.
+
+    Examples:
+        >>> terms = parse_hamiltonian("2 * x @ y - 0.5 * z")
+        >>> terms.coefficients
+        (2.0, -0.5)
+        >>> terms.observables(0)
+        ('x', 'y')
+    """
+
+    coefficients: tuple[float, ...]
+    codes: tuple[bytes, ...]
+    matrices: tuple[Any, ...] = ()
+
+    def __len__(self) -> int:
+        return len(self.coefficients)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ObservableTerms):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def _key(self) -> tuple:
+        # Adding 0 turns -0.0 into 0.0, so that equal matrices have the same bytes
+        return (
+            self.coefficients,
+            self.codes,
+            tuple((matrix.shape, (matrix + 0).tobytes()) for matrix in self.matrices),
+        )
+
+    def observables(self, term: int) -> tuple[str, ...]:
+        """
+        Args:
+            term (int): The index of the term.
+
+        Returns:
+            tuple[str, ...]: The observable acting on each qubit of the term, such as
+            `("x", "y")`.
+        """
+        return tuple(OBSERVABLE_CODES[code] for code in self.codes[term])
+
+
+# The former name of ObservableTerms, from when only Hamiltonian strings were decomposed
+HamiltonianTerms = ObservableTerms
+
+
+def parse_hamiltonian(hamiltonian: str) -> ObservableTerms:
+    """
+    Parses an observable in Hamiltonian format in one pass, in time linear in its length.
+
+    A Hamiltonian is a sum of terms separated by `+` or `-`. A term is a tensor product of
+    observables `x`, `y`, `z`, `h` and `i` separated by `@`, each optionally preceded by a
+    `-` and a coefficient followed by `*`. The coefficient of a term is the product of the
+    coefficients of its factors, negated if the term follows a `-`. Whitespace is allowed
+    around operators. The results for strings of up to 1024 characters are cached, so
+    validating a model and then reading its terms parses such a string once.
+
+    Args:
+        hamiltonian (str): The Hamiltonian, such as `"2 * x @ y - 0.5 * z"`.
+
+    Returns:
+        ObservableTerms: The coefficient and observables of each term.
+
+    Raises:
+        ValueError: If the string is not a valid Hamiltonian.
+
+    Examples:
+        >>> parse_hamiltonian("2 * x @ - 3 * y + z").coefficients
+        (-6.0, 1.0)
+    """
+    if len(hamiltonian) <= _CACHED_LENGTH:
+        return _parse_cached(hamiltonian)
+    return _parse(hamiltonian)
+
+
+def _parse(hamiltonian: str) -> ObservableTerms:
+    coefficients = []
+    codes = []
+    coefficient = 1.0
+    term = bytearray()
+    position = 0
+    while True:
+        match = _factor.match(hamiltonian, position)
+        if not match:
+            raise ValueError(f"invalid Hamiltonian observable at position {position}")
+        sign, number, observable, operator = match.groups()
+        if number and number != ".":
+            coefficient *= float(number)
+        if sign:
+            coefficient = -coefficient
+        term.append(_codes[observable])
+        position = match.end()
+        if operator == "@":
+            continue
+        coefficients.append(coefficient)
+        codes.append(bytes(term))
+        if not operator:
+            break
+        coefficient = -1.0 if operator == "-" else 1.0
+        term = bytearray()
+    if position != len(hamiltonian):
+        raise ValueError(f"invalid Hamiltonian observable at position {position}")
+    return ObservableTerms(tuple(coefficients), tuple(codes))
+
+
+_parse_cached = lru_cache(maxsize=256)(_parse)
+
+
+def observable_terms(observable: str | list) -> ObservableTerms:
+    """
+    Decomposes the value of an `observable` field.
+
+    Args:
+        observable (str | list): A string in Hamiltonian format, or a list of observable
+            names and Hermitian matrices of `[re, im]` pairs.
+
+    Returns:
+        ObservableTerms: The terms of the observable. Requires numpy if the observable has
+        Hermitian matrices.
+
+    Raises:
+        ValueError: If the observable is not valid, or a matrix is not square with a
+            dimension that is a power of 2.
+
+    Examples:
+        >>> terms = observable_terms(["x", [[[0, 0], [1, 0]], [[1, 0], [0, 0]]]])
+        >>> terms.observables(0)
+        ('x', 'hermitian')
+    """
+    if isinstance(observable, str):
+        return parse_hamiltonian(observable)
+    codes = bytearray()
+    matrices = []
+    for factor in observable:
+        if isinstance(factor, str):
+            codes.append(_codes[factor[0]])
+            continue
+        matrix = to_complex_array(factor)
+        dimension = len(matrix)
+        qubits = dimension.bit_length() - 1
+        if matrix.shape != (dimension, dimension) or dimension != 1 << qubits:
+            raise ValueError("Hermitian matrices must be square with a dimension of 2^qubits")
+        matrix.setflags(write=False)
+        codes.extend(bytes([HERMITIAN_CODE]) * qubits)
+        matrices.append(matrix)
+    return ObservableTerms((1.0,), (bytes(codes),), tuple(matrices))
+
+
+class Hamiltonian:
+    """
+    The type of observables in Hamiltonian format. Strings are validated with
+    `parse_hamiltonian` instead of a regular expression. The JSON schema has a pattern that
+    matches the same strings as the parser.
+    """
+
+    @classmethod
+    def __get_validators__(cls):
+        yield str_validator
+        yield cls.validate
+
+    @classmethod
+    def __modify_schema__(cls, field_schema: dict) -> None:
+        field_schema.update(type="string", pattern=_hamiltonian_regex)
+
+    @classmethod
+    def validate(cls, value: str) -> str:
+        parse_hamiltonian(value)
+        return value
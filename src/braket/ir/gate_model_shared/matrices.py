@@ -0,0 +1,223 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic.v1 import BaseConfig, BaseModel, ValidationError, confloat, conlist
+from pydantic.v1.fields import ModelField
+from pydantic.v1.schema import field_schema
+
+from braket.schema_common._numpy import import_numpy
+
+# The absolute tolerance of the unitarity and completeness checks, or None if they are disabled
+_tolerance = None
+
+_Real = confloat(gt=float("-inf"), lt=float("inf"))
+_Complex = conlist(_Real, min_items=2, max_items=2)
+
+
+def set_matrix_tolerance(tolerance: float | None) -> None:
+    """
+    Enables or disables the physical checks of the matrices of instructions: that the matrix
+    of a `Unitary` is unitary, and that the matrices of a `Kraus` channel are complete, so the
+    channel preserves the trace. Both also check that the matrices have dimension 2^n for n
+    targets. The checks are disabled by default. Requires numpy when enabled.
+
+    Args:
+        tolerance (float | None): The absolute tolerance of each element of the products of
+            the matrices, such as 1e-8, or None to disable the checks.
+
+    Raises:
+        ValueError: If the tolerance is negative.
+    """
+    global _tolerance
+    if tolerance is not None and not tolerance >= 0:
+        raise ValueError(f"tolerance must be non-negative, not {tolerance}")
+    _tolerance = tolerance
+
+
+def get_matrix_tolerance() -> float | None:
+    """
+    Returns:
+        float | None: The tolerance of the physical checks of matrices, or None if they are
+        disabled.
+    """
+    return _tolerance
+
+
+class _ComplexArray:
+    """
+    Base of the types of nested lists of complex numbers, each a pair of real numbers.
+
+    Values that form a regular array are decoded into a numpy array and checked with a few
+    vectorized operations. Other values, and any values if numpy is not installed, are
+    validated element by element as the nested `conlist` type in `_fallback`, which gives
+    the same result and the same errors.
+    """
+
+    # The nested conlist type as a field, and the maximum length of each dimension
+    _fallback: ModelField
+    _max_shape: tuple[int | None, ...]
+
+    @classmethod
+    def __get_validators__(cls):
+        yield cls.validate
+
+    @classmethod
+    def __modify_schema__(cls, schema: dict) -> None:
+        fallback_schema = field_schema(cls._fallback, model_name_map={})[0]
+        fallback_schema.pop("title", None)
+        schema.update(fallback_schema)
+
+    @classmethod
+    def validate(cls, value: Any) -> list:
+        array = cls._decode(value)
+        if array is not None:
+            return array.tolist()
+        value, errors = cls._fallback.validate(value, {}, loc=())
+        if errors:
+            raise ValidationError([errors], BaseModel)
+        return value
+
+    @classmethod
+    def _decode(cls, value: Any) -> Any:
+        """
+        Returns:
+            Any: The value as a float64 numpy array with a last dimension of 2 if it is a
+            valid regular array, or None if it must be validated element by element.
+        """
+        try:
+            np = import_numpy()
+        except ImportError:
+            return None
+        try:
+            array = np.asarray(value)
+            if array.dtype.kind == "c" or (
+                value is array and array.ndim == len(cls._max_shape) - 1
+            ):
+                # A numpy array of complex numbers, or of real numbers without the pairs
+                array = np.stack((array.real, array.imag), axis=-1)
+            array = array.astype(np.float64, copy=False)
+        except (TypeError, ValueError):
+            return None
+        shape = array.shape
+        if (
+            len(shape) != len(cls._max_shape)
+            or not all(
+                size and (limit is None or size <= limit)
+                for size, limit in zip(shape, cls._max_shape)
+            )
+            or not np.isfinite(array).all()
+        ):
+            return None
+        return array
+
+
+class ComplexMatrix(_ComplexArray):
+    """
+    A non-empty matrix of complex numbers, each a list of its real and imaginary parts.
+    A numpy array of complex or real numbers is also accepted.
+    """
+
+    _fallback = ModelField.infer(
+        name="matrix",
+        value=...,
+        annotation=conlist(conlist(_Complex, min_items=1), min_items=1),
+        class_validators=None,
+        config=BaseConfig,
+    )
+    _max_shape = (None, None, 2)
+
+
+class ComplexMatrixList(_ComplexArray):
+    """
+    A list of up to 16 non-empty matrices of up to 4 by 4 complex numbers, each a list of its
+    real and imaginary parts. A numpy array of complex or real numbers is also accepted.
+    """
+
+    _fallback = ModelField.infer(
+        name="matrices",
+        value=...,
+        annotation=conlist(
+            conlist(conlist(_Complex, min_items=1, max_items=4), min_items=1, max_items=4),
+            min_items=1,
+            max_items=16,
+        ),
+        class_validators=None,
+        config=BaseConfig,
+    )
+    _max_shape = (16, 4, 4, 2)
+
+
+def to_complex_array(pairs: list) -> Any:
+    """
+    Args:
+        pairs (list): Nested lists of complex numbers, each a list of its real and imaginary
+            parts, with the same length in each dimension.
+
+    Returns:
+        numpy.ndarray: The complex128 array.
+
+    Raises:
+        ValueError: If the lists do not form a regular array.
+    """
+    np = import_numpy()
+    array = np.asarray(pairs, dtype=np.float64)
+    return array[..., 0] + 1j * array[..., 1]
+
+
+def check_unitary(matrix: list, qubits: int, tolerance: float) -> None:
+    """
+    Args:
+        matrix (list): The matrix, as validated by `ComplexMatrix`.
+        qubits (int): The number of qubits the matrix acts on.
+        tolerance (float): The absolute tolerance of each element of `U†U - I`.
+
+    Raises:
+        ValueError: If the matrix is not a unitary of dimension 2^qubits.
+    """
+    np = import_numpy()
+    unitary = _square_matrices(np, [matrix], qubits)[0]
+    if not np.allclose(unitary.conj().T @ unitary, np.eye(len(unitary)), rtol=0, atol=tolerance):
+        raise ValueError(f"matrix is not unitary within tolerance {tolerance}")
+
+
+def check_kraus(matrices: list, qubits: int, tolerance: float) -> None:
+    """
+    Args:
+        matrices (list): The Kraus operators, as validated by `ComplexMatrixList`.
+        qubits (int): The number of qubits the operators act on.
+        tolerance (float): The absolute tolerance of each element of `sum(K†K) - I`.
+
+    Raises:
+        ValueError: If the operators are not of dimension 2^qubits or not complete.
+    """
+    np = import_numpy()
+    operators = _square_matrices(np, matrices, qubits)
+    completeness = np.einsum("kji,kjl->il", operators.conj(), operators)
+    if not np.allclose(completeness, np.eye(completeness.shape[0]), rtol=0, atol=tolerance):
+        raise ValueError(f"Kraus operators are not complete within tolerance {tolerance}")
+
+
+def _square_matrices(np: Any, matrices: list, qubits: int) -> Any:
+    dimension = 2**qubits
+    try:
+        array = to_complex_array(matrices)
+    except ValueError:
+        array = None
+    if array is None or array.shape[1:] != (dimension, dimension):
+        raise ValueError(f"matrices must be {dimension}x{dimension} for {qubits} targets")
+    return array
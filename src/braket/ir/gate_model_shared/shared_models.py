@@ -11,7 +11,24 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
-from pydantic.v1 import BaseModel, confloat, conint, conlist, constr, root_validator
+from typing import Any
+
+from pydantic.v1 import (
+    BaseModel,
+    PrivateAttr,
+    confloat,
+    conint,
+    conlist,
+    constr,
+    root_validator,
+)
+
+from braket.ir.gate_model_shared.hamiltonian import (
+    Hamiltonian,
+    ObservableTerms,
+    observable_terms,
+)
+from braket.ir.gate_model_shared.matrices import ComplexMatrix, ComplexMatrixList, to_complex_array
 
 
 class SingleTarget(BaseModel):
@@ -313,18 +330,23 @@ class TwoDimensionalMatrix(BaseModel):
             Each complex number is represented using a List[float] of size 2, with
             element[0] being the real part and element[1] imaginary.
             inf, -inf, and NaN are not allowable inputs for the element.
+            A numpy array of complex or real numbers is also accepted.
 
     Examples:
         >>> TwoDimensionalMatrix(matrix=[[[0, 0], [1, 0]], [[1, 0], [0, 0]]])
     """
 
-    matrix: conlist(
-        conlist(
-            conlist(confloat(gt=float("-inf"), lt=float("inf")), min_items=2, max_items=2),
-            min_items=1,
-        ),
-        min_items=1,
-    )
+    matrix: ComplexMatrix
+
+    def to_array(self) -> Any:
+        """
+        Returns:
+            numpy.ndarray: The matrix as a complex128 array. Requires numpy.
+
+        Raises:
+            ValueError: If the rows of the matrix do not have the same length.
+        """
+        return to_complex_array(self.matrix)
 
 
 class TwoDimensionalMatrixList(BaseModel):
@@ -337,6 +359,7 @@ class TwoDimensionalMatrixList(BaseModel):
             element[0] being the real part and element[1] imaginary.
             inf, -inf, and NaN are not allowable inputs for the element.
             The number of matrices is limited to 16 and the size of each matrix is limited to 4*4.
+            A numpy array of complex or real numbers is also accepted.
 
     Examples:
         >>> TwoDimensionalMatrixList(matrices=[[[[1, 0], [0, 0]], [[0, 0], [1, 0]]],
@@ -345,19 +368,18 @@ class TwoDimensionalMatrixList(BaseModel):
                                     )
     """
 
-    matrices: conlist(
-        conlist(
-            conlist(
-                conlist(confloat(gt=float("-inf"), lt=float("inf")), min_items=2, max_items=2),
-                min_items=1,
-                max_items=4,
-            ),
-            min_items=1,
-            max_items=4,
-        ),
-        min_items=1,
-        max_items=16,
-    )
+    matrices: ComplexMatrixList
+
+    def to_array(self) -> Any:
+        """
+        Returns:
+            numpy.ndarray: The matrices as a complex128 array of shape (matrices, rows,
+            columns). Requires numpy.
+
+        Raises:
+            ValueError: If the matrices do not all have the same shape.
+        """
+        return to_complex_array(self.matrices)
 
 
 class Observable(BaseModel):
@@ -372,7 +394,9 @@ class Observable(BaseModel):
             Each complex number is represented using a List[float] of size 2, with
             element[0] being the real part and element[1] imaginary.
             inf, -inf, and NaN are not allowable inputs for the element.
-            Alternatively, a string constructing an observable in Hamiltonian format.
+            Alternatively, a string constructing an observable in Hamiltonian format,
+            which is parsed by `parse_hamiltonian`. `observable_terms()` returns the
+            decomposition of either form.
 
     Examples:
         >>> Observable(observable=["x"])
@@ -380,21 +404,43 @@ class Observable(BaseModel):
         >>> Observable(observable="2 * x @ y + 3 * z")
     """
 
-    _coef_regex = r"(-?\d*\.?\d*\s*\*\s*)"
-    _obs_regex = r"[xyzhi]"
-    _term_regex = rf"{_coef_regex}?{_obs_regex}(\s*@\s*{_obs_regex})*"
-    _hamiltonian_regex = rf"{_term_regex}(\s*\+\s*{_term_regex})*"
-    observable: conlist(
-        constr(regex="(x|y|z|h|i)")
-        | conlist(
-            conlist(
-                conlist(confloat(gt=float("-inf"), lt=float("inf")), min_items=2, max_items=2),
+    observable: (
+        conlist(
+            constr(regex="(x|y|z|h|i)")
+            | conlist(
+                conlist(
+                    conlist(confloat(gt=float("-inf"), lt=float("inf")), min_items=2, max_items=2),
+                    min_items=2,
+                ),
                 min_items=2,
             ),
-            min_items=2,
-        ),
-        min_items=1,
-    ) | constr(regex=_hamiltonian_regex)
+            min_items=1,
+        )
+        | Hamiltonian
+    )
+
+    _terms: Any = PrivateAttr(default=None)
+
+    def observable_terms(self) -> ObservableTerms:
+        """
+        Returns:
+            ObservableTerms: The decomposition of the observable into tensor product terms,
+            with the observable acting on each target of each term. It is computed on the
+            first call and cached. Requires numpy if the observable has Hermitian
+            matrices.
+        """
+        if self._terms is None:
+            self._terms = observable_terms(self.observable)
+        return self._terms
+
+    def hamiltonian_terms(self) -> ObservableTerms | None:
+        """
+        Returns:
+            ObservableTerms | None: The terms of the observable if it is a string in
+            Hamiltonian format, otherwise None. Prefer `observable_terms()`, which also
+            decomposes lists.
+        """
+        return self.observable_terms() if isinstance(self.observable, str) else None
 
 
 class MultiState(BaseModel):
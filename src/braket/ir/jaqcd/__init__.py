@@ -11,6 +11,20 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
+from typing import TYPE_CHECKING
+
+from braket.ir.gate_model_shared.hamiltonian import (  # noqa: F401
+    HERMITIAN_CODE,
+    OBSERVABLE_CODES,
+    HamiltonianTerms,
+    ObservableTerms,
+    observable_terms,
+    parse_hamiltonian,
+)
+from braket.ir.gate_model_shared.matrices import (  # noqa: F401
+    get_matrix_tolerance,
+    set_matrix_tolerance,
+)
 from braket.ir.jaqcd.instructions import (  # noqa: F401
     CV,
     CY,
@@ -71,3 +85,32 @@ from braket.ir.jaqcd.results import (  # noqa: F401
     StateVector,
     Variance,
 )
+from braket.schema_common._lazy_exports import lazy_exports
+
+# For type checkers only; at runtime each export is imported on first access
+if TYPE_CHECKING:
+    from braket.ir.jaqcd.circuit_stats import CircuitStats  # noqa: F401
+    from braket.ir.jaqcd.interning import (  # noqa: F401
+        get_instruction_interning,
+        set_instruction_interning,
+    )
+    from braket.ir.jaqcd.packed_program import (  # noqa: F401
+        INSTRUCTION_TYPES,
+        PackedInstructions,
+        PackedProgram,
+    )
+    from braket.ir.jaqcd.program_stream import iter_program  # noqa: F401
+
+# The models of the instructions, results and programs are imported eagerly, as before
+__getattr__, __dir__, _ = lazy_exports(
+    __name__,
+    {
+        "CircuitStats": "circuit_stats",
+        "get_instruction_interning": "interning",
+        "set_instruction_interning": "interning",
+        "INSTRUCTION_TYPES": "packed_program",
+        "PackedInstructions": "packed_program",
+        "PackedProgram": "packed_program",
+        "iter_program": "program_stream",
+    },
+)
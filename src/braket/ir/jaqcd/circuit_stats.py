@@ -0,0 +1,159 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from pydantic.v1 import BaseModel
+from pydantic.v1.fields import SHAPE_SINGLETON
+
+from braket.ir.jaqcd.instructions import EndVerbatimBox, StartVerbatimBox
+from braket.ir.jaqcd.program_v1 import Program, _valid_gates, _valid_noise_channels
+
+# The qubit fields of each instruction and result class, with whether each is a list
+_qubit_fields: dict[type[BaseModel], tuple[tuple[str, bool], ...]] = {}
+
+
+@dataclass(frozen=True)
+class CircuitStats:
+    """
+    Statistics of a jaqcd program, computed in one pass over its instructions, basis rotation
+    instructions and results.
+
+    Attributes:
+        qubits (frozenset[int]): The qubits used by any instruction, basis rotation
+            instruction or result.
+        result_qubits (frozenset[int]): The qubits targeted by results. Results without
+            targets act on all qubits and add none.
+        instruction_counts (Mapping[str, int]): The number of instructions in
+            `instructions` of each type, such as `"h"`. Read-only.
+        two_qubit_gate_count (int): The number of gates in `instructions` that act on two
+            qubits.
+        has_noise (bool): Whether `instructions` has noise channels.
+        verbatim_boxes (tuple[tuple[int, int | None], ...]): The indices in `instructions`
+            of the `StartVerbatimBox` and `EndVerbatimBox` of each verbatim box, with None
+            as the end of a box that is not closed.
+        depth (int): The depth of `instructions`: the number of layers when each gate and
+            noise channel is placed in the layer after the last one on any of its qubits.
+
+    Examples:
+        >>> program = Program(instructions=[H(target=0), CNot(control=0, target=1)])
+        >>> program.circuit_stats().depth
+        2
+    """
+
+    qubits: frozenset[int]
+    result_qubits: frozenset[int]
+    instruction_counts: Mapping[str, int]
+    two_qubit_gate_count: int
+    has_noise: bool
+    verbatim_boxes: tuple[tuple[int, int | None], ...]
+    depth: int
+
+    @property
+    def qubit_count(self) -> int:
+        """
+        int: The number of qubits used by the program.
+        """
+        return len(self.qubits)
+
+
+def compute_circuit_stats(program: Program) -> CircuitStats:
+    """
+    Computes the statistics of a program. Use `Program.circuit_stats`, which caches them.
+
+    Args:
+        program (Program): The program.
+
+    Returns:
+        CircuitStats: The statistics of the program.
+    """
+    qubits = set()
+    counts = Counter()
+    two_qubit_gate_count = 0
+    has_noise = False
+    verbatim_boxes = []
+    box_start = None
+    # The number of layers on each qubit
+    layers = {}
+    depth = 0
+    for index, instruction in enumerate(program.instructions):
+        instruction_type = instruction.type
+        counts[instruction_type] += 1
+        if instruction_type is StartVerbatimBox.Type.start_verbatim_box:
+            if box_start is None:
+                box_start = index
+            continue
+        if instruction_type is EndVerbatimBox.Type.end_verbatim_box:
+            if box_start is not None:
+                verbatim_boxes.append((box_start, index))
+                box_start = None
+            continue
+        instruction_qubits = _qubits(instruction)
+        qubits.update(instruction_qubits)
+        if instruction_type in _valid_noise_channels:
+            has_noise = True
+        elif len(instruction_qubits) == 2 and instruction_type in _valid_gates:
+            two_qubit_gate_count += 1
+        if instruction_qubits:
+            layer = max(layers.get(qubit, 0) for qubit in instruction_qubits) + 1
+            layers.update(dict.fromkeys(instruction_qubits, layer))
+            depth = max(depth, layer)
+    if box_start is not None:
+        verbatim_boxes.append((box_start, None))
+    for instruction in program.basis_rotation_instructions or ():
+        qubits.update(_qubits(instruction))
+    result_qubits = set()
+    for result in program.results or ():
+        result_qubits.update(_qubits(result))
+    qubits |= result_qubits
+    return CircuitStats(
+        qubits=frozenset(qubits),
+        result_qubits=frozenset(result_qubits),
+        instruction_counts=MappingProxyType(
+            {instruction_type.value: count for instruction_type, count in counts.items()}
+        ),
+        two_qubit_gate_count=two_qubit_gate_count,
+        has_noise=has_noise,
+        verbatim_boxes=tuple(verbatim_boxes),
+        depth=depth,
+    )
+
+
+def _qubits(model: BaseModel) -> list[int]:
+    fields = _qubit_fields.get(type(model))
+    if fields is None:
+        fields = _qubit_fields[type(model)] = tuple(
+            (name, model.__fields__[name].shape != SHAPE_SINGLETON)
+            for name in ("control", "controls", "target", "targets")
+            if name in model.__fields__
+        )
+    qubits = []
+    for name, is_list in fields:
+        value = getattr(model, name)
+        if value is None:
+            continue
+        if not is_list:
+            qubits.append(value)
+        elif value and isinstance(value[0], list):
+            # The nested targets of an adjoint gradient
+            for item in value:
+                qubits.extend(item)
+        else:
+            qubits.extend(value)
+    return qubits
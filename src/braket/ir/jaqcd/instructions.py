@@ -13,6 +13,9 @@
 
 from enum import Enum
 
+from pydantic.v1 import root_validator
+
+from braket.ir.gate_model_shared.matrices import check_kraus, check_unitary, get_matrix_tolerance
 from braket.ir.jaqcd.shared_models import (
     Angle,
     CompilerDirective,
@@ -746,6 +749,17 @@ class Unitary(TwoDimensionalMatrix, MultiTarget):
 
     type = Type.unitary
 
+    @root_validator(skip_on_failure=True)
+    def validate_unitary(cls, values):
+        """
+        Checks that the matrix is a unitary on the targets, if matrix checks are enabled with
+        `set_matrix_tolerance`.
+        """
+        tolerance = get_matrix_tolerance()
+        if tolerance is not None:
+            check_unitary(values["matrix"], len(values["targets"]), tolerance)
+        return values
+
 
 class BitFlip(SingleTarget, SingleProbability):
     """
@@ -964,6 +978,17 @@ class Kraus(TwoDimensionalMatrixList, MultiTarget):
 
     type = Type.kraus
 
+    @root_validator(skip_on_failure=True)
+    def validate_completeness(cls, values):
+        """
+        Checks that the matrices are complete Kraus operators on the targets, so the channel
+        preserves the trace, if matrix checks are enabled with `set_matrix_tolerance`.
+        """
+        tolerance = get_matrix_tolerance()
+        if tolerance is not None:
+            check_kraus(values["matrices"], len(values["targets"]), tolerance)
+        return values
+
 
 class StartVerbatimBox(CompilerDirective):
     """
@@ -0,0 +1,152 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+from __future__ import annotations
+
+import weakref
+from typing import Any
+
+from pydantic.v1 import BaseModel
+
+# The fields of instructions without parameters, such as `H` and `CNot`
+_PARAMETER_FREE_FIELDS = frozenset(
+    {"type", "target", "targets", "control", "controls", "directive"}
+)
+
+# The shared instructions by class and fields, or None if interning is disabled. Entries
+# are dropped once no program refers to their instruction.
+_pool: weakref.WeakValueDictionary[tuple, BaseModel] | None = None
+# The immutable subclass of each interned instruction class
+_frozen_classes: dict[type[BaseModel], type[BaseModel]] = {}
+
+
+def set_instruction_interning(enabled: bool) -> None:
+    """
+    Enables or disables the interning of instructions without parameters, such as `H` and
+    `CNot`, in parsed jaqcd programs. When enabled, instructions that `Program` builds from
+    identical dicts are the same immutable instance, which saves memory in large circuits
+    that repeat the same gates on the same qubits, and lets list comparisons skip them by
+    identity. Equality and serialization are unchanged. Interning is disabled by default;
+    disabling it empties the pool of shared instructions.
+
+    Interned instructions are instances of an immutable subclass of their class with the
+    same name, so `isinstance(instruction, H)` holds but `type(instruction) is H` does not.
+    Their list fields, such as `targets`, cannot be modified either. Copies and unpickled
+    instructions are ordinary mutable instances of the class itself.
+
+    Args:
+        enabled (bool): Whether to intern instructions.
+
+    Examples:
+        >>> set_instruction_interning(True)
+        >>> program = Program.parse_raw(circuit_json)
+        >>> program.instructions[0] is program.instructions[2]
+        True
+    """
+    global _pool
+    _pool = weakref.WeakValueDictionary() if enabled else None
+
+
+def get_instruction_interning() -> bool:
+    """
+    Returns:
+        bool: Whether instructions without parameters are interned.
+    """
+    return _pool is not None
+
+
+def intern_instruction(instruction_class: type[BaseModel], fields: dict) -> BaseModel:
+    """
+    Builds an instruction, returning the shared immutable instance for the fields if
+    interning is enabled and the instruction has no parameters.
+
+    Args:
+        instruction_class (type[BaseModel]): The instruction class.
+        fields (dict): The raw fields of the instruction.
+
+    Returns:
+        BaseModel: The instruction.
+    """
+    pool = _pool
+    if pool is None or not _PARAMETER_FREE_FIELDS.issuperset(instruction_class.__fields__):
+        return instruction_class(**fields)
+    key = (instruction_class, *[(name, _hashable(value)) for name, value in fields.items()])
+    try:
+        instruction = pool.get(key)
+    except TypeError:
+        return instruction_class(**fields)
+    if instruction is None:
+        instruction = _frozen_class(instruction_class)(**fields)
+        for name, value in instruction.__dict__.items():
+            if type(value) is list:
+                instruction.__dict__[name] = _FrozenList(value)
+        pool[key] = instruction
+    return instruction
+
+
+def _hashable(value: Any) -> Any:
+    return tuple(value) if type(value) is list else value
+
+
+def _frozen_class(instruction_class: type[BaseModel]) -> type[BaseModel]:
+    frozen_class = _frozen_classes.get(instruction_class)
+    if frozen_class is None:
+
+        class Config:
+            allow_mutation = False
+
+        # The subclass has the same name, so that the repr is the same, and can be weakly
+        # referenced by the pool
+        frozen_class = _frozen_classes[instruction_class] = type(
+            instruction_class.__name__,
+            (instruction_class,),
+            {
+                "__module__": instruction_class.__module__,
+                "__qualname__": instruction_class.__qualname__,
+                "__slots__": ("__weakref__",),
+                "__reduce__": _reduce_frozen,
+                "_get_value": classmethod(_get_thawed_value),
+                "Config": Config,
+            },
+        )
+    return frozen_class
+
+
+class _FrozenList(list):  # noqa: FURB189
+    """A list field of an interned instruction, which is shared and so cannot be modified."""
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("Interned instructions are immutable")
+
+    append = extend = insert = pop = remove = clear = sort = reverse = _immutable
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+
+    def __reduce__(self) -> tuple:
+        return list, (list(self),)
+
+
+def _get_thawed_value(cls: type[BaseModel], value: Any, **kwargs) -> Any:
+    # The dicts of interned instructions have ordinary lists, like those of other instructions
+    if type(value) is _FrozenList:
+        value = list(value)
+    return super(cls, cls)._get_value(value, **kwargs)
+
+
+def _reduce_frozen(instruction: BaseModel) -> tuple:
+    # Copies and unpickled instructions are ordinary mutable instances of the base class
+    return _construct, (type(instruction).__base__, instruction.__fields_set__, instruction.dict())
+
+
+def _construct(instruction_class: type[BaseModel], fields_set: set, fields: dict) -> BaseModel:
+    return instruction_class.construct(fields_set, **fields)
@@ -0,0 +1,538 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from functools import cache
+from typing import Any, NamedTuple
+
+from pydantic.v1 import BaseModel, ConstrainedFloat, ValidationError
+
+from braket.ir.jaqcd.program_v1 import (
+    Program,
+    Results,
+    _valid_instructions,
+)
+from braket.schema_common import json_backend
+from braket.schema_common._numpy import import_numpy
+
+# The instruction type of each opcode; an opcode is the index of its type in this tuple
+INSTRUCTION_TYPES = tuple(_valid_instructions)
+
+
+class _Layout(NamedTuple):
+    """Where the fields of an instruction type are stored in the columns of packed instructions."""
+
+    instruction_class: type[BaseModel]
+    target: str | None
+    control: str | None
+    parameters: tuple[str, ...]
+    # Fields without a column, such as matrices, which are kept per instruction
+    extras: tuple[str, ...]
+    # Whether the instruction must be validated as a model, because it has fields without a
+    # column or validators that relate its fields
+    irregular: bool
+
+
+def _layout(instruction_class: type[BaseModel]) -> _Layout:
+    fields = instruction_class.__fields__
+    target = next((name for name in ("target", "targets") if name in fields), None)
+    control = next((name for name in ("control", "controls") if name in fields), None)
+    parameters = tuple(
+        name
+        for name, model_field in fields.items()
+        if isinstance(model_field.outer_type_, type)
+        and issubclass(model_field.outer_type_, ConstrainedFloat)
+    )
+    extras = tuple(name for name in fields if name not in {"type", target, control, *parameters})
+    irregular = bool(
+        extras
+        or instruction_class.__pre_root_validators__
+        or instruction_class.__post_root_validators__
+    )
+    return _Layout(instruction_class, target, control, parameters, extras, irregular)
+
+
+_layouts = [
+    _layout(_valid_instructions[instruction_type]) for instruction_type in INSTRUCTION_TYPES
+]
+# The bound on the number of qubits of list fields without a maximum length
+_MAX_ITEMS = 2**62
+
+# The numbers in the columns of packed instructions, by numpy dtype kinds
+_KIND_NAMES = {"ui": "integers", "uif": "numbers"}
+
+_opcodes = {instruction_type: opcode for opcode, instruction_type in enumerate(INSTRUCTION_TYPES)}
+
+
+def _item_bounds(layout: _Layout, name: str | None) -> tuple[int, int]:
+    """The least and greatest number of qubits in a target or control field."""
+    if name is None:
+        return 0, 0
+    if name in ("target", "control"):
+        return 1, 1
+    outer_type = layout.instruction_class.__fields__[name].outer_type_
+    return (
+        outer_type.min_items or 0,
+        _MAX_ITEMS if outer_type.max_items is None else outer_type.max_items,
+    )
+
+
+def _parameter_bounds(layout: _Layout, name: str) -> tuple[float, bool, float, bool]:
+    """The lower and upper bounds of a parameter, each with whether it is exclusive."""
+    type_ = layout.instruction_class.__fields__[name].outer_type_
+    lower, lower_exclusive = (type_.gt, True) if type_.gt is not None else (type_.ge, False)
+    upper, upper_exclusive = (type_.lt, True) if type_.lt is not None else (type_.le, False)
+    return (
+        -math.inf if lower is None else lower,
+        lower_exclusive,
+        math.inf if upper is None else upper,
+        upper_exclusive,
+    )
+
+
+class _Tables(NamedTuple):
+    """The layouts of the instruction types as arrays indexed by opcode."""
+
+    target_counts: tuple[Any, Any]
+    control_counts: tuple[Any, Any]
+    parameter_counts: tuple[Any, Any]
+    # The lower bound, whether it is exclusive, the upper bound and whether it is exclusive,
+    # each indexed by opcode and the position of the parameter in the instruction
+    parameter_bounds: tuple[Any, Any, Any, Any]
+    irregular: Any
+
+
+@cache
+def _tables() -> _Tables:
+    np = import_numpy()
+    slots = max(len(layout.parameters) for layout in _layouts)
+    bounds = [
+        [_parameter_bounds(layout, name) for name in layout.parameters]
+        + [(-math.inf, False, math.inf, False)] * (slots - len(layout.parameters))
+        for layout in _layouts
+    ]
+    return _Tables(
+        tuple(
+            np.array(counts) for counts in zip(*(_item_bounds(lay, lay.target) for lay in _layouts))
+        ),
+        tuple(
+            np.array(counts)
+            for counts in zip(*(_item_bounds(lay, lay.control) for lay in _layouts))
+        ),
+        (np.array([len(lay.parameters) for lay in _layouts]),) * 2,
+        tuple(
+            np.array(
+                [[bound[i] for bound in opcode_bounds] for opcode_bounds in bounds], dtype=dtype
+            )
+            for i, dtype in enumerate((np.float64, bool, np.float64, bool))
+        ),
+        np.array([layout.irregular for layout in _layouts]),
+    )
+
+
+def _fields(layout: _Layout, targets: list, controls: list, parameters: list) -> dict[str, Any]:
+    fields = dict(zip(layout.parameters, parameters))
+    if layout.target is not None:
+        fields[layout.target] = targets[0] if layout.target == "target" else targets
+    if layout.control is not None:
+        fields[layout.control] = controls[0] if layout.control == "control" else controls
+    return fields
+
+
+def _append_qubits(fields: dict, name: str | None, qubits: list, counts: list) -> None:
+    if name is None:
+        counts.append(0)
+    elif name in ("target", "control"):
+        qubits.append(fields[name])
+        counts.append(1)
+    else:
+        qubits.extend(fields[name])
+        counts.append(len(fields[name]))
+
+
+def _offsets(np: Any, counts: list[int]) -> Any:
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return offsets
+
+
+@dataclass(frozen=True)
+class PackedInstructions:
+    """
+    Struct-of-arrays form of a list of jaqcd instructions, with one array per kind of field
+    instead of one model per instruction. Requires numpy.
+
+    The targets of all instructions are concatenated into one array, and the targets of
+    instruction `i` are `targets[target_offsets[i]:target_offsets[i + 1]]`; controls and
+    parameters, such as angles and probabilities, are stored in the same way. Parameters are
+    in the order of the fields of the instruction model, for example `probX`, `probY` and
+    `probZ` for a Pauli channel. Fields that have no column, such as the matrix of a
+    `Unitary`, are kept per instruction in `extras`.
+
+    The instructions are validated when they are constructed, see `validate`.
+
+    Attributes:
+        opcodes (numpy.ndarray): A `uint8` array with the opcode of each instruction, the
+            index of its type in `INSTRUCTION_TYPES`.
+        targets (numpy.ndarray): An `int64` array of the targets of all instructions.
+        target_offsets (numpy.ndarray): An `int64` array of the offset of the targets of each
+            instruction, followed by the number of targets.
+        controls (numpy.ndarray): An `int64` array of the controls of all instructions.
+        control_offsets (numpy.ndarray): The offsets of the controls, like `target_offsets`.
+        parameters (numpy.ndarray): A `float64` array of the parameters of all instructions.
+        parameter_offsets (numpy.ndarray): The offsets of the parameters, like
+            `target_offsets`.
+        extras (dict[int, dict[str, Any]]): The fields without a column of each instruction
+            that has any, by the index of the instruction. Default: {}.
+
+    Examples:
+        >>> packed = PackedInstructions.from_instructions(
+        ...     [H(target=0), CNot(control=0, target=1), Rx(target=1, angle=0.15)]
+        ... )
+        >>> [INSTRUCTION_TYPES[opcode].value for opcode in packed.opcodes]
+        ['h', 'cnot', 'rx']
+        >>> packed.targets, packed.target_offsets
+        (array([0, 1, 1]), array([0, 1, 2, 3]))
+        >>> packed.to_instructions()
+        [H(target=0, type=<Type.h: 'h'>), CNot(...), Rx(...)]
+    """
+
+    opcodes: Any
+    targets: Any
+    target_offsets: Any
+    controls: Any
+    control_offsets: Any
+    parameters: Any
+    parameter_offsets: Any
+    extras: dict[int, dict[str, Any]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self.validate()
+
+    def __len__(self) -> int:
+        return len(self.opcodes)
+
+    @classmethod
+    def from_instructions(cls, instructions: list[Any]) -> PackedInstructions:
+        """
+        Packs and validates instructions, either models or their JSON data, without building
+        a model for each instruction.
+
+        Args:
+            instructions (list[Any]): The instructions, as accepted by the `instructions`
+                field of `Program`.
+
+        Returns:
+            PackedInstructions: The packed instructions.
+
+        Raises:
+            ValueError: If an instruction is not valid.
+        """
+        np = import_numpy()
+        opcodes, targets, controls, parameters, extras = [], [], [], [], {}
+        target_counts, control_counts, parameter_counts = [], [], []
+        for index, instruction in enumerate(instructions):
+            fields = fields_set = instruction
+            if isinstance(instruction, BaseModel):
+                fields, fields_set = instruction.__dict__, instruction.__fields_set__
+            instruction_type = fields.get("type") if type(fields) is dict else None
+            opcode = _opcodes.get(instruction_type) if isinstance(instruction_type, str) else None
+            if opcode is None:
+                raise ValueError(f"Invalid instruction {instruction!r} at index {index}")
+            layout = _layouts[opcode]
+            try:
+                _append_qubits(fields, layout.target, targets, target_counts)
+                _append_qubits(fields, layout.control, controls, control_counts)
+                parameters.extend([fields[name] for name in layout.parameters])
+            except (KeyError, TypeError):
+                raise ValueError(f"Invalid instruction {instruction!r} at index {index}")
+            parameter_counts.append(len(layout.parameters))
+            opcodes.append(opcode)
+            if layout.extras:
+                extra = {name: fields[name] for name in layout.extras if name in fields_set}
+                if extra:
+                    extras[index] = extra
+        try:
+            columns = (
+                np.array(opcodes, dtype=np.uint8),
+                np.array(targets, dtype=np.int64),
+                _offsets(np, target_counts),
+                np.array(controls, dtype=np.int64),
+                _offsets(np, control_counts),
+                np.array(parameters, dtype=np.float64),
+                _offsets(np, parameter_counts),
+            )
+        except (OverflowError, TypeError, ValueError):
+            raise ValueError("instruction qubits must be integers and parameters numbers")
+        return cls(*columns, extras)
+
+    def validate(self) -> None:
+        """
+        Validates the instructions with a vectorized pass over each column. Only instructions
+        with fields without a column or validators that relate their fields, such as unitaries
+        and Pauli channels, are validated one at a time as models.
+
+        Raises:
+            ValueError: If a column is not a 1-D array of its kind of numbers, or an
+                instruction is not valid, naming the first invalid instruction.
+        """
+        np = import_numpy()
+        tables = _tables()
+        for name, kinds in (
+            ("opcodes", "ui"),
+            ("targets", "ui"),
+            ("target_offsets", "ui"),
+            ("controls", "ui"),
+            ("control_offsets", "ui"),
+            ("parameters", "uif"),
+            ("parameter_offsets", "ui"),
+        ):
+            column = getattr(self, name)
+            if not isinstance(column, np.ndarray) or column.dtype.kind not in kinds:
+                raise ValueError(f"{name} must be a numpy array of {_KIND_NAMES[kinds]}")
+        opcodes = self.opcodes
+        if opcodes.ndim != 1 or (
+            len(opcodes) and not 0 <= opcodes.min() <= opcodes.max() < len(INSTRUCTION_TYPES)
+        ):
+            raise ValueError("opcodes must be a 1-D array of indices of instruction types")
+        for name, column, offsets, (minimum, maximum) in (
+            ("targets", self.targets, self.target_offsets, tables.target_counts),
+            ("controls", self.controls, self.control_offsets, tables.control_counts),
+            ("parameters", self.parameters, self.parameter_offsets, tables.parameter_counts),
+        ):
+            if (
+                column.ndim != 1
+                or offsets.shape != (len(opcodes) + 1,)
+                or offsets[0] != 0
+                or offsets[-1] != len(column)
+                or (np.diff(offsets) < 0).any()
+            ):
+                raise ValueError(
+                    f"{name} offsets must be increasing from 0 to the number of {name}"
+                )
+            counts = np.diff(offsets)
+            self._check(
+                (counts >= minimum[opcodes]) & (counts <= maximum[opcodes]),
+                f"has the wrong number of {name}",
+            )
+        self._check(self.targets >= 0, "has a negative target", self.target_offsets)
+        self._check(self.controls >= 0, "has a negative control", self.control_offsets)
+        parameter_counts = np.diff(self.parameter_offsets)
+        parameter_opcodes = np.repeat(opcodes, parameter_counts)
+        slots = np.arange(len(self.parameters)) - np.repeat(
+            self.parameter_offsets[:-1], parameter_counts
+        )
+        lower, lower_exclusive, upper, upper_exclusive = (
+            table[parameter_opcodes, slots] for table in tables.parameter_bounds
+        )
+        parameters = self.parameters
+        self._check(
+            np.where(lower_exclusive, parameters > lower, parameters >= lower)
+            & np.where(upper_exclusive, parameters < upper, parameters <= upper),
+            "has a parameter out of range",
+            self.parameter_offsets,
+        )
+        index = None
+        try:
+            for index in np.flatnonzero(tables.irregular[opcodes]).tolist():
+                self._instruction(index)
+        except ValidationError as e:
+            raise ValueError(f"Invalid instruction at index {index}: {e}")
+
+    def to_instructions(self) -> list[BaseModel]:
+        """
+        Returns:
+            list[BaseModel]: The instruction models, as in the `instructions` of a `Program`.
+        """
+        targets, target_offsets = self.targets.tolist(), self.target_offsets.tolist()
+        controls, control_offsets = self.controls.tolist(), self.control_offsets.tolist()
+        parameters, parameter_offsets = self.parameters.tolist(), self.parameter_offsets.tolist()
+        instructions = []
+        for index, opcode in enumerate(self.opcodes.tolist()):
+            layout = _layouts[opcode]
+            if layout.irregular:
+                instructions.append(self._instruction(index))
+                continue
+            fields = _fields(
+                layout,
+                targets[target_offsets[index] : target_offsets[index + 1]],
+                controls[control_offsets[index] : control_offsets[index + 1]],
+                parameters[parameter_offsets[index] : parameter_offsets[index + 1]],
+            )
+            # The type is set, as in an instruction parsed from JSON
+            instructions.append(
+                layout.instruction_class.construct(
+                    {*fields, "type"}, type=INSTRUCTION_TYPES[opcode], **fields
+                )
+            )
+        return instructions
+
+    def _instruction(self, index: int) -> BaseModel:
+        """Builds and validates the model of one instruction."""
+        layout = _layouts[self.opcodes[index]]
+        fields = _fields(
+            layout,
+            self.targets[self.target_offsets[index] : self.target_offsets[index + 1]].tolist(),
+            self.controls[self.control_offsets[index] : self.control_offsets[index + 1]].tolist(),
+            self.parameters[
+                self.parameter_offsets[index] : self.parameter_offsets[index + 1]
+            ].tolist(),
+        )
+        return layout.instruction_class(
+            type=INSTRUCTION_TYPES[self.opcodes[index]], **fields, **self.extras.get(index, {})
+        )
+
+    def _check(self, valid: Any, message: str, offsets: Any = None) -> None:
+        """
+        Raises an error naming the first invalid instruction, given whether each instruction
+        is valid, or whether each element of a column is valid and the offsets of the column.
+        """
+        if valid.all():
+            return
+        position = int(valid.argmin())
+        index = position if offsets is None else int(offsets.searchsorted(position, "right")) - 1
+        instruction_type = INSTRUCTION_TYPES[self.opcodes[index]].value
+        raise ValueError(f"Instruction {instruction_type} at index {index} {message}")
+
+
+@dataclass(frozen=True)
+class PackedProgram:
+    """
+    A jaqcd `Program` whose instructions and basis rotation instructions are packed into
+    arrays, which uses a small fraction of the memory of the program, and is parsed and
+    validated much faster for programs with many instructions. Requires numpy.
+
+    Converting a program to a packed program and back gives an equal program.
+
+    Attributes:
+        instructions (PackedInstructions): The instructions.
+        results (list[Results] | None): The requested results. Default: None.
+        basis_rotation_instructions (PackedInstructions | None): The basis rotation
+            instructions. Default: None.
+        fields_set (frozenset[str] | None): The fields set in the program, as in its
+            `__fields_set__`, or None for the fields that are not None. Not compared.
+            Default: None.
+
+    Examples:
+        >>> packed = PackedProgram.parse_raw(program_json)
+        >>> len(packed.instructions)
+        1000000
+        >>> packed.to_program() == Program.parse_raw(program_json)
+        True
+    """
+
+    instructions: PackedInstructions
+    results: list[Results] | None = None
+    basis_rotation_instructions: PackedInstructions | None = None
+    fields_set: frozenset[str] | None = field(default=None, compare=False)
+
+    @classmethod
+    def from_program(cls, program: Program) -> PackedProgram:
+        """
+        Args:
+            program (Program): The program.
+
+        Returns:
+            PackedProgram: The packed program.
+        """
+        basis_rotation_instructions = program.basis_rotation_instructions
+        return cls(
+            PackedInstructions.from_instructions(program.instructions),
+            program.results,
+            None
+            if basis_rotation_instructions is None
+            else PackedInstructions.from_instructions(basis_rotation_instructions),
+            frozenset(program.__fields_set__),
+        )
+
+    @classmethod
+    def parse_obj(cls, obj: dict) -> PackedProgram:
+        """
+        Packs and validates the JSON data of a program, without building a model for each
+        instruction.
+
+        Args:
+            obj (dict): The JSON data of a `Program`.
+
+        Returns:
+            PackedProgram: The packed program.
+
+        Raises:
+            ValueError: If the data is not a valid program.
+        """
+        if type(obj) is not dict:
+            raise ValueError("program must be a dict")
+        values = {}
+        for name in ("braketSchemaHeader", "results"):
+            if obj.get(name) is not None:
+                values[name], error = Program.__fields__[name].validate(
+                    obj[name], values, loc=name, cls=Program
+                )
+                if error:
+                    raise ValidationError([error], Program)
+        instructions = obj.get("instructions")
+        basis_rotation_instructions = obj.get("basis_rotation_instructions")
+        if type(instructions) is not list or type(basis_rotation_instructions) not in (
+            list,
+            type(None),
+        ):
+            raise ValueError("instructions and basis_rotation_instructions must be lists")
+        return cls(
+            PackedInstructions.from_instructions(instructions),
+            values.get("results"),
+            None
+            if basis_rotation_instructions is None
+            else PackedInstructions.from_instructions(basis_rotation_instructions),
+            frozenset(Program.__fields__).intersection(obj),
+        )
+
+    @classmethod
+    def parse_raw(cls, json_str: str | bytes) -> PackedProgram:
+        """
+        Args:
+            json_str (str | bytes): The JSON of a `Program`.
+
+        Returns:
+            PackedProgram: The packed program.
+
+        Raises:
+            ValueError: If the JSON is not a valid program.
+        """
+        return cls.parse_obj(json_backend.loads(json_str))
+
+    def to_program(self) -> Program:
+        """
+        Returns:
+            Program: The program, with a model for each instruction.
+        """
+        basis_rotation_instructions = self.basis_rotation_instructions
+        fields_set = self.fields_set
+        if fields_set is None:
+            fields_set = {"instructions"}
+            fields_set.update(
+                name
+                for name in ("results", "basis_rotation_instructions")
+                if getattr(self, name) is not None
+            )
+        return Program.construct(
+            set(fields_set),
+            instructions=self.instructions.to_instructions(),
+            results=self.results,
+            basis_rotation_instructions=None
+            if basis_rotation_instructions is None
+            else basis_rotation_instructions.to_instructions(),
+        )
@@ -0,0 +1,97 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import IO, Any
+
+from pydantic.v1 import ValidationError
+from pydantic.v1.error_wrappers import ErrorWrapper
+from pydantic.v1.errors import MissingError
+from pydantic.v1.utils import ROOT_KEY
+
+from braket.ir.jaqcd.program_v1 import Program
+from braket.schema_common.json_stream import DEFAULT_CHUNK_SIZE, JsonChunkReader
+
+_SECTIONS = ("instructions", "results", "basis_rotation_instructions")
+
+
+def iter_program(file: IO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[tuple[str, Any]]:
+    """
+    Reads a jaqcd program from a file object in chunks, yielding its instructions, results
+    and basis rotation instructions one at a time without building the `Program`.
+
+    Each element is decoded and validated on its own as it is read, in the same way as by
+    `Program`, so memory stays bounded by the chunk size and the size of one element rather
+    than the size of the file. The elements are yielded in the order of the document.
+
+    Args:
+        file (IO): A text or binary file object positioned at the start of the program.
+        chunk_size (int): The number of characters or bytes to read at a time.
+            Default: 1 MiB.
+
+    Yields:
+        tuple[str, Any]: The name of the section, one of `"instructions"`, `"results"` and
+        `"basis_rotation_instructions"`, and the validated element of that section.
+
+    Raises:
+        ValidationError: If the program or an element is not valid. Elements before the
+            invalid one have already been yielded.
+
+    Examples:
+        >>> with open("program.json", "rb") as f:
+        ...     for section, instruction in iter_program(f):
+        ...         if section == "instructions":
+        ...             counts[instruction.type] += 1
+    """
+    reader = JsonChunkReader(file, chunk_size)
+    has_instructions = False
+    try:
+        for key in reader.iter_object():
+            if key in _SECTIONS:
+                has_instructions |= key == "instructions"
+                for item in _read_section(reader, key):
+                    yield key, item
+            elif key in Program.__fields__:
+                _validate(key, reader.decode_value())
+            else:
+                reader.decode_value()
+        reader.end()
+    except ValidationError:
+        raise
+    except ValueError as e:
+        raise ValidationError([ErrorWrapper(e, loc=ROOT_KEY)], Program)
+    if not has_instructions:
+        raise ValidationError([ErrorWrapper(MissingError(), loc="instructions")], Program)
+
+
+def _read_section(reader: JsonChunkReader, name: str) -> Iterator[Any]:
+    if reader.peek() != "[":
+        # Null or not a list
+        yield from _validate(name, reader.decode_value()) or ()
+        return
+    item_field = Program.__fields__[name].sub_fields[0]
+    for index, item in enumerate(reader.iter_array()):
+        item, error = item_field.validate(item, {}, loc=(name, index), cls=Program)
+        if error:
+            raise ValidationError([error], Program)
+        yield item
+
+
+def _validate(name: str, value: Any) -> Any:
+    value, error = Program.__fields__[name].validate(value, {}, loc=name, cls=Program)
+    if error:
+        raise ValidationError([error], Program)
+    return value
@@ -11,9 +11,9 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from pydantic.v1 import BaseModel, Field, validator
+from pydantic.v1 import BaseModel, Field, PrivateAttr, validator
 
 from braket.ir.jaqcd.instructions import (
     CV,
@@ -63,6 +63,7 @@ from braket.ir.jaqcd.instructions import (
     Y,
     Z,
 )
+from braket.ir.jaqcd.interning import intern_instruction
 from braket.ir.jaqcd.results import (
     AdjointGradient,
     Amplitude,
@@ -74,6 +75,11 @@ from braket.ir.jaqcd.results import (
     Variance,
 )
 from braket.schema_common import BraketSchemaBase, BraketSchemaHeader
+from braket.schema_common.content_hash import ContentHashMixin
+from braket.schema_common.trusted_construction import skip_when_trusted
+
+if TYPE_CHECKING:
+    from braket.ir.jaqcd.circuit_stats import CircuitStats
 
 """
 The pydantic validator requires a constant lookup function. A plain Union[] results
@@ -134,6 +140,21 @@ _valid_compiler_directives = {
     EndVerbatimBox.Type.end_verbatim_box: EndVerbatimBox,
 }
 
+# A single lookup resolves an instruction type to its model, for every kind of instruction
+_valid_instructions = {**_valid_gates, **_valid_noise_channels, **_valid_compiler_directives}
+_instruction_classes = frozenset(_valid_instructions.values())
+
+_valid_result_types = {
+    Amplitude.Type.amplitude: Amplitude,
+    Expectation.Type.expectation: Expectation,
+    Probability.Type.probability: Probability,
+    Sample.Type.sample: Sample,
+    StateVector.Type.statevector: StateVector,
+    DensityMatrix.Type.densitymatrix: DensityMatrix,
+    Variance.Type.variance: Variance,
+    AdjointGradient.Type.adjoint_gradient: AdjointGradient,
+}
+
 Results = (
     Amplitude
     | Expectation
@@ -146,7 +167,34 @@ Results = (
 )
 
 
-class Program(BraketSchemaBase):
+def _instruction_class(value: dict) -> type[BaseModel] | None:
+    instruction_type = value.get("type")
+    if not isinstance(instruction_type, str):
+        return None
+    return _valid_instructions.get(instruction_type)
+
+
+def parse_result(value: Any) -> Any:
+    """
+    Resolves a requested result with a single lookup on its `type`, instead of validating
+    it against each member of `Results` in turn. Use it from a `pre=True` validator of a
+    model whose Config sets `smart_union = True`.
+
+    Args:
+        value (Any): The result to resolve.
+
+    Returns:
+        Any: The result object for the `type` in `value`, or `value` unchanged if it does
+        not name a result type, in which case pydantic validates it against `Results`.
+    """
+    if isinstance(value, dict):
+        result_type = value.get("type")
+        if isinstance(result_type, str) and result_type in _valid_result_types:
+            return _valid_result_types[result_type](**value)
+    return value
+
+
+class Program(ContentHashMixin, BraketSchemaBase):
     """
     Root object of the JsonAwsQuantumCircuitDescription IR.
 
@@ -221,31 +269,56 @@ class Program(BraketSchemaBase):
     results: list[Results] | None
     basis_rotation_instructions: list[Any] | None
 
+    _circuit_stats: Any = PrivateAttr(default=None)
+
+    class Config:
+        smart_union = True
+
+    def circuit_stats(self) -> "CircuitStats":
+        """
+        Returns:
+            CircuitStats: The qubits, instruction counts, verbatim boxes and depth of the
+            program, computed in one pass over its instructions, basis rotation instructions
+            and results. They are computed on the first call and cached, so they do not
+            reflect changes made to the program afterwards.
+        """
+        if self._circuit_stats is None:
+            # Imported here because circuit_stats imports the dispatch tables of this module
+            from braket.ir.jaqcd.circuit_stats import compute_circuit_stats
+
+            self._circuit_stats = compute_circuit_stats(self)
+        return self._circuit_stats
+
     @validator("instructions", "basis_rotation_instructions", each_item=True, pre=True)
+    @skip_when_trusted(resolve=_instruction_class)
     def validate_instructions(cls, value, field):
         """
         Pydantic uses the validation subsystem to create objects. This custom validator has
         2 purposes:
         1. Implement O(1) deserialization
         2. Validate that the input instructions are supported
+        Instructions without parameters are interned if `set_instruction_interning` is on.
         """
+        if type(value) in _instruction_classes:
+            return value
         if isinstance(value, BaseModel):
-            if (
-                (value.type not in _valid_gates)
-                and (value.type not in _valid_noise_channels)
-                and (value.type not in _valid_compiler_directives)
-            ):
+            if getattr(value, "type", None) not in _valid_instructions:
                 raise ValueError(f"Invalid value.type specified: {value} for field: {field}")
             return value
 
         if value is not None and "type" in value:
-            if value["type"] in _valid_gates:
-                return _valid_gates[value["type"]](**value)
-            elif value["type"] in _valid_noise_channels:
-                return _valid_noise_channels[value["type"]](**value)
-            elif value["type"] in _valid_compiler_directives:
-                return _valid_compiler_directives[value["type"]](**value)
-            else:
+            instruction_class = _valid_instructions.get(value["type"])
+            if instruction_class is None:
                 raise ValueError(f"Invalid instruction specified: {value} for field: {field}")
+            return intern_instruction(instruction_class, value)
         else:
             raise ValueError(f"Invalid type or value specified: {value} for field: {field}")
+
+    @validator("results", each_item=True, pre=True)
+    @skip_when_trusted()
+    def validate_results(cls, value):
+        """
+        Resolves each requested result with a lookup on its `type`, in the same way
+        instructions are dispatched, so only the matching result model is validated.
+        """
+        return parse_result(value)
@@ -15,10 +15,12 @@ from pydantic.v1 import Field, conlist, validator
 
 from braket.ir.openqasm.program_v1 import Program
 from braket.schema_common import BraketSchemaHeader
+from braket.schema_common.content_hash import ContentHashMixin
 from braket.schema_common.schema_base import BraketSchemaBase
+from braket.schema_common.trusted_construction import skip_when_trusted
 
 
-class ProgramSet(BraketSchemaBase):
+class ProgramSet(ContentHashMixin, BraketSchemaBase):
     """
     OpenQASM Program Set.
 
@@ -75,6 +77,7 @@ class ProgramSet(BraketSchemaBase):
         return input_lengths.pop()
 
     @validator("programs", each_item=True)
+    @skip_when_trusted()
     def validate_program_inputs(cls, program) -> Program:
         """
         Validates program input lists for uniform length and type.
@@ -14,6 +14,7 @@
 from pydantic.v1 import Field, confloat, constr
 
 from braket.schema_common import BraketSchemaBase, BraketSchemaHeader
+from braket.schema_common.content_hash import ContentHashMixin
 
 # support 1d array input for now
 leaf_io_type = (
@@ -24,7 +25,7 @@ leaf_io_type = (
 io_type = leaf_io_type | list[leaf_io_type]
 
 
-class Program(BraketSchemaBase):
+class Program(ContentHashMixin, BraketSchemaBase):
     """
     Root object of the OpenQASM IR.
 
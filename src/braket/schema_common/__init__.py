@@ -11,5 +11,27 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License
 
+from typing import TYPE_CHECKING
+
+from braket.schema_common._lazy_exports import lazy_exports
+
+# Imported eagerly, as a lazy content_hash export would be shadowed by the submodule of the
+# same name once the submodule is imported
+from braket.schema_common.content_hash import ContentHashMixin, content_hash  # noqa: F401
 from braket.schema_common.schema_base import BraketSchemaBase  # noqa: F401
 from braket.schema_common.schema_header import BraketSchemaHeader  # noqa: F401
+
+# For type checkers only; at runtime each export is imported on first access
+if TYPE_CHECKING:
+    from braket.schema_common.json_backend import (  # noqa: F401
+        get_json_backend,
+        set_json_backend,
+    )
+
+__getattr__, __dir__, _ = lazy_exports(
+    __name__,
+    {
+        "get_json_backend": "json_backend",
+        "set_json_backend": "json_backend",
+    },
+)
@@ -0,0 +1,74 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License
+
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable
+from importlib import import_module
+
+
+def lazy_exports(
+    package_name: str, exports: dict[str, str | tuple[str, str]]
+) -> tuple[Callable[[str], object], Callable[[], list[str]], list[str]]:
+    """
+    Builds the module-level `__getattr__` and `__dir__` (PEP 562) of a package that imports
+    the submodule of each export the first time the export is accessed, so that the models
+    of a package are only built when they are used. Other names are imported as submodules
+    of the package, if they exist.
+
+    Args:
+        package_name (str): The `__name__` of the package.
+        exports (dict[str, str | tuple[str, str]]): Maps each exported name to the submodule
+            that defines it, relative to the package, or to a tuple of the submodule and the
+            name of the attribute in it, for exports that are aliases.
+
+    Returns:
+        tuple[Callable[[str], object], Callable[[], list[str]], list[str]]: The `__getattr__`,
+        `__dir__` and `__all__` of the package.
+
+    Examples:
+        >>> __getattr__, __dir__, __all__ = lazy_exports(
+        ...     __name__, {"TaskMetadata": "task_metadata_v1"}
+        ... )
+    """
+
+    def __getattr__(name: str) -> object:
+        target = exports.get(name)
+        if target is None:
+            # Submodules are bound on the package when they are imported, as by eager imports
+            return _import_submodule(package_name, name)
+        module_name, attribute = (target, name) if isinstance(target, str) else target
+        value = getattr(import_module(f".{module_name}", package_name), attribute)
+        # Later lookups find the export in the package and no longer reach __getattr__
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(vars(sys.modules[package_name]).keys() | exports.keys())
+
+    return __getattr__, __dir__, sorted(exports)
+
+
+def _import_submodule(package_name: str, name: str) -> object:
+    error = AttributeError(f"module {package_name!r} has no attribute {name!r}")
+    if name.startswith("__"):
+        raise error
+    module_name = f"{package_name}.{name}"
+    try:
+        return import_module(module_name)
+    except ModuleNotFoundError as e:
+        if e.name != module_name:
+            raise
+        raise error from None
@@ -0,0 +1,33 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License
+
+
+def import_numpy():
+    """
+    Imports numpy, which is an optional dependency of this package used by the array-backed
+    representations of schemas.
+
+    Returns:
+        Module of numpy
+
+    Raises:
+        ImportError: If numpy is not installed
+    """
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "Amazon Braket could not import numpy, which is required for array-backed schemas. "
+            "To continue, install amazon-braket-schemas[numpy]."
+        ) from e
+    return numpy
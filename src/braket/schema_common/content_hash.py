@@ -0,0 +1,172 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+from __future__ import annotations
+
+import hashlib
+import math
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+
+from pydantic.v1 import BaseModel, PrivateAttr
+
+# The number of encoded bytes buffered before they are written to the hash
+_CHUNK_SIZE = 1 << 16
+# The encoded aliases and names of the fields of each model class, sorted by alias
+_field_orders: dict[type[BaseModel], list[tuple[bytes, str]]] = {}
+
+
+def content_hash(value: Any) -> str:
+    """
+    Computes a canonical content hash of a schema object, to use as the key of a cache such
+    as a compile cache.
+
+    The hash is the SHA-256 hex digest of a canonical binary encoding of the data, which is
+    written to the hash in chunks as the data is walked, without serializing it to JSON:
+
+    * None, True and False are `N`, `T` and `F`.
+    * A number is `D`, its canonical decimal form and `;`. An integral number is written as
+      an integer and any other number as its shortest round-tripping decimal, normalized;
+      so `1`, `1.0`, `1e0` and `Decimal("1.00")` are all `D1;`. Non-finite numbers are
+      `nan`, `inf` and `-inf`, whether floats or Decimals.
+    * A string is `S`, the length of its UTF-8 encoding, `:` and the encoding. Enums are
+      written as their values.
+    * A list or tuple is `L`, its length, `:` and its items.
+    * A dict or model is `M`, its number of entries, `:` and its entries sorted by the
+      UTF-8 encodings of their keys, each the key as a string, or the value of an Enum
+      key, followed by the value. A model's entries are its fields by alias, leaving out
+      fields whose value is None, so adding an optional field to a schema does not change
+      the hashes of existing objects.
+
+    This encoding is stable across releases: equal data has the same hash in every version
+    of this package, regardless of dict ordering or number formatting.
+
+    Args:
+        value (Any): A model, or data made of dicts, lists, strings, numbers and None.
+
+    Returns:
+        str: The SHA-256 hex digest of the canonical encoding of the value.
+
+    Raises:
+        TypeError: If the value contains an object of another type.
+
+    Examples:
+        >>> content_hash({"b": 1.0, "a": [None]}) == content_hash({"a": [None], "b": 1})
+        True
+    """
+    hasher = hashlib.sha256()
+    buffer = bytearray()
+
+    def write(value: Any) -> None:
+        value_type = type(value)
+        if value_type is str:
+            data = value.encode()
+            buffer.extend(b"S%d:" % len(data))
+            buffer.extend(data)
+        elif value_type is int or value_type is float or value_type is Decimal:
+            buffer.extend(b"D%s;" % _canonical_number(value).encode())
+        elif isinstance(value, (list, tuple)):
+            buffer.extend(b"L%d:" % len(value))
+            for item in value:
+                write(item)
+                if len(buffer) > _CHUNK_SIZE:
+                    hasher.update(buffer)
+                    buffer.clear()
+        elif value is None:
+            buffer.extend(b"N")
+        elif value_type is bool:
+            buffer.extend(b"T" if value else b"F")
+        elif isinstance(value, Enum):
+            write(value.value)
+        elif isinstance(value, BaseModel):
+            entries = value.__dict__
+            order = _field_orders.get(value_type)
+            if order is None:
+                order = _field_orders[value_type] = sorted(
+                    (field.alias.encode(), name) for name, field in value.__fields__.items()
+                )
+            if len(entries) != len(order):
+                # Extra fields
+                fields = value.__fields__
+                write_entries(
+                    (fields[name].alias if name in fields else name, entry)
+                    for name, entry in entries.items()
+                    if entry is not None
+                )
+                return
+            present = [(key, entries[name]) for key, name in order if entries[name] is not None]
+            buffer.extend(b"M%d:" % len(present))
+            for key, entry in present:
+                buffer.extend(b"S%d:" % len(key))
+                buffer.extend(key)
+                write(entry)
+        elif isinstance(value, dict):
+            write_entries(value.items())
+        elif isinstance(value, str):
+            write(str(value))
+        else:
+            raise TypeError(f"cannot hash a value of type {value_type.__name__}")
+
+    def write_entries(entries: Any) -> None:
+        entries = sorted(
+            (str(key.value if isinstance(key, Enum) else key).encode(), entry)
+            for key, entry in entries
+        )
+        buffer.extend(b"M%d:" % len(entries))
+        for key, entry in entries:
+            buffer.extend(b"S%d:" % len(key))
+            buffer.extend(key)
+            write(entry)
+
+    write(value)
+    hasher.update(buffer)
+    return hasher.hexdigest()
+
+
+def _canonical_number(value: float | Decimal) -> str:
+    if type(value) is int:
+        return str(value)
+    if type(value) is float:
+        if not math.isfinite(value):
+            return repr(value)
+        if value.is_integer():
+            return str(int(value))
+        value = Decimal(repr(value))
+    elif not value.is_finite():
+        # Written as for floats, from which signaling NaNs cannot be converted
+        return "nan" if value.is_nan() else repr(float(value))
+    elif value == value.to_integral_value():
+        return str(int(value))
+    return str(value.normalize())
+
+
+class ContentHashMixin(BaseModel):
+    """
+    Adds a canonical content hash to a schema, see `content_hash`.
+    """
+
+    _content_hash: str | None = PrivateAttr(default=None)
+
+    def content_hash(self) -> str:
+        """
+        Returns:
+            str: The SHA-256 hex digest of the canonical encoding of the object, which is
+            the same for equal objects regardless of dict ordering and number formatting,
+            and stable across releases. It is computed on the first call and cached, so it
+            does not reflect changes made to the object afterwards.
+        """
+        if self._content_hash is None:
+            self._content_hash = content_hash(self)
+        return self._content_hash
@@ -0,0 +1,139 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License
+
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from importlib import import_module
+from importlib.util import find_spec
+from typing import Any
+
+JSON_BACKENDS = ("orjson", "msgspec", "json")
+
+_backend = "json"
+_loads: Callable[[str | bytes], Any] = json.loads
+_dumps: Callable[..., str] = json.dumps
+
+
+def set_json_backend(name: str = "auto") -> str:
+    """
+    Sets the JSON codec used to parse and serialize all `BraketSchemaBase` models, including
+    the custom `json_loads` and `json_dumps` hooks of individual schemas.
+
+    The fast codecs are optional dependencies. Their output is compact and not ASCII-escaped,
+    and non-finite floats are written as `null`. Documents they reject, and `json()` keyword
+    arguments they do not support, are handled by the standard library, so parsing accepts
+    and rejects the same documents with every backend.
+
+    Args:
+        name (str): One of "orjson", "msgspec" or "json" for the standard library, or "auto"
+            for the fastest one that is installed. Default: "auto".
+
+    Returns:
+        str: The name of the backend in use.
+
+    Raises:
+        ValueError: If the backend name is not known.
+        ImportError: If the backend is not installed.
+
+    Examples:
+        >>> set_json_backend("orjson")
+        'orjson'
+        >>> GateModelTaskResult.parse_raw(result_json)
+    """
+    global _backend, _loads, _dumps
+    if name == "auto":
+        name = next(backend for backend in JSON_BACKENDS if find_spec(backend) is not None)
+    if name not in JSON_BACKENDS:
+        raise ValueError(f"Unknown JSON backend {name}; must be one of {JSON_BACKENDS} or auto")
+    if name == "json":
+        _backend, _loads, _dumps = name, json.loads, json.dumps
+        return name
+    try:
+        module = import_module(name)
+    except ImportError as e:
+        raise ImportError(
+            f"Amazon Braket could not import {name}. "
+            f"To use it as the JSON backend, install amazon-braket-schemas[{name}]."
+        ) from e
+    codecs = _orjson_codecs if name == "orjson" else _msgspec_codecs
+    _loads, _dumps = codecs(module)
+    _backend = name
+    return name
+
+
+def get_json_backend() -> str:
+    """
+    Returns:
+        str: The name of the JSON backend in use.
+    """
+    return _backend
+
+
+def loads(serialized: str | bytes) -> Any:
+    """
+    JSON loads with the backend set by `set_json_backend`; the `json_loads` of all schemas.
+    """
+    return _loads(serialized)
+
+
+def dumps(payload: Any, **kwargs) -> str:
+    """
+    JSON dumps with the backend set by `set_json_backend`; the `json_dumps` of all schemas.
+    """
+    return _dumps(payload, **kwargs)
+
+
+def _orjson_codecs(orjson) -> tuple[Callable, Callable]:
+    def orjson_loads(serialized):
+        try:
+            return orjson.loads(serialized)
+        except orjson.JSONDecodeError:
+            return json.loads(serialized)
+
+    def orjson_dumps(payload, *, default=None, indent=None, sort_keys=False, **kwargs):
+        if kwargs or indent not in (None, 2):
+            return json.dumps(
+                payload, default=default, indent=indent, sort_keys=sort_keys, **kwargs
+            )
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(payload, default=default, option=option).decode()
+        except orjson.JSONEncodeError:
+            return json.dumps(payload, default=default, indent=indent, sort_keys=sort_keys)
+
+    return orjson_loads, orjson_dumps
+
+
+def _msgspec_codecs(msgspec) -> tuple[Callable, Callable]:
+    def msgspec_loads(serialized):
+        try:
+            return msgspec.json.decode(serialized)
+        except msgspec.DecodeError:
+            return json.loads(serialized)
+
+    def msgspec_dumps(payload, *, default=None, **kwargs):
+        if kwargs:
+            return json.dumps(payload, default=default, **kwargs)
+        try:
+            return msgspec.json.encode(payload, enc_hook=default).decode()
+        except (msgspec.EncodeError, TypeError):
+            return json.dumps(payload, default=default)
+
+    return msgspec_loads, msgspec_dumps
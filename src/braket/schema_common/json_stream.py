@@ -0,0 +1,192 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License
+
+
+from __future__ import annotations
+
+import codecs
+import json
+from collections.abc import Iterator
+from typing import IO, Any
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# A decode error this close to the end of the buffer may be caused by a token cut off at the
+# chunk boundary rather than by invalid JSON
+_LOOKAHEAD = 64
+_WHITESPACE = " \t\n\r"
+
+
+class JsonChunkReader:
+    """
+    Reads a JSON document from a file object in chunks, one value at a time.
+
+    The structure of the outer containers is walked with `iter_object` and `iter_array`, while
+    the values inside them are decoded whole with `decode_value`. Only the value being decoded
+    and the current chunk are held in memory, so a document with a very large array can be
+    read element by element.
+
+    Args:
+        file (IO): A text or binary file object; binary files are decoded as UTF-8.
+        chunk_size (int): The number of characters or bytes to read at a time.
+            Default: 1 MiB.
+
+    Examples:
+        >>> reader = JsonChunkReader(io.StringIO('{"a": [1, 2], "b": {"c": 3}}'))
+        >>> for key in reader.iter_object():
+        ...     if key == "a":
+        ...         print(list(reader.iter_array()))
+        ...     else:
+        ...         print(reader.decode_value())
+        [1, 2]
+        {'c': 3}
+    """
+
+    def __init__(self, file: IO, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _read(self, size: int) -> bool:
+        if self._eof:
+            return False
+        chunk = self._file.read(size)
+        if isinstance(chunk, bytes):
+            chunk = self._text_decoder.decode(chunk, final=not chunk)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buffer, self._pos)
+
+    def peek(self) -> str:
+        """
+        Skips whitespace and returns the next character without consuming it.
+
+        Returns:
+            str: The next character, or "" at the end of the document.
+        """
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer) or not self._read(self._chunk_size):
+                return self._buffer[self._pos : self._pos + 1]
+
+    def expect(self, characters: str) -> str:
+        """
+        Consumes the next character, which must be one of `characters`.
+
+        Args:
+            characters (str): The allowed characters.
+
+        Returns:
+            str: The consumed character.
+
+        Raises:
+            JSONDecodeError: If the next character is not allowed.
+        """
+        character = self.peek()
+        if not character or character not in characters:
+            raise self._error(f"Expecting one of {characters!r}")
+        self._pos += 1
+        return character
+
+    def decode_value(self) -> Any:
+        """
+        Decodes the next value whole, reading more chunks until it is complete.
+
+        Returns:
+            Any: The decoded value.
+
+        Raises:
+            JSONDecodeError: If the value is not valid JSON.
+        """
+        if not self.peek():
+            raise self._error("Expecting value")
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                # A number at the end of the buffer may continue in the next chunk
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError as e:
+                incomplete = e.pos >= len(self._buffer) - _LOOKAHEAD or e.msg.startswith(
+                    "Unterminated string"
+                )
+                if self._eof or not incomplete:
+                    raise
+            # Grow the read size with the value so that decoding it stays linear
+            self._read(max(self._chunk_size, len(self._buffer) - self._pos))
+
+    def iter_object(self) -> Iterator[str]:
+        """
+        Walks the members of the next value, which must be an object. The value of each key
+        must be consumed with `decode_value`, `iter_object` or `iter_array` before the next
+        key is requested.
+
+        Yields:
+            str: The key of each member.
+
+        Raises:
+            JSONDecodeError: If the value is not a valid object.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            if self.peek() != '"':
+                raise self._error("Expecting property name enclosed in double quotes")
+            key = self.decode_value()
+            self.expect(":")
+            yield key
+            if self.expect(",}") == "}":
+                return
+
+    def iter_array(self) -> Iterator[Any]:
+        """
+        Decodes the elements of the next value, which must be an array, one at a time.
+
+        Yields:
+            Any: Each decoded element.
+
+        Raises:
+            JSONDecodeError: If the value is not a valid array.
+        """
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.decode_value()
+            if self.expect(",]") == "]":
+                return
+
+    def end(self) -> None:
+        """
+        Checks that nothing but whitespace follows the last value.
+
+        Raises:
+            JSONDecodeError: If there is extra data.
+        """
+        if self.peek():
+            raise self._error("Extra data")
@@ -15,21 +15,37 @@ from __future__ import annotations
 
 import re
 
-from pydantic.v1 import BaseModel
+from pydantic.v1 import BaseModel, ValidationError
+from pydantic.v1.error_wrappers import ErrorWrapper
+from pydantic.v1.parse import load_str_bytes
+from pydantic.v1.utils import ROOT_KEY
 
+from braket.schema_common import json_backend
 from braket.schema_common.schema_header import BraketSchemaHeader
+from braket.schema_common.trusted_construction import construct_trusted
+
+# Maps (header name, header version) to the schema class that parses it. Entries are added
+# explicitly through BraketSchemaBase.register_schema or lazily the first time a header is
+# resolved through its module, so repeated dispatch is a single dict lookup.
+_schema_registry: dict[tuple[str, str], type[BraketSchemaBase]] = {}
 
 
 class BraketSchemaBase(BaseModel):
     """
     BraketSchemaBase which includes the schema header and should be the parent class for all schemas
 
+    JSON is parsed and serialized with the backend set by `set_json_backend`.
+
     Attributes:
         braketSchemaHeader (BraketSchemaHeader): Schema header
     """
 
     braketSchemaHeader: BraketSchemaHeader
 
+    class Config:
+        json_loads = json_backend.loads
+        json_dumps = json_backend.dumps
+
     @staticmethod
     def import_schema_module(schema: BraketSchemaBase):
         """
@@ -53,22 +69,98 @@ class BraketSchemaBase(BaseModel):
         return schema.braketSchemaHeader.import_schema_module()
 
     @staticmethod
-    def parse_raw_schema(json_str: str) -> BraketSchemaBase:
+    def parse_raw_schema(json_str: str, trusted: bool = False) -> BraketSchemaBase:
         """
         Return schema object given JSON string
 
+        The JSON string is decoded once; the header is read from the decoded object and the
+        same object is handed to the schema class. Only schemas that define their own
+        `json_loads` are given the raw string again, since their decoder may transform it.
+
         Args:
              json_str (str): The JSON string of the schema
+             trusted (bool): Whether the JSON comes from a trusted source that has already
+                validated it, such as the service. If so, the schema object is built with
+                `construct_trusted`, which skips field validation. Default: False.
 
         Returns:
             BraketSchemaBase: The schema object. This can also be an
             instance of a subclass of BraketSchemaBase.
         """
-        schema = BraketSchemaBase.parse_raw(json_str)
-        module = BraketSchemaBase.import_schema_module(schema)
-        name = schema.braketSchemaHeader.name
-        schema_class = BraketSchemaBase.get_schema_class(module, name)
-        return schema_class.parse_raw(json_str)
+        json_loads = BraketSchemaBase.__config__.json_loads
+        try:
+            obj = load_str_bytes(json_str, json_loads=json_loads)
+        except (ValueError, TypeError, UnicodeDecodeError) as e:
+            raise ValidationError([ErrorWrapper(e, loc=ROOT_KEY)], BraketSchemaBase)
+        schema = BraketSchemaBase.parse_obj(obj)
+        schema_class = BraketSchemaBase.get_registered_schema_class(schema.braketSchemaHeader)
+        if schema_class.__config__.json_loads is not json_loads:
+            if not trusted:
+                return schema_class.parse_raw(json_str)
+            obj = load_str_bytes(json_str, json_loads=schema_class.__config__.json_loads)
+        if trusted:
+            return construct_trusted(schema_class, obj)
+        return schema_class.parse_obj(obj)
+
+    @staticmethod
+    def register_schema(
+        schema_class: type[BraketSchemaBase], header: BraketSchemaHeader | None = None
+    ) -> type[BraketSchemaBase]:
+        """
+        Registers a schema class so that `parse_raw_schema` dispatches to it by header.
+        This allows schemas defined outside of this package to be parsed through
+        `parse_raw_schema`.
+
+        Args:
+            schema_class (type[BraketSchemaBase]): The schema class to register.
+            header (BraketSchemaHeader | None): The header to register the class under.
+                Default: the default value of the class's `braketSchemaHeader` field.
+
+        Returns:
+            type[BraketSchemaBase]: The registered schema class, so this can be used
+            as a class decorator.
+
+        Raises:
+            ValueError: If no header is given and the class has no default header.
+
+        Examples:
+            >> @BraketSchemaBase.register_schema
+            >> class MyResult(BraketSchemaBase):
+            >>     braketSchemaHeader: BraketSchemaHeader = Field(default=_HEADER, const=_HEADER)
+        """
+        header = header or schema_class.__fields__["braketSchemaHeader"].default
+        if header is None:
+            raise ValueError(f"Schema class {schema_class.__name__} has no default header")
+        _schema_registry[(header.name, header.version)] = schema_class
+        return schema_class
+
+    @staticmethod
+    def get_registered_schema_class(header: BraketSchemaHeader) -> type[BraketSchemaBase]:
+        """
+        Returns the schema class for the given header. Headers that have not been registered
+        are resolved by importing the schema module once, after which the class is cached in
+        the registry.
+
+        Args:
+            header (BraketSchemaHeader): The schema header
+
+        Returns:
+            type[BraketSchemaBase]: The schema class that parses the header's schema
+
+        Raises:
+            ModuleNotFoundError: If the header is not registered and its schema module
+                cannot be found
+        """
+        key = (header.name, header.version)
+        schema_class = _schema_registry.get(key)
+        if schema_class is None:
+            module = header.import_schema_module()
+            # Importing the module may have registered its schema
+            schema_class = _schema_registry.get(key) or BraketSchemaBase.get_schema_class(
+                module, header.name
+            )
+            _schema_registry[key] = schema_class
+        return schema_class
 
     @staticmethod
     def get_schema_class(module, name):
@@ -0,0 +1,62 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License
+
+
+from __future__ import annotations
+
+from typing import Any
+
+from braket.schema_common.schema_base import BraketSchemaBase
+
+
+class SchemaDispatcher:
+    """
+    Resolves a value of a union of schema classes with a single lookup on the name in its
+    `braketSchemaHeader`, instead of validating it against each member of the union in turn.
+
+    Use it from a `pre=True` validator of a model whose Config sets `smart_union = True`, so
+    that pydantic accepts the resolved instance without trying the other union members.
+    Values that cannot be resolved, such as dicts without a header, are returned unchanged
+    and pydantic falls back to validating them against the union.
+
+    Examples:
+        >>> dispatch = SchemaDispatcher(JaqcdProgram, OpenQASMProgram)
+        >>> dispatch({"braketSchemaHeader": {"name": "braket.ir.openqasm.program",
+        ...     "version": "1"}, "source": "OPENQASM 3.0;"})
+        Program(braketSchemaHeader=..., source='OPENQASM 3.0;', inputs=None)
+    """
+
+    def __init__(self, *schema_classes: type[BraketSchemaBase]):
+        self._schema_classes = {
+            schema_class.__fields__["braketSchemaHeader"].default.name: schema_class
+            for schema_class in schema_classes
+        }
+
+    def __call__(self, value: Any) -> Any:
+        """
+        Args:
+            value (Any): The value to resolve.
+
+        Returns:
+            Any: The schema object for the header in `value`, or `value` unchanged if
+            it does not name one of the dispatcher's schemas.
+
+        Raises:
+            ValidationError: If `value` names one of the schemas but is not valid for it.
+        """
+        if not isinstance(value, dict):
+            return value
+        header = value.get("braketSchemaHeader")
+        name = header.get("name") if isinstance(header, dict) else getattr(header, "name", None)
+        schema_class = self._schema_classes.get(name) if isinstance(name, str) else None
+        return value if schema_class is None else schema_class.parse_obj(value)
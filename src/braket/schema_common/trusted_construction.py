@@ -0,0 +1,410 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License
+
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+
+from pydantic.v1 import BaseModel, Extra, StrictBool, ValidationError
+from pydantic.v1.fields import SHAPE_DICT, SHAPE_LIST, SHAPE_MAPPING, SHAPE_SINGLETON, ModelField
+from pydantic.v1.types import ConstrainedList
+
+# Converts a raw value of a field, given the values of the fields before it; None means the
+# raw value is used as is
+Converter = Callable[[Any, dict], Any] | None
+
+_NoneType = type(None)
+_UNMARKED = object()
+# The item count checks that `conlist` adds as class validators
+_CONSTRAINT_VALIDATORS = {
+    ConstrainedList.list_length_validator.__func__,
+    ConstrainedList.unique_items_validator.__func__,
+}
+_constructors: dict[type[BaseModel], _ModelConstructor] = {}
+
+
+def skip_when_trusted(
+    resolve: Callable[[Any], type[BaseModel] | None] | None = None,
+    decode: Callable[[Any], Any] | None = None,
+):
+    """
+    Marks a validator that only checks or dispatches values, so that trusted construction can
+    skip it. Fields with unmarked validators are validated in full even in trusted construction.
+
+    Args:
+        resolve (Callable[[Any], type[BaseModel] | None] | None): For a validator that
+            dispatches the raw values of a field typed as `Any` to models, returns the model
+            class of a raw value, or None if it has none. Default: None.
+        decode (Callable[[Any], Any] | None): For a validator that also decodes an
+            alternative encoding of a field, decodes a raw value, returning other values
+            unchanged. It is applied before the value is constructed. Default: None.
+
+    Returns:
+        Callable: A decorator for the validator function, to apply under `@validator`.
+
+    Examples:
+        >>> @validator("instructions", each_item=True, pre=True)
+        ... @skip_when_trusted(resolve=instruction_class)
+        ... def validate_instructions(cls, value): ...
+    """
+
+    def mark(func: Callable) -> Callable:
+        func.__trusted_resolve__ = resolve
+        func.__trusted_decode__ = decode
+        return func
+
+    return mark
+
+
+def construct_trusted(model_class: type[BaseModel], obj: Any) -> BaseModel:
+    """
+    Builds a model from data that has already been validated, such as results and device
+    capabilities produced by the service, without running field validation.
+
+    Nested models, unions and dispatched fields are resolved recursively to the same classes
+    as in validation: union members by their schema header name or `type` discriminator, and
+    `Any` fields through the resolver of their dispatch validator. Enums, numbers in float
+    fields and integer dict keys are converted, so the model behaves as a validated one. All
+    constraints and root validators are skipped. Fields whose validators are not marked with
+    `skip_when_trusted`, and values that can not be resolved, are validated as usual.
+
+    Args:
+        model_class (type[BaseModel]): The model to construct.
+        obj (Any): The decoded data.
+
+    Returns:
+        BaseModel: The constructed model.
+
+    Raises:
+        ValidationError: If a required field is missing, or a value that is validated as usual
+            is not valid. Other invalid data is not detected.
+    """
+    if type(obj) is not dict:
+        return model_class.parse_obj(obj)
+    return _constructor(model_class)(obj)
+
+
+def _constructor(model_class: type[BaseModel]) -> _ModelConstructor:
+    constructor = _constructors.get(model_class)
+    if constructor is None:
+        constructor = _constructors[model_class] = _ModelConstructor(model_class)
+    return constructor
+
+
+class _ModelConstructor:
+    def __init__(self, model_class: type[BaseModel]):
+        self._model_class = model_class
+        # Built on first use, so that recursive models do not recurse here
+        self._plan = None
+
+    def __call__(self, obj: dict) -> BaseModel:
+        if self._plan is None:
+            self._plan = [
+                (name, field.alias, field, _field_converter(field, self._model_class))
+                for name, field in self._model_class.__fields__.items()
+            ]
+        values = {}
+        fields_set = set()
+        for name, alias, field, convert in self._plan:
+            if alias in obj:
+                value = obj[alias]
+                values[name] = value if convert is None else convert(value, values)
+                fields_set.add(name)
+            elif field.required:
+                # Let validation report the missing field
+                return self._model_class.parse_obj(obj)
+            else:
+                values[name] = field.get_default()
+        if self._model_class.__config__.extra is Extra.allow:
+            for key in obj.keys() - {alias for _, alias, _, _ in self._plan}:
+                values[key] = obj[key]
+        return self._model_class.construct(fields_set, **values)
+
+
+def _validate(field: ModelField, value: Any, values: dict, model_class: type[BaseModel]) -> Any:
+    value, error = field.validate(value, values, loc=field.alias, cls=model_class)
+    if error:
+        raise ValidationError([error], model_class)
+    return value
+
+
+def _validating_converter(field: ModelField, model_class: type[BaseModel]) -> Converter:
+    def convert(value, values):
+        return _validate(field, value, values, model_class)
+
+    return convert
+
+
+def _field_converter(field: ModelField, model_class: type[BaseModel]) -> Converter:
+    marks = [
+        getattr(validator.func, "__trusted_resolve__", _UNMARKED)
+        for validator in (field.class_validators or {}).values()
+        if getattr(validator.func, "__func__", None) not in _CONSTRAINT_VALIDATORS
+    ]
+    if _UNMARKED in marks:
+        return _validating_converter(field, model_class)
+    resolve = next((mark for mark in marks if mark is not None), None)
+    convert = _converter(field, model_class, resolve, top_level=True)
+    decode = next(
+        (
+            validator.func.__trusted_decode__
+            for validator in field.class_validators.values()
+            if getattr(validator.func, "__trusted_decode__", None) is not None
+        ),
+        None,
+    )
+    if decode is None:
+        return convert
+    if convert is None:
+        return lambda value, values: decode(value)
+    return lambda value, values: convert(decode(value), values)
+
+
+def _converter(
+    field: ModelField,
+    model_class: type[BaseModel],
+    resolve: Callable | None = None,
+    top_level: bool = False,
+) -> Converter:
+    if field.shape == SHAPE_SINGLETON:
+        convert = _singleton_converter(field, model_class, resolve)
+        expected_type = None
+    elif field.shape == SHAPE_LIST:
+        item = _converter(field.sub_fields[0], model_class, resolve)
+        convert = None if item is None else _list_converter(item)
+        expected_type = list
+    elif field.shape in (SHAPE_DICT, SHAPE_MAPPING):
+        key = _key_converter(field.key_field, model_class)
+        item = _converter(field.sub_fields[0], model_class)
+        convert = None if key is None and item is None else _dict_converter(key, item)
+        expected_type = dict
+    else:
+        return _validating_converter(field, model_class)
+    # Values of the wrong container type, such as an alternative encoding handled by a
+    # validator, are validated as usual; the check is skipped inside containers
+    if convert is None and not (top_level and expected_type):
+        return None
+
+    def checked(value, values):
+        if value is None and field.allow_none:
+            return None
+        if expected_type is not None and type(value) is not expected_type:
+            return _validate(field, value, values, model_class)
+        return value if convert is None else convert(value, values)
+
+    return checked
+
+
+def _list_converter(item: Converter) -> Converter:
+    def convert(value, values):
+        return [item(element, values) for element in value]
+
+    return convert
+
+
+def _dict_converter(key: Converter, item: Converter) -> Converter:
+    def convert(value, values):
+        return {
+            k if key is None else key(k, values): v if item is None else item(v, values)
+            for k, v in value.items()
+        }
+
+    return convert
+
+
+def _key_converter(field: ModelField, model_class: type[BaseModel]) -> Converter:
+    type_ = field.type_
+    if isinstance(type_, type) and issubclass(type_, str):
+        return None
+    if isinstance(type_, type) and issubclass(type_, int) and not issubclass(type_, bool):
+        return lambda key, values: int(key) if type(key) is str else key
+    return _validating_converter(field, model_class)
+
+
+def _singleton_converter(
+    field: ModelField, model_class: type[BaseModel], resolve: Callable | None
+) -> Converter:
+    if resolve is not None:
+        return _resolving_converter(field, model_class, resolve)
+    if field.sub_fields:
+        return _union_converter(field, model_class)
+    type_ = field.type_
+    if type_ is Any or type_ in (list, dict):
+        return None
+    if isinstance(type_, type):
+        if issubclass(type_, BaseModel):
+            return _model_converter(field, model_class, type_)
+        if issubclass(type_, Enum):
+            return _enum_converter(field, model_class, type_)
+        if issubclass(type_, (bool, str, int)):
+            return None
+        if issubclass(type_, float):
+            if getattr(type_, "strict", False):
+                return None
+            return lambda value, values: float(value) if type(value) is int else value
+        if type_ is Decimal:
+            return _decimal_converter
+    return _validating_converter(field, model_class)
+
+
+def _decimal_converter(value: Any, values: dict) -> Decimal:
+    return Decimal(str(value)) if type(value) is float else Decimal(value)
+
+
+def _enum_converter(
+    field: ModelField, model_class: type[BaseModel], type_: type[Enum]
+) -> Converter:
+    def convert(value, values):
+        try:
+            return type_(value)
+        except ValueError:
+            return _validate(field, value, values, model_class)
+
+    return convert
+
+
+def _model_converter(
+    field: ModelField, model_class: type[BaseModel], type_: type[BaseModel]
+) -> Converter:
+    constructor = _constructor(type_)
+
+    def convert(value, values):
+        if type(value) is dict:
+            return constructor(value)
+        if isinstance(value, type_):
+            return value
+        return _validate(field, value, values, model_class)
+
+    return convert
+
+
+def _resolving_converter(
+    field: ModelField, model_class: type[BaseModel], resolve: Callable
+) -> Converter:
+    def convert(value, values):
+        if isinstance(value, BaseModel):
+            return value
+        resolved = resolve(value) if type(value) is dict else None
+        if resolved is None:
+            return _validate(field, value, values, model_class)
+        return _constructor(resolved)(value)
+
+    return convert
+
+
+def _union_converter(field: ModelField, model_class: type[BaseModel]) -> Converter:
+    by_header = {}
+    by_type = {}
+    members = []
+    for member in field.sub_fields:
+        if _is_model(member):
+            # Models are only recognized by their header name or type; others are validated
+            _index_model(member.type_, by_header, by_type)
+            continue
+        matches = _matcher(member)
+        if matches is None:
+            return _validating_converter(field, model_class)
+        members.append((matches, _converter(member, model_class)))
+
+    def convert(value, values):
+        if type(value) is dict:
+            header = value.get("braketSchemaHeader")
+            resolved = by_header.get(header.get("name")) if type(header) is dict else None
+            if resolved is None and by_type:
+                resolved = by_type.get(value.get("type"))
+            if resolved is not None:
+                return _constructor(resolved)(value)
+        for matches, member_convert in members:
+            if matches(value):
+                return value if member_convert is None else member_convert(value, values)
+        return _validate(field, value, values, model_class)
+
+    return convert
+
+
+def _is_model(field: ModelField) -> bool:
+    return (
+        field.shape == SHAPE_SINGLETON
+        and isinstance(field.type_, type)
+        and issubclass(field.type_, BaseModel)
+    )
+
+
+def _index_model(
+    type_: type[BaseModel], by_header: dict[str, type], by_type: dict[Any, type]
+) -> None:
+    header = type_.__fields__.get("braketSchemaHeader")
+    if header is not None and header.default is not None:
+        by_header.setdefault(header.default.name, type_)
+    discriminator = type_.__fields__.get("type")
+    if discriminator is not None and isinstance(discriminator.default, Enum):
+        by_type.setdefault(discriminator.default.value, type_)
+
+
+def _matcher(field: ModelField) -> Callable[[Any], bool] | None:
+    """
+    Returns a check of whether a raw value is of a union member, looking at the first element
+    of containers, or None if the member can not be recognized without validation.
+    """
+    if field.shape in (SHAPE_LIST, SHAPE_DICT, SHAPE_MAPPING):
+        container = list if field.shape == SHAPE_LIST else dict
+        element_matches = _matcher(field.sub_fields[0])
+        if element_matches is None:
+            return None
+
+        def matches(value):
+            if type(value) is not container:
+                return False
+            if not value:
+                return True
+            return element_matches(value[0] if container is list else next(iter(value.values())))
+
+        return matches
+    if field.shape != SHAPE_SINGLETON:
+        return None
+    if field.sub_fields:
+        member_matchers = [_matcher(member) for member in field.sub_fields]
+        if None in member_matchers:
+            return None
+        return lambda value: any(matches(value) for matches in member_matchers)
+    if not isinstance(field.type_, type):
+        return None
+    if issubclass(field.type_, Enum):
+        members = {member.value for member in field.type_}
+        return lambda value: type(value) in (str, int) and value in members
+    python_types = _python_types(field.type_)
+    if python_types is None:
+        return None
+    if field.allow_none:
+        python_types += (_NoneType,)
+    return lambda value: type(value) in python_types
+
+
+def _python_types(type_: type) -> tuple[type, ...] | None:
+    if issubclass(type_, BaseModel) or type_ in (_NoneType, dict):
+        return (dict,) if type_ is not _NoneType else (type_,)
+    if type_ is list:
+        return (list,)
+    if issubclass(type_, (bool, StrictBool)):
+        return (bool,)
+    if issubclass(type_, str):
+        return (str,)
+    if issubclass(type_, int):
+        return (int,)
+    if issubclass(type_, float):
+        return (float,) if getattr(type_, "strict", False) else (float, int)
+    return None
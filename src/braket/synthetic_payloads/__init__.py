@@ -0,0 +1,29 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+# Registers the generators of the schemas
+from braket.synthetic_payloads import schema_generators  # noqa: F401
+from braket.synthetic_payloads.generators import (  # noqa: F401
+    register_generator,
+    schema_classes,
+    synthetic_payload,
+    write_synthetic_payload,
+)
+from braket.synthetic_payloads.generic import UnsupportedFieldError  # noqa: F401
+from braket.synthetic_payloads.lazy_json import (  # noqa: F401
+    LazyArray,
+    LazyObject,
+    materialize,
+    write_json,
+)
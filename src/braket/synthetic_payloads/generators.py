@@ -0,0 +1,158 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License
+
+
+from __future__ import annotations
+
+import importlib
+import os
+import pkgutil
+import random
+from collections.abc import Callable
+from typing import IO
+
+from pydantic.v1 import BaseModel
+
+from braket.schema_common import BraketSchemaBase
+from braket.synthetic_payloads.generic import generic_payload
+from braket.synthetic_payloads.lazy_json import write_json
+
+# Generators of models whose sizes are not just the lengths of their containers, or whose
+# validators the field types do not capture, keyed by model class
+_generators: dict[type[BaseModel], Callable[..., dict]] = {}
+
+# The subpackages of this distribution that define schemas; other distributions, such as
+# the SDK, also install packages in the braket namespace
+_SCHEMA_PACKAGES = (
+    "braket.device_schema",
+    "braket.ir",
+    "braket.jobs_data",
+    "braket.schema_common",
+    "braket.task_result",
+)
+_SCHEMA_MODULE_PREFIXES = tuple(f"{package}." for package in _SCHEMA_PACKAGES)
+
+
+def register_generator(model_class: type[BaseModel]) -> Callable:
+    """
+    Registers the payload generator of a model, which replaces the generic generator for the
+    model, including where it is nested in other models.
+
+    Args:
+        model_class (type[BaseModel]): The model.
+
+    Returns:
+        Callable: A decorator for a function that takes the size, a `random.Random` and the
+        options passed to `synthetic_payload`, and returns the JSON data of a valid instance.
+
+    Examples:
+        >>> @register_generator(Problem)
+        ... def problem(size, rng, **options):
+        ...     return {"type": "ISING", "linear": {i: rng.random() for i in range(size)}}
+    """
+
+    def register(generator: Callable[..., dict]) -> Callable[..., dict]:
+        _generators[model_class] = generator
+        return generator
+
+    return register
+
+
+def synthetic_payload(
+    model_class: type[BaseModel], size: int = 1, seed: int = 0, **options
+) -> dict:
+    """
+    Generates the JSON data of a valid instance of a model. Large arrays and objects in the
+    data are `LazyArray` and `LazyObject` values, which are generated when they are iterated,
+    so the data can be written to a file with `write_synthetic_payload` without holding it in
+    memory, or turned into plain JSON data with `materialize`.
+
+    The data is the same for the same arguments. What the size is depends on the model; for
+    example, it is the number of shots of a `GateModelTaskResult`, the number of instructions
+    of a jaqcd `Program`, the number of atoms of an AHS `Program`, the number of couplers of
+    `DwaveProviderProperties` and the number of waveforms of `NativeGateCalibrations`. For
+    models without a registered generator, it is the number of elements of each list or dict
+    that is a field of the model.
+
+    Args:
+        model_class (type[BaseModel]): The model.
+        size (int): The size of the instance. Default: 1.
+        seed (int): The seed of the random values. Default: 0.
+        **options: Options of the generator of the model, such as `qubits` for a
+            `GateModelTaskResult`.
+
+    Returns:
+        dict: The JSON data.
+
+    Examples:
+        >>> payload = synthetic_payload(GateModelTaskResult, size=1000, qubits=20)
+        >>> GateModelTaskResult.parse_obj(materialize(payload))
+    """
+    generator = _generators.get(model_class)
+    if generator is None:
+        return generic_payload(model_class, size, random.Random(seed), synthetic_payload)
+    return generator(size, random.Random(seed), **options)
+
+
+def write_synthetic_payload(
+    file: str | os.PathLike | IO[str],
+    model_class: type[BaseModel],
+    size: int = 1,
+    seed: int = 0,
+    **options,
+) -> None:
+    """
+    Writes the JSON of a synthetic instance of a model to a file, generating it as it is
+    written, so that files much larger than memory can be created.
+
+    Args:
+        file (str | os.PathLike | IO[str]): The path of the file, or a text file object.
+        model_class (type[BaseModel]): The model.
+        size (int): The size of the instance. Default: 1.
+        seed (int): The seed of the random values. Default: 0.
+        **options: Options of the generator of the model.
+
+    Examples:
+        >>> write_synthetic_payload("result.json", GateModelTaskResult, size=10**7, qubits=40)
+    """
+    payload = synthetic_payload(model_class, size, seed, **options)
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "w") as f:
+            write_json(payload, f)
+    else:
+        write_json(payload, file)
+
+
+def schema_classes() -> list[type[BraketSchemaBase]]:
+    """
+    Returns:
+        list[type[BraketSchemaBase]]: Every schema in the package, that is every subclass of
+        `BraketSchemaBase` with a default schema header. Only the subpackages of this
+        package are imported, not other distributions in the `braket` namespace, and
+        schemas defined elsewhere are left out.
+    """
+    for package_name in _SCHEMA_PACKAGES:
+        package = importlib.import_module(package_name)
+        for info in pkgutil.walk_packages(package.__path__, f"{package_name}."):
+            importlib.import_module(info.name)
+    classes = []
+    pending = [BraketSchemaBase]
+    while pending:
+        for subclass in pending.pop().__subclasses__():
+            pending.append(subclass)
+            header = subclass.__fields__["braketSchemaHeader"]
+            if header.default is not None and subclass.__module__.startswith(
+                _SCHEMA_MODULE_PREFIXES
+            ):
+                classes.append(subclass)
+    return sorted(set(classes), key=lambda schema: (schema.__module__, schema.__name__))
@@ -0,0 +1,229 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License
+
+
+from __future__ import annotations
+
+import json
+import random
+import re
+import string
+from collections.abc import Callable
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+
+from pydantic.v1 import AnyUrl, BaseModel
+from pydantic.v1.fields import (
+    SHAPE_DICT,
+    SHAPE_LIST,
+    SHAPE_MAPPING,
+    SHAPE_SEQUENCE,
+    SHAPE_SET,
+    SHAPE_SINGLETON,
+    SHAPE_TUPLE,
+    SHAPE_TUPLE_ELLIPSIS,
+    ModelField,
+)
+
+_NoneType = type(None)
+_LIST_SHAPES = (SHAPE_LIST, SHAPE_SET, SHAPE_SEQUENCE, SHAPE_TUPLE_ELLIPSIS)
+_DICT_SHAPES = (SHAPE_DICT, SHAPE_MAPPING)
+
+# Character classes repeated with `+` in the patterns of constrained strings
+_CHARACTER_CLASS = re.compile(r"\[([^\]]+)\]\+")
+_GROUP = re.compile(r"\(([^()]*)\)")
+
+
+class UnsupportedFieldError(TypeError):
+    """A field has a type for which no valid value can be generated."""
+
+
+def generic_payload(
+    model_class: type[BaseModel], size: int, rng: random.Random, model_payload: Callable
+) -> dict:
+    """
+    Generates the JSON data of a valid instance of a model from the types and constraints of
+    its fields, with `size` elements in each of the containers nearest to the model, such as
+    the lists that are fields of the model, and as few as allowed in containers nested in
+    those. Optional fields are filled in, unless their type is not supported.
+
+    Args:
+        model_class (type[BaseModel]): The model.
+        size (int): The number of elements of the outermost containers.
+        rng (random.Random): The random number generator of the values.
+        model_payload (Callable): Generates the payload of a model of a field, with the same
+            arguments as `synthetic_payload`.
+
+    Returns:
+        dict: The JSON data.
+
+    Raises:
+        UnsupportedFieldError: If a required field has a type that is not supported.
+    """
+    payload = {}
+    for field in model_class.__fields__.values():
+        if field.field_info.const and field.default is not None:
+            payload[field.alias] = _jsonable(field.default)
+            continue
+        try:
+            payload[field.alias] = field_value(field, size, rng, model_payload)
+        except UnsupportedFieldError:
+            if field.required:
+                raise
+    return payload
+
+
+def field_value(field: ModelField, size: int, rng: random.Random, model_payload: Callable) -> Any:
+    """
+    Args:
+        field (ModelField): The field.
+        size (int): The number of elements of the outermost containers of the value.
+        rng (random.Random): The random number generator of the value.
+        model_payload (Callable): Generates the payload of a model of the field, with the same
+            arguments as `synthetic_payload`.
+
+    Returns:
+        Any: A valid JSON value of the field.
+
+    Raises:
+        UnsupportedFieldError: If the type of the field is not supported.
+    """
+    if field.shape == SHAPE_SINGLETON:
+        return _singleton_value(field, size, rng, model_payload)
+    # Containers nested in this one get as few elements as allowed
+    if field.shape in _LIST_SHAPES:
+        count = _count(field, size)
+        return [field_value(field.sub_fields[0], 1, rng, model_payload) for _ in range(count)]
+    if field.shape == SHAPE_TUPLE:
+        return [field_value(sub_field, 1, rng, model_payload) for sub_field in field.sub_fields]
+    if field.shape in _DICT_SHAPES:
+        values = {}
+        for _ in range(size * 4):
+            if len(values) == size:
+                break
+            key = field_value(field.key_field, 1, rng, model_payload)
+            if not isinstance(key, (str, int, float, bool)):
+                raise UnsupportedFieldError(f"Unsupported key type {field.key_field.type_}")
+            values[key] = field_value(field.sub_fields[0], 1, rng, model_payload)
+        return values
+    raise UnsupportedFieldError(f"Unsupported field shape {field.shape}")
+
+
+def _count(field: ModelField, size: int) -> int:
+    min_items = getattr(field.outer_type_, "min_items", None) or 0
+    max_items = getattr(field.outer_type_, "max_items", None)
+    count = max(size, min_items)
+    return count if max_items is None else min(count, max_items)
+
+
+def _singleton_value(
+    field: ModelField, size: int, rng: random.Random, model_payload: Callable
+) -> Any:
+    if field.sub_fields:
+        return _union_value(field, size, rng, model_payload)
+    type_ = field.type_
+    if type_ is Any or type_ is object:
+        return rng.random()
+    if not isinstance(type_, type):
+        literal_values = getattr(type_, "__args__", None)
+        if getattr(type_, "__origin__", None) is not None and literal_values:
+            return literal_values[0]
+        raise UnsupportedFieldError(f"Unsupported type {type_}")
+    if issubclass(type_, BaseModel):
+        return model_payload(type_, size=size, seed=rng.getrandbits(64))
+    if issubclass(type_, Enum):
+        return next(iter(type_)).value
+    if issubclass(type_, bool):
+        return rng.random() < 0.5
+    if issubclass(type_, int):
+        low, high = _bounds(type_, 0, 100)
+        return rng.randint(int(low), int(high))
+    if issubclass(type_, (float, Decimal)):
+        low, high = _bounds(type_, 0.0, 1.0)
+        return rng.uniform(float(low), float(high))
+    if issubclass(type_, AnyUrl):
+        return f"https://example.com/{_string_value(str, rng)}"
+    if issubclass(type_, str):
+        return _string_value(type_, rng)
+    # datetime is a subclass of date
+    if issubclass(type_, datetime):
+        return datetime(2024, 1, 1).isoformat()
+    if issubclass(type_, date):
+        return date(2024, 1, 1).isoformat()
+    if issubclass(type_, time):
+        return time(rng.randrange(24)).isoformat()
+    if type_ is dict:
+        return {}
+    if type_ is list:
+        return []
+    raise UnsupportedFieldError(f"Unsupported type {type_}")
+
+
+def _union_value(field: ModelField, size: int, rng: random.Random, model_payload: Callable) -> Any:
+    for member in field.sub_fields:
+        if member.type_ is _NoneType:
+            continue
+        try:
+            value = field_value(member, size, rng, model_payload)
+        except UnsupportedFieldError:
+            continue
+        _, error = member.validate(value, {}, loc=field.alias)
+        if not error:
+            return value
+    raise UnsupportedFieldError(f"No member of {field.outer_type_} is supported")
+
+
+def _bounds(type_: type, default_low: float, default_high: float) -> tuple[float, float]:
+    ge, gt = getattr(type_, "ge", None), getattr(type_, "gt", None)
+    le, lt = getattr(type_, "le", None), getattr(type_, "lt", None)
+    step = 1 if issubclass(type_, int) else 1e-9
+    low = ge if ge is not None else gt + step if gt is not None else None
+    high = le if le is not None else lt - step if lt is not None else None
+    if low is None:
+        low = default_low if high is None else min(default_low, high)
+    if high is None:
+        high = max(default_high, low + default_high - default_low)
+    return low, high
+
+
+def _string_value(type_: type, rng: random.Random) -> str:
+    regex = getattr(type_, "regex", None)
+    if regex is not None:
+        return _regex_value(regex, rng)
+    min_length = getattr(type_, "min_length", None) or 1
+    max_length = getattr(type_, "max_length", None) or max(min_length, 8)
+    length = min(max(min_length, 8), max_length)
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(length))
+
+
+def _regex_value(regex: re.Pattern, rng: random.Random) -> str:
+    """
+    Generates a string for the simple patterns of constrained strings in the schemas: a
+    literal, a group of alternatives, or a character class repeated with `+`.
+    """
+    pattern = regex.pattern.removeprefix("^").removesuffix("$")
+    pattern = _GROUP.sub(lambda match: match.group(1).split("|")[0], pattern)
+    pattern = _CHARACTER_CLASS.sub(
+        lambda match: "".join(rng.choice(match.group(1)) for _ in range(rng.randint(1, 8))),
+        pattern,
+    )
+    value = re.sub(r"\\(.)", r"\1", pattern)
+    if not regex.match(value):
+        raise UnsupportedFieldError(f"Unsupported pattern {regex.pattern}")
+    return value
+
+
+def _jsonable(value: Any) -> Any:
+    return json.loads(value.json()) if isinstance(value, BaseModel) else value
@@ -0,0 +1,133 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License
+
+
+from __future__ import annotations
+
+import json
+import random
+from collections.abc import Callable, Iterator
+from typing import IO, Any
+
+# The number of array elements encoded before they are written to the file together
+_WRITE_BATCH = 1024
+
+
+class LazyArray:
+    """
+    A JSON array whose elements are generated each time it is iterated, so that arrays too
+    large to hold in memory can be written to a file.
+
+    The elements are generated from a random number generator seeded with the same seed on
+    every iteration, so every iteration yields the same elements.
+
+    Args:
+        length (int): The number of elements.
+        elements (Callable[[random.Random, int], Iterator[Any]]): Generates the given number of
+            elements with the given random number generator.
+        seed (int): The seed of the random number generator.
+
+    Examples:
+        >>> shots = LazyArray(3, lambda rng, n: ([rng.randint(0, 1)] for _ in range(n)), seed=0)
+        >>> materialize(shots)
+        [[1], [1], [0]]
+    """
+
+    def __init__(
+        self, length: int, elements: Callable[[random.Random, int], Iterator[Any]], seed: int
+    ):
+        self.length = length
+        self._elements = elements
+        self._seed = seed
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._elements(random.Random(self._seed), self.length))
+
+
+class LazyObject(LazyArray):
+    """
+    A JSON object whose members are generated each time it is iterated, like `LazyArray`;
+    the generated elements are (key, value) pairs.
+    """
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        return iter(self)
+
+
+def materialize(payload: Any) -> Any:
+    """
+    Args:
+        payload (Any): A JSON value that may contain `LazyArray` and `LazyObject` values.
+
+    Returns:
+        Any: The payload with all lazy values generated into lists and dicts.
+    """
+    if isinstance(payload, LazyObject):
+        return {key: materialize(value) for key, value in payload.items()}
+    if isinstance(payload, dict):
+        return {key: materialize(value) for key, value in payload.items()}
+    if isinstance(payload, (list, LazyArray)):
+        return [materialize(element) for element in payload]
+    return payload
+
+
+def write_json(payload: Any, file: IO[str]) -> None:
+    """
+    Writes a JSON value that may contain `LazyArray` and `LazyObject` values to a text file,
+    generating the lazy values as they are written, so that only one element of each lazy
+    value is held in memory at a time. The output is the same as `json.dump` of the
+    materialized payload.
+
+    Args:
+        payload (Any): The JSON value.
+        file (IO[str]): The text file to write to.
+    """
+    _write(payload, file.write)
+
+
+def _write(value: Any, write: Callable[[str], Any]) -> None:
+    if isinstance(value, (dict, LazyObject)):
+        write("{")
+        separator = ""
+        for key, member in value.items():
+            write(f"{separator}{json.dumps(key if isinstance(key, str) else json.dumps(key))}: ")
+            _write(member, write)
+            separator = ", "
+        write("}")
+    elif isinstance(value, (list, LazyArray)):
+        write("[")
+        separator = ""
+        batch = []
+        for element in value:
+            try:
+                batch.append(json.dumps(element))
+            except TypeError:
+                # The element contains lazy values
+                if batch:
+                    write(separator + ", ".join(batch))
+                    separator, batch = ", ", []
+                write(separator)
+                _write(element, write)
+                separator = ", "
+                continue
+            if len(batch) == _WRITE_BATCH:
+                write(separator + ", ".join(batch))
+                separator, batch = ", ", []
+        if batch:
+            write(separator + ", ".join(batch))
+        write("]")
+    else:
+        write(json.dumps(value))
@@ -0,0 +1,373 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License
+
+
+"""
+Generators of the schemas whose sizes are not just the lengths of their containers, or whose
+validators relate several fields to each other.
+"""
+
+from __future__ import annotations
+
+import base64
+import math
+import random
+import struct
+
+from braket.device_schema.dwave import DwaveProviderProperties
+from braket.device_schema.error_mitigation.error_mitigation_scheme import ErrorMitigationScheme
+from braket.device_schema.pulse import NativeGateCalibrations
+from braket.ir.ahs import AtomArrangement
+from braket.ir.ahs import Program as AHSProgram
+from braket.ir.jaqcd import Program as JaqcdProgram
+from braket.ir.openqasm import Program as OpenQASMProgram
+from braket.ir.openqasm import ProgramSet
+from braket.schema_common import BraketSchemaBase
+from braket.synthetic_payloads.generators import register_generator
+from braket.synthetic_payloads.lazy_json import LazyArray, LazyObject
+from braket.task_result import (
+    GateModelTaskResult,
+    PackedComplexArray,
+    PackedMeasurements,
+    TaskMetadata,
+)
+
+# The spacing of the sites of generated atom arrangements, in meters
+_SITE_SPACING = 5e-6
+# The duration of generated AHS programs, in seconds
+_AHS_DURATION = 4e-6
+
+
+def _header(schema: type[BraketSchemaBase]) -> dict:
+    # The constant header of the schema, which identifies payloads parsed by its header
+    return {"braketSchemaHeader": schema.__fields__["braketSchemaHeader"].default.dict()}
+
+
+@register_generator(GateModelTaskResult)
+def gate_model_task_result(size: int, rng: random.Random, qubits: int = 8) -> dict:
+    """
+    Args:
+        size (int): The number of shots.
+        rng (random.Random): The random number generator.
+        qubits (int): The number of measured qubits. Default: 8.
+
+    Returns:
+        dict: A result of an OpenQASM program with `size` measured shots.
+    """
+    return {
+        **_header(GateModelTaskResult),
+        "measurements": LazyArray(
+            size,
+            lambda shot_rng, shots: (
+                [shot_rng.getrandbits(1) for _ in range(qubits)] for _ in range(shots)
+            ),
+            seed=rng.getrandbits(64),
+        ),
+        "measuredQubits": list(range(qubits)),
+        "taskMetadata": {
+            **_header(TaskMetadata),
+            "id": "task_id",
+            "shots": size,
+            "deviceId": "device_id",
+        },
+        "additionalMetadata": {"action": {**_header(OpenQASMProgram), "source": "OPENQASM 3.0;"}},
+    }
+
+
+@register_generator(JaqcdProgram)
+def jaqcd_program(size: int, rng: random.Random, qubits: int = 8) -> dict:
+    """
+    Args:
+        size (int): The number of instructions.
+        rng (random.Random): The random number generator.
+        qubits (int): The number of qubits the instructions act on. At least 2. Default: 8.
+
+    Returns:
+        dict: A program of `size` one- and two-qubit gates, with a probability result.
+    """
+
+    def instructions(gate_rng: random.Random, count: int):
+        for _ in range(count):
+            first, second = gate_rng.sample(range(qubits), 2)
+            gate = gate_rng.choice(("h", "x", "rx", "cnot", "cz", "swap"))
+            if gate in ("h", "x"):
+                yield {"type": gate, "target": first}
+            elif gate == "rx":
+                yield {"type": gate, "target": first, "angle": gate_rng.uniform(0, math.tau)}
+            elif gate == "swap":
+                yield {"type": gate, "targets": [first, second]}
+            else:
+                yield {"type": gate, "control": first, "target": second}
+
+    return {
+        **_header(JaqcdProgram),
+        "instructions": LazyArray(size, instructions, seed=rng.getrandbits(64)),
+        "results": [{"type": "probability", "targets": [0, 1]}],
+    }
+
+
+@register_generator(ProgramSet)
+def program_set(size: int, rng: random.Random, executables: int = 1) -> dict:
+    """
+    Args:
+        size (int): The number of programs.
+        rng (random.Random): The random number generator.
+        executables (int): The number of values of the input of each program. Default: 1.
+
+    Returns:
+        dict: A program set of `size` parametrized programs.
+    """
+    source = "OPENQASM 3.0;\ninput float theta;\nqubit[2] q;\nh q[0];\nrx(theta) q[1];\n"
+    return {
+        **_header(ProgramSet),
+        "programs": LazyArray(
+            size,
+            lambda program_rng, programs: (
+                {
+                    **_header(OpenQASMProgram),
+                    "source": source,
+                    "inputs": {
+                        "theta": [program_rng.uniform(0, math.tau) for _ in range(executables)]
+                    },
+                }
+                for _ in range(programs)
+            ),
+            seed=rng.getrandbits(64),
+        ),
+    }
+
+
+@register_generator(AtomArrangement)
+def atom_arrangement(size: int, rng: random.Random) -> dict:
+    """
+    Args:
+        size (int): The number of sites.
+        rng (random.Random): The random number generator.
+
+    Returns:
+        dict: A square lattice of `size` sites, each filled or empty.
+    """
+    columns = math.isqrt(size - 1) + 1 if size else 1
+    return {
+        "sites": LazyArray(
+            size,
+            lambda _, sites: (
+                [(i % columns) * _SITE_SPACING, (i // columns) * _SITE_SPACING]
+                for i in range(sites)
+            ),
+            seed=0,
+        ),
+        "filling": LazyArray(
+            size,
+            lambda filling_rng, sites: (filling_rng.getrandbits(1) for _ in range(sites)),
+            seed=rng.getrandbits(64),
+        ),
+    }
+
+
+@register_generator(AHSProgram)
+def ahs_program(size: int, rng: random.Random, time_points: int = 4) -> dict:
+    """
+    Args:
+        size (int): The number of atoms.
+        rng (random.Random): The random number generator.
+        time_points (int): The number of points of each time series. At least 2. Default: 4.
+
+    Returns:
+        dict: A program with `size` atoms, a uniform driving field and a local detuning.
+    """
+    times = [i * _AHS_DURATION / (time_points - 1) for i in range(time_points)]
+
+    def time_series():
+        return {"values": [rng.uniform(0, 1.5e7) for _ in times], "times": times}
+
+    return {
+        **_header(AHSProgram),
+        "setup": {"ahs_register": atom_arrangement(size, rng)},
+        "hamiltonian": {
+            "drivingFields": [
+                {
+                    field: {"time_series": time_series(), "pattern": "uniform"}
+                    for field in ("amplitude", "phase", "detuning")
+                }
+            ],
+            "localDetuning": [
+                {
+                    "magnitude": {
+                        "time_series": time_series(),
+                        "pattern": LazyArray(
+                            size,
+                            lambda pattern_rng, sites: (pattern_rng.random() for _ in range(sites)),
+                            seed=rng.getrandbits(64),
+                        ),
+                    }
+                }
+            ],
+        },
+    }
+
+
+@register_generator(DwaveProviderProperties)
+def dwave_provider_properties(size: int, rng: random.Random) -> dict:
+    """
+    Args:
+        size (int): The number of couplers.
+        rng (random.Random): The random number generator.
+
+    Returns:
+        dict: The properties of a device whose qubits are coupled in a ring of `size`
+        couplers, with one more qubit than couplers if there are fewer than 3.
+    """
+    qubits = size if size >= 3 else size + 1
+    ranges = [-1.0, 1.0]
+    return {
+        **_header(DwaveProviderProperties),
+        "annealingOffsetStep": 1.45,
+        "annealingOffsetStepPhi0": 1.45,
+        "annealingOffsetRanges": LazyArray(
+            qubits,
+            lambda offset_rng, count: (
+                [-offset_rng.random(), offset_rng.random()] for _ in range(count)
+            ),
+            seed=rng.getrandbits(64),
+        ),
+        "annealingDurationRange": [1, 2000],
+        "couplers": LazyArray(
+            size, lambda _, count: ([i, (i + 1) % qubits] for i in range(count)), seed=0
+        ),
+        "defaultAnnealingDuration": 20,
+        "defaultProgrammingThermalizationDuration": 1000,
+        "defaultReadoutThermalizationDuration": 0,
+        "extendedJRange": ranges,
+        "hGainScheduleRange": ranges,
+        "hRange": ranges,
+        "jRange": ranges,
+        "maximumAnnealingSchedulePoints": 12,
+        "maximumHGainSchedulePoints": 20,
+        "perQubitCouplingRange": ranges,
+        "programmingThermalizationDurationRange": [0, 10000],
+        "qubits": LazyArray(qubits, lambda _, count: iter(range(count)), seed=0),
+        "qubitCount": qubits,
+        "quotaConversionRate": 1,
+        "readoutThermalizationDurationRange": [0, 10000],
+        "taskRunDurationRange": [0, 1000000],
+        "topology": {"type": "pegasus", "shape": [16]},
+    }
+
+
+@register_generator(NativeGateCalibrations)
+def native_gate_calibrations(size: int, rng: random.Random, samples: int = 100) -> dict:
+    """
+    Args:
+        size (int): The number of waveforms.
+        rng (random.Random): The random number generator.
+        samples (int): The number of amplitudes of each arbitrary waveform. Default: 100.
+
+    Returns:
+        dict: The calibrations of `size` qubits, each with an `rx` gate that plays a waveform
+        of the qubit; the waveforms alternate between template and arbitrary waveforms.
+    """
+
+    def gates(_, qubits: int):
+        for qubit in range(qubits):
+            play = {
+                "name": "play",
+                "arguments": [
+                    {"name": "frame", "value": f"q{qubit}_rf_frame", "type": "frame"},
+                    {"name": "waveform", "value": f"wf_{qubit}", "type": "waveform"},
+                ],
+            }
+            native_gate = {
+                "name": "rx",
+                "qubits": [str(qubit)],
+                "arguments": ["1.5707963267948966"],
+                "calibrations": [play],
+            }
+            yield str(qubit), {"rx": [native_gate]}
+
+    def waveforms(waveform_rng: random.Random, count: int):
+        for qubit in range(count):
+            waveform_id = f"wf_{qubit}"
+            if qubit % 2:
+                amplitudes = [[waveform_rng.random(), 0.0] for _ in range(samples)]
+                yield waveform_id, {"waveformId": waveform_id, "amplitudes": amplitudes}
+            else:
+                arguments = [
+                    {"name": name, "value": waveform_rng.random(), "type": "float"}
+                    for name in ("length", "sigma", "amplitude", "beta")
+                ]
+                yield (
+                    waveform_id,
+                    {
+                        "waveformId": waveform_id,
+                        "name": "drag_gaussian",
+                        "arguments": arguments,
+                    },
+                )
+
+    return {
+        **_header(NativeGateCalibrations),
+        "gates": LazyObject(size, gates, seed=0),
+        "waveforms": LazyObject(size, waveforms, seed=rng.getrandbits(64)),
+    }
+
+
+@register_generator(PackedMeasurements)
+def packed_measurements(size: int, rng: random.Random, qubits: int = 8) -> dict:
+    """
+    Args:
+        size (int): The number of shots.
+        rng (random.Random): The random number generator.
+        qubits (int): The number of qubits of each shot. Default: 8.
+
+    Returns:
+        dict: `size` packed shots.
+    """
+    row_bytes = -(-qubits // 8)
+    padding_mask = ~((1 << (row_bytes * 8 - qubits)) - 1) & 0xFF
+    packed = bytearray(rng.randbytes(size * row_bytes))
+    packed[row_bytes - 1 :: row_bytes] = bytes(
+        b & padding_mask for b in packed[row_bytes - 1 :: row_bytes]
+    )
+    return {
+        **_header(PackedMeasurements),
+        "shape": [size, qubits],
+        "data": base64.b64encode(packed).decode(),
+    }
+
+
+@register_generator(PackedComplexArray)
+def packed_complex_array(size: int, rng: random.Random) -> dict:
+    """
+    Args:
+        size (int): The number of amplitudes.
+        rng (random.Random): The random number generator.
+
+    Returns:
+        dict: A packed state vector of `size` amplitudes.
+    """
+    values = [rng.uniform(-1, 1) for _ in range(2 * size)]
+    return {
+        **_header(PackedComplexArray),
+        "shape": [size],
+        "data": base64.b64encode(struct.pack(f"<{2 * size}d", *values)).decode(),
+    }
+
+
+@register_generator(ErrorMitigationScheme)
+def error_mitigation_scheme(size: int, rng: random.Random) -> dict:
+    """
+    Returns:
+        dict: The debias scheme, as a scheme is identified by the class path in its type.
+    """
+    return {"type": "braket.device_schema.error_mitigation.debias.Debias"}
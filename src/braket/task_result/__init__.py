@@ -11,40 +11,96 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License
 
-from braket.task_result.additional_metadata import AdditionalMetadata  # noqa: F401
-from braket.task_result.analog_hamiltonian_simulation_task_result_v1 import (  # noqa: F401
-    AnalogHamiltonianSimulationShotMeasurement,
-    AnalogHamiltonianSimulationShotMetadata,
-    AnalogHamiltonianSimulationShotResult,
-    AnalogHamiltonianSimulationTaskResult,
-)
-from braket.task_result.annealing_task_result_v1 import AnnealingTaskResult  # noqa: F401
-from braket.task_result.aqt_metadata_v1 import AqtMetadata  # noqa: F401
-from braket.task_result.dwave_metadata_v1 import DwaveMetadata, DwaveTiming  # noqa: F401
-from braket.task_result.gate_model_task_result_v1 import (  # noqa: F401
-    GateModelTaskResult,
-    ResultTypeValue,
-)
-from braket.task_result.ionq_metadata_v1 import IonQMetadata  # noqa: F401
-from braket.task_result.iqm_metadata_v1 import IqmMetadata  # noqa: F401
-from braket.task_result.oqc_metadata_v1 import OqcMetadata  # noqa: F401
-from braket.task_result.photonic_model_task_result_v1 import PhotonicModelTaskResult  # noqa: F401
-from braket.task_result.program_result_v1 import ProgramResult  # noqa: F401
-from braket.task_result.program_set_executable_cancellation_v1 import (  # noqa: F401
-    ProgramSetExecutableCancellationMetadata,
-)
-from braket.task_result.program_set_executable_failure_v1 import (  # noqa: F401
-    ProgramSetExecutableFailure,
-    ProgramSetExecutableFailureMetadata,
-)
-from braket.task_result.program_set_executable_result_v1 import (  # noqa: F401
-    ProgramSetExecutableResult,
-    ProgramSetExecutableResultMetadata,
+from typing import TYPE_CHECKING
+
+from braket.schema_common._lazy_exports import lazy_exports
+
+# For type checkers only; at runtime each export is imported on first access
+if TYPE_CHECKING:
+    from braket.task_result.additional_metadata import AdditionalMetadata  # noqa: F401
+    from braket.task_result.analog_hamiltonian_simulation_task_result_v1 import (  # noqa: F401
+        AnalogHamiltonianSimulationShotMeasurement,
+        AnalogHamiltonianSimulationShotMetadata,
+        AnalogHamiltonianSimulationShotResult,
+        AnalogHamiltonianSimulationTaskResult,
+    )
+    from braket.task_result.annealing_task_result_v1 import AnnealingTaskResult  # noqa: F401
+    from braket.task_result.aqt_metadata_v1 import AqtMetadata  # noqa: F401
+    from braket.task_result.dwave_metadata_v1 import DwaveMetadata, DwaveTiming  # noqa: F401
+    from braket.task_result.gate_model_task_result_v1 import (  # noqa: F401
+        GateModelTaskResult,
+        ResultTypeValue,
+    )
+    from braket.task_result.ionq_metadata_v1 import IonQMetadata  # noqa: F401
+    from braket.task_result.iqm_metadata_v1 import IqmMetadata  # noqa: F401
+    from braket.task_result.measurement_probabilities import (  # noqa: F401
+        MeasurementProbabilities,
+        MeasurementProbabilityArrays,
+    )
+    from braket.task_result.oqc_metadata_v1 import OqcMetadata  # noqa: F401
+    from braket.task_result.output_columns import OutputColumn, OutputColumns  # noqa: F401
+    from braket.task_result.packed_complex_array_v1 import PackedComplexArray  # noqa: F401
+    from braket.task_result.packed_measurements_v1 import PackedMeasurements  # noqa: F401
+    from braket.task_result.photonic_model_task_result_v1 import PhotonicModelTaskResult  # noqa: F401
+    from braket.task_result.program_result_v1 import ProgramResult  # noqa: F401
+    from braket.task_result.program_set_executable_cancellation_v1 import (  # noqa: F401
+        ProgramSetExecutableCancellationMetadata,
+    )
+    from braket.task_result.program_set_executable_failure_v1 import (  # noqa: F401
+        ProgramSetExecutableFailure,
+        ProgramSetExecutableFailureMetadata,
+    )
+    from braket.task_result.program_set_executable_result_v1 import (  # noqa: F401
+        ProgramSetExecutableResult,
+        ProgramSetExecutableResultMetadata,
+    )
+    from braket.task_result.program_set_task_metadata_v1 import ProgramSetTaskMetadata  # noqa: F401
+    from braket.task_result.program_set_task_result_v1 import ProgramSetTaskResult  # noqa: F401
+    from braket.task_result.quera_metadata_v1 import QueraMetadata  # noqa: F401
+    from braket.task_result.rigetti_metadata_v1 import NativeQuilMetadata, RigettiMetadata  # noqa: F401
+    from braket.task_result.simulator_metadata_v1 import SimulatorMetadata  # noqa: F401
+    from braket.task_result.task_metadata_v1 import TaskMetadata  # noqa: F401
+    from braket.task_result.task_result_stream import TaskResultStream  # noqa: F401
+    from braket.task_result.xanadu_metadata_v1 import XanaduMetadata  # noqa: F401
+
+__getattr__, __dir__, __all__ = lazy_exports(
+    __name__,
+    {
+        "AdditionalMetadata": "additional_metadata",
+        "AnalogHamiltonianSimulationShotMeasurement": "analog_hamiltonian_simulation_task_result_v1",
+        "AnalogHamiltonianSimulationShotMetadata": "analog_hamiltonian_simulation_task_result_v1",
+        "AnalogHamiltonianSimulationShotResult": "analog_hamiltonian_simulation_task_result_v1",
+        "AnalogHamiltonianSimulationTaskResult": "analog_hamiltonian_simulation_task_result_v1",
+        "AnnealingTaskResult": "annealing_task_result_v1",
+        "AqtMetadata": "aqt_metadata_v1",
+        "DwaveMetadata": "dwave_metadata_v1",
+        "DwaveTiming": "dwave_metadata_v1",
+        "GateModelTaskResult": "gate_model_task_result_v1",
+        "ResultTypeValue": "gate_model_task_result_v1",
+        "IonQMetadata": "ionq_metadata_v1",
+        "IqmMetadata": "iqm_metadata_v1",
+        "MeasurementProbabilities": "measurement_probabilities",
+        "MeasurementProbabilityArrays": "measurement_probabilities",
+        "OqcMetadata": "oqc_metadata_v1",
+        "OutputColumn": "output_columns",
+        "OutputColumns": "output_columns",
+        "PackedComplexArray": "packed_complex_array_v1",
+        "PackedMeasurements": "packed_measurements_v1",
+        "PhotonicModelTaskResult": "photonic_model_task_result_v1",
+        "ProgramResult": "program_result_v1",
+        "ProgramSetExecutableCancellationMetadata": "program_set_executable_cancellation_v1",
+        "ProgramSetExecutableFailure": "program_set_executable_failure_v1",
+        "ProgramSetExecutableFailureMetadata": "program_set_executable_failure_v1",
+        "ProgramSetExecutableResult": "program_set_executable_result_v1",
+        "ProgramSetExecutableResultMetadata": "program_set_executable_result_v1",
+        "ProgramSetTaskMetadata": "program_set_task_metadata_v1",
+        "ProgramSetTaskResult": "program_set_task_result_v1",
+        "QueraMetadata": "quera_metadata_v1",
+        "NativeQuilMetadata": "rigetti_metadata_v1",
+        "RigettiMetadata": "rigetti_metadata_v1",
+        "SimulatorMetadata": "simulator_metadata_v1",
+        "TaskMetadata": "task_metadata_v1",
+        "TaskResultStream": "task_result_stream",
+        "XanaduMetadata": "xanadu_metadata_v1",
+    },
 )
-from braket.task_result.program_set_task_metadata_v1 import ProgramSetTaskMetadata  # noqa: F401
-from braket.task_result.program_set_task_result_v1 import ProgramSetTaskResult  # noqa: F401
-from braket.task_result.quera_metadata_v1 import QueraMetadata  # noqa: F401
-from braket.task_result.rigetti_metadata_v1 import NativeQuilMetadata, RigettiMetadata  # noqa: F401
-from braket.task_result.simulator_metadata_v1 import SimulatorMetadata  # noqa: F401
-from braket.task_result.task_metadata_v1 import TaskMetadata  # noqa: F401
-from braket.task_result.xanadu_metadata_v1 import XanaduMetadata  # noqa: F401
@@ -12,13 +12,15 @@
 # language governing permissions and limitations under the License
 
 
-from pydantic.v1 import BaseModel
+from pydantic.v1 import BaseModel, validator
 
 from braket.ir.ahs import Program as AHSProgram
 from braket.ir.annealing import Problem
 from braket.ir.blackbird import Program as BlackbirdProgram
 from braket.ir.jaqcd import Program as JaqcdProgram
 from braket.ir.openqasm import Program as OpenQASMProgram
+from braket.schema_common.schema_dispatch import SchemaDispatcher
+from braket.schema_common.trusted_construction import skip_when_trusted
 from braket.task_result.aqt_metadata_v1 import AqtMetadata
 from braket.task_result.dwave_metadata_v1 import DwaveMetadata
 from braket.task_result.ionq_metadata_v1 import IonQMetadata
@@ -29,6 +31,10 @@ from braket.task_result.rigetti_metadata_v1 import RigettiMetadata
 from braket.task_result.simulator_metadata_v1 import SimulatorMetadata
 from braket.task_result.xanadu_metadata_v1 import XanaduMetadata
 
+_valid_actions = SchemaDispatcher(
+    JaqcdProgram, OpenQASMProgram, BlackbirdProgram, Problem, AHSProgram
+)
+
 
 class AdditionalMetadata(BaseModel):
     """
@@ -66,3 +72,15 @@ class AdditionalMetadata(BaseModel):
     queraMetadata: QueraMetadata | None
     simulatorMetadata: SimulatorMetadata | None
     iqmMetadata: IqmMetadata | None
+
+    class Config:
+        smart_union = True
+
+    @validator("action", pre=True)
+    @skip_when_trusted()
+    def validate_action(cls, value):
+        """
+        Resolves the action with a lookup on the name of its schema header, so only the
+        matching program model is validated rather than each member of the union in turn.
+        """
+        return _valid_actions(value)
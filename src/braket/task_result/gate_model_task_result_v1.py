@@ -12,13 +12,23 @@
 # language governing permissions and limitations under the License
 
 
-from typing import TypeAlias
+from __future__ import annotations
+
+from typing import Any, TypeAlias
 
 from pydantic.v1 import BaseModel, Field, StrictBool, confloat, conint, conlist, constr, validator
 
-from braket.ir.jaqcd.program_v1 import Results
+from braket.ir.jaqcd.program_v1 import Results, parse_result
+from braket.ir.jaqcd.results import DensityMatrix, StateVector
 from braket.schema_common import BraketSchemaBase, BraketSchemaHeader
+from braket.schema_common.schema_dispatch import SchemaDispatcher
+from braket.schema_common.trusted_construction import skip_when_trusted
 from braket.task_result.additional_metadata import AdditionalMetadata
+from braket.task_result.measurement_probabilities import MeasurementProbabilities
+from braket.task_result.numpy_parsing import NumpyParsingMixin, dumps_with_arrays
+from braket.task_result.output_columns import OutputColumns
+from braket.task_result.packed_complex_array_v1 import PackedComplexArray
+from braket.task_result.packed_measurements_v1 import PackedMeasurements, unpack_measurements
 from braket.task_result.task_metadata_v1 import TaskMetadata
 
 StrictInt = conint(strict=True)
@@ -31,6 +41,9 @@ OutputValue: TypeAlias = (
     ScalarOrNull | list[StrictBool | None] | list[StrictInt | None] | list[StrictFloat | None]
 )
 
+_packed_complex_array = SchemaDispatcher(PackedComplexArray)
+_packed_result_ndim = {StateVector: 1, DensityMatrix: 2}
+
 
 class ResultTypeValue(BaseModel):
     """
@@ -39,14 +52,54 @@ class ResultTypeValue(BaseModel):
     Attributes:
          type (Union[Expectation, Sample, StateVector, Variance, Probability, Amplitude,
             AdjointGradient]): The requested result type
-         value (Union[List, float, Dict]): The value of the requested result
+         value (Union[PackedComplexArray, List, float, Dict]): The value of the requested
+            result. The value of a `StateVector` or `DensityMatrix` result can be a
+            `PackedComplexArray`, which is only decoded when its `to_array` is called.
     """
 
     type: Results
-    value: list | float | dict
+    value: PackedComplexArray | list | float | dict
 
+    class Config:
+        smart_union = True
 
-class GateModelTaskResult(BraketSchemaBase):
+    @validator("type", pre=True)
+    @skip_when_trusted()
+    def validate_type(cls, value):
+        """
+        Resolves the result type with a lookup on its `type`, so only the matching
+        result model is validated.
+        """
+        return parse_result(value)
+
+    @validator("value", pre=True)
+    @skip_when_trusted()
+    def validate_packed_value(cls, value):
+        """
+        Resolves packed complex arrays with a lookup on their header name.
+        """
+        return _packed_complex_array(value)
+
+    @validator("value")
+    @skip_when_trusted()
+    def validate_packed_value_type(cls, value, values):
+        """
+        Only allows packed complex arrays for state vectors and density matrices, with one and
+        two dimensions respectively. The type is not checked if it failed validation.
+        """
+        if "type" not in values:
+            return value
+        if isinstance(value, PackedComplexArray):
+            ndim = _packed_result_ndim.get(type(values.get("type")))
+            if ndim != len(value.shape):
+                raise ValueError(
+                    "packed values are only allowed for state vector (1-D) and "
+                    "density matrix (2-D) results"
+                )
+        return value
+
+
+class GateModelTaskResult(NumpyParsingMixin, BraketSchemaBase):
     """
     The gate model task result schema
 
@@ -55,10 +108,15 @@ class GateModelTaskResult(BraketSchemaBase):
             to set this value. Only default is allowed.
         measurements (list[list[int]]: List of lists, where each list represents a shot
             and each index of the list represents a qubit. Default is `None`.
+            Bit-packed `PackedMeasurements` are also accepted and decoded into this form.
+            When parsed with `parse_raw_numpy` or `parse_obj_numpy`, this is a 2-D `uint8`
+            numpy array of shape (shots, qubits) instead.
         measurementProbabilities (dict[str, float]): A dictionary of probabilistic results.
             Key is the measurements in a big endian binary string.
             Value is the probability the measurement occurred.
-            Default is `None`.
+            All keys must have the same length. Default is `None`.
+            When parsed in numpy mode with `probability_arrays=True`, this is a
+            `MeasurementProbabilityArrays` instead.
         measuredQubits (list[int]): The indices of the measured qubits.
             Indicates which qubits are in `measurements`. Default is `None`.
         resultTypes (list[ResultTypeValue]): Requested result types and their values.
@@ -67,7 +125,8 @@ class GateModelTaskResult(BraketSchemaBase):
             ``output``-declared variables. Each element is one shot, mapping each
             output variable name to its value (a scalar, or a homogeneous list for
             registers). An undefined value is represented by ``None``. Default is
-            `None`.
+            `None`. When parsed in numpy mode with `output_columns=True`, this is an
+            `OutputColumns` with one array per output variable instead.
         taskMetadata (TaskMetadata): The task metadata
         additionalMetadata (AdditionalMetadata): Additional metadata of the task
     """
@@ -80,18 +139,66 @@ class GateModelTaskResult(BraketSchemaBase):
         default=_GATE_MODEL_TASK_RESULT_HEADER, const=_GATE_MODEL_TASK_RESULT_HEADER
     )
     # fmt: off
-    measurements: conlist(conlist(conint(ge=0, le=1), min_items=1), min_items=1) | None
-    # fmt: on
-    measurementProbabilities: (
-        dict[constr(regex="^[01]+$", min_length=1), confloat(ge=0, le=1)] | None
+    measurements: (
+        conlist(conlist(conint(ge=0, le=1), min_items=1), min_items=1) | PackedMeasurements | None
     )
+    # fmt: on
+    measurementProbabilities: MeasurementProbabilities | None
     resultTypes: list[ResultTypeValue] | None
     measuredQubits: conlist(conint(ge=0), min_items=1) | None
     outputs: conlist(dict[constr(min_length=1), OutputValue], min_items=1) | None
     taskMetadata: TaskMetadata
     additionalMetadata: AdditionalMetadata
 
+    class Config:
+        json_dumps = dumps_with_arrays
+
+    @classmethod
+    def parse_obj_numpy(
+        cls, obj: Any, probability_arrays: bool = False, output_columns: bool = False
+    ) -> GateModelTaskResult:
+        """
+        Parses a result in numpy mode, see `NumpyParsingMixin.parse_obj_numpy`.
+
+        Args:
+            obj (Any): The decoded result.
+            probability_arrays (bool): Whether to also keep `measurementProbabilities` as
+                `MeasurementProbabilityArrays` instead of a dict. Default is `False`.
+            output_columns (bool): Whether to also keep `outputs` as `OutputColumns`,
+                validated in bulk, instead of one dict per shot. Outputs that are not regular
+                enough for the columnar form are validated and kept per shot. Default is `False`.
+
+        Returns:
+            GateModelTaskResult: The result. Serializing it with `json()` gives the same output
+            as a result parsed with `parse_obj`.
+
+        Raises:
+            ValidationError: If the result is not valid.
+        """
+        columns = None
+        if output_columns and isinstance(obj, dict) and obj.get("outputs") is not None:
+            try:
+                columns = OutputColumns.from_outputs(obj["outputs"])
+            except ValueError:
+                # Irregular or invalid outputs get the per-shot validation and its errors
+                pass
+            else:
+                obj = {key: value for key, value in obj.items() if key != "outputs"}
+        result = super().parse_obj_numpy(obj, probability_arrays=probability_arrays)
+        if columns is not None:
+            result.outputs = columns
+        return result
+
+    @validator("measurements", pre=True)
+    @skip_when_trusted(decode=unpack_measurements)
+    def validate_measurements(cls, value):
+        """
+        Decodes bit-packed measurements into the list form.
+        """
+        return unpack_measurements(value)
+
     @validator("outputs", each_item=True)
+    @skip_when_trusted()
     def validate_non_empty_shot(cls, shot):
         """
         Rejects empty per-shot dicts. Every declared output variable appears in
@@ -17,6 +17,8 @@ from pydantic.v1 import Field, confloat, constr
 from braket.schema_common import BraketSchemaBase, BraketSchemaHeader
 
 
+# Registered explicitly, as the class name is not the one derived from the header name
+@BraketSchemaBase.register_schema
 class IonQMetadata(BraketSchemaBase):
     """
     Metadata for results of IonQ tasks.
@@ -0,0 +1,185 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License
+
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic.v1 import errors
+from pydantic.v1.validators import dict_validator, str_validator
+
+from braket.schema_common._numpy import import_numpy
+
+_probability_schema = {"type": "number", "minimum": 0, "maximum": 1}
+_delete_binary_digits = str.maketrans("", "", "01")
+_is_non_negative = (0.0).__le__
+_is_at_most_one = (1.0).__ge__
+
+
+class MeasurementProbabilities:
+    """
+    Probabilities of measurement outcomes, keyed by the outcome as a big endian binary string.
+
+    This is the type of the `measurementProbabilities` fields of gate model results. It
+    accepts the values of `dict[constr(regex="^[01]+$", min_length=1), confloat(ge=0, le=1)]`
+    whose keys all have the same length, but checks all keys and all probabilities in bulk
+    passes instead of validating each entry on its own. Validation returns a plain dict.
+    """
+
+    @classmethod
+    def __get_validators__(cls):
+        yield dict_validator
+        yield cls.validate
+
+    @classmethod
+    def __modify_schema__(cls, field_schema: dict) -> None:
+        field_schema.update(
+            type="object",
+            patternProperties={"^[01]+$": _probability_schema},
+            additionalProperties=_probability_schema,
+        )
+
+    @classmethod
+    def validate(cls, value: dict) -> dict[str, float]:
+        """
+        Args:
+            value (dict): The probabilities by outcome.
+
+        Returns:
+            dict[str, float]: The probabilities by outcome, with keys coerced to str and
+            probabilities coerced to float.
+
+        Raises:
+            ValueError: If a key is not a non-empty binary string, the keys have different
+                lengths or a probability is not a number in [0, 1].
+        """
+        keys = list(value)
+        if not all(type(key) is str for key in keys):
+            keys = [str_validator(key) for key in keys]
+        if not all(keys) or "".join(keys).translate(_delete_binary_digits):
+            raise ValueError("measurement outcomes must be non-empty strings of 0s and 1s")
+        if len(set(map(len, keys))) > 1:
+            raise ValueError("measurement outcomes must have the same number of qubits")
+        try:
+            probabilities = list(map(float, value.values()))
+        except (TypeError, ValueError):
+            raise errors.FloatError()
+        if not (
+            all(map(_is_non_negative, probabilities)) and all(map(_is_at_most_one, probabilities))
+        ):
+            raise ValueError("measurement probabilities must be between 0 and 1")
+        return dict(zip(keys, probabilities))
+
+
+@dataclass(frozen=True, eq=False)
+class MeasurementProbabilityArrays:
+    """
+    Measurement probabilities as parallel numpy arrays of outcomes and their probabilities,
+    used by the numpy parse mode of gate model results instead of a dict. Requires numpy.
+
+    Attributes:
+        qubit_count (int): The number of qubits in each outcome.
+        indices (numpy.ndarray): The outcomes as `uint64` integers; the first qubit is the
+            most significant bit.
+        probabilities (numpy.ndarray): The `float64` probability of each outcome.
+
+    Arrays are equal if they have the same probability for each outcome, in any order, and
+    are equal to the same probabilities in dict form.
+
+    Examples:
+        >>> arrays = MeasurementProbabilityArrays.from_dict({"10": 0.5, "01": 0.5})
+        >>> arrays.indices
+        array([2, 1], dtype=uint64)
+        >>> arrays.to_dict()
+        {'10': 0.5, '01': 0.5}
+    """
+
+    qubit_count: int
+    indices: Any
+    probabilities: Any
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        if not isinstance(other, MeasurementProbabilityArrays):
+            return NotImplemented
+        np = import_numpy()
+        indices, probabilities = self._sorted()
+        other_indices, other_probabilities = other._sorted()
+        return (
+            self.qubit_count == other.qubit_count
+            and np.array_equal(indices, other_indices)
+            and np.array_equal(probabilities, other_probabilities)
+        )
+
+    def __hash__(self) -> int:
+        indices, probabilities = self._sorted()
+        # Adding 0 turns -0.0 into 0.0, so that equal arrays have the same bytes
+        return hash((self.qubit_count, indices.tobytes(), (probabilities + 0.0).tobytes()))
+
+    def _sorted(self) -> tuple[Any, Any]:
+        np = import_numpy()
+        indices = np.asarray(self.indices, dtype=np.uint64)
+        probabilities = np.asarray(self.probabilities, dtype=np.float64)
+        order = np.argsort(indices, kind="stable")
+        return indices[order], probabilities[order]
+
+    @classmethod
+    def from_dict(cls, probabilities: dict) -> MeasurementProbabilityArrays:
+        """
+        Validates and converts measurement probabilities in dict form with vectorized checks.
+        Unlike the dict form, all outcomes must have the same number of qubits, at most 64.
+
+        Args:
+            probabilities (dict): The probabilities by outcome.
+
+        Returns:
+            MeasurementProbabilityArrays: The probabilities as arrays, in the order of the dict.
+
+        Raises:
+            ValueError: If the outcomes are not binary strings of the same length, or a
+                probability is not a number in [0, 1].
+        """
+        np = import_numpy()
+        if not isinstance(probabilities, dict) or not probabilities:
+            raise ValueError("measurement probabilities must be a non-empty dict")
+        keys = list(probabilities)
+        qubit_count = len(keys[0]) if type(keys[0]) is str else 0
+        if not all(type(key) is str and len(key) == qubit_count for key in keys):
+            raise ValueError("measurement outcomes must be strings with the same length")
+        if not 0 < qubit_count <= 64:
+            raise ValueError("measurement outcomes must have between 1 and 64 qubits")
+        bits = np.frombuffer("".join(keys).encode(), dtype=np.uint8).reshape(len(keys), -1)
+        bits = bits - np.uint8(ord("0"))
+        if bits.shape[1] != qubit_count or (bits > 1).any():
+            raise ValueError("measurement outcomes must be strings of 0s and 1s")
+        weights = np.left_shift(np.uint64(1), np.arange(qubit_count - 1, -1, -1, dtype=np.uint64))
+        try:
+            values = np.fromiter(probabilities.values(), dtype=np.float64, count=len(keys))
+        except (TypeError, ValueError):
+            raise ValueError("measurement probabilities must be numbers")
+        if not ((values >= 0) & (values <= 1)).all():
+            raise ValueError("measurement probabilities must be between 0 and 1")
+        return cls(qubit_count, bits.astype(np.uint64) @ weights, values)
+
+    def to_dict(self) -> dict[str, float]:
+        """
+        Returns:
+            dict[str, float]: The probabilities by outcome as a big endian binary string.
+        """
+        return {
+            format(int(index), f"0{self.qubit_count}b"): probability
+            for index, probability in zip(self.indices, self.probabilities.tolist())
+        }
@@ -0,0 +1,160 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License
+
+
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic.v1 import BaseModel, ValidationError
+from pydantic.v1.error_wrappers import ErrorWrapper
+from pydantic.v1.parse import load_str_bytes
+from pydantic.v1.utils import ROOT_KEY
+
+from braket.schema_common import json_backend
+from braket.schema_common._numpy import import_numpy
+from braket.task_result.measurement_probabilities import MeasurementProbabilityArrays
+from braket.task_result.output_columns import OutputColumns
+from braket.task_result.packed_measurements_v1 import unpack_measurements
+
+
+def measurements_to_array(measurements: Any) -> Any:
+    """
+    Args:
+        measurements (Any): Measurements in list or bit-packed form.
+
+    Returns:
+        numpy.ndarray: The measurements as a 2-D `uint8` array of shape (shots, qubits).
+
+    Raises:
+        ValueError: If the measurements are empty, ragged or not all 0 or 1.
+    """
+    np = import_numpy()
+    try:
+        array = np.asarray(unpack_measurements(measurements, as_array=True))
+    except ValueError:
+        raise ValueError("measurements must have the same number of qubits in every shot")
+    if array.ndim != 2 or not array.size:
+        raise ValueError("measurements must be a non-empty list of non-empty shots")
+    if array.dtype.kind not in "biu" or ((array != 0) & (array != 1)).any():
+        raise ValueError("measurements must only contain 0 or 1")
+    return array.astype(np.uint8, copy=False)
+
+
+def dumps_with_arrays(payload: dict, **kwargs) -> str:
+    """
+    JSON dumps hook for results parsed in numpy mode, which writes `measurements`,
+    `measurementProbabilities` and `outputs` in their list and dict forms.
+    """
+    measurements = payload.get("measurements")
+    if hasattr(measurements, "tolist"):
+        payload["measurements"] = measurements.tolist()
+    probabilities = payload.get("measurementProbabilities")
+    if isinstance(probabilities, MeasurementProbabilityArrays):
+        payload["measurementProbabilities"] = probabilities.to_dict()
+    outputs = payload.get("outputs")
+    if isinstance(outputs, OutputColumns):
+        payload["outputs"] = outputs.to_outputs()
+    return json_backend.dumps(payload, **kwargs)
+
+
+def _field_equal(value: Any, other: Any) -> bool:
+    if hasattr(value, "__array__") or hasattr(other, "__array__"):
+        try:
+            return bool(import_numpy().array_equal(value, other))
+        except ValueError:
+            # A ragged list is not equal to an array
+            return False
+    return value == other
+
+
+class NumpyParsingMixin:
+    """
+    Adds numpy parse modes to gate model results with `measurements` and
+    `measurementProbabilities` fields. Models using it should set
+    `Config.json_dumps = dumps_with_arrays`.
+    """
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compares the fields as pydantic models do, except that `measurements` parsed into a
+        numpy array are equal to the same measurements in list form.
+        """
+        values = self.dict()
+        other_values = other.dict() if isinstance(other, BaseModel) else other
+        if not isinstance(other_values, dict) or values.keys() != other_values.keys():
+            return False
+        return all(_field_equal(value, other_values[name]) for name, value in values.items())
+
+    @classmethod
+    def parse_obj_numpy(cls, obj: Any, probability_arrays: bool = False) -> Any:
+        """
+        Parses a result with `measurements` decoded into a 2-D `uint8` numpy array.
+        The 0/1 and shape checks on the measurements are done as vector operations instead of
+        validating each bit, and all other fields are validated as in `parse_obj`.
+        Unlike `parse_obj`, every shot must have the same number of qubits.
+        Requires numpy.
+
+        Args:
+            obj (Any): The decoded result.
+            probability_arrays (bool): Whether to also keep `measurementProbabilities` as
+                `MeasurementProbabilityArrays` instead of a dict. Default is `False`.
+
+        Returns:
+            Any: The result, whose `measurements` is a numpy array if present. Serializing
+            it with `json()` gives the same output as a result parsed with `parse_obj`.
+
+        Raises:
+            ValidationError: If the result is not valid.
+        """
+        if not isinstance(obj, dict):
+            return cls.parse_obj(obj)
+        obj = dict(obj)
+        measurements = obj.pop("measurements", None)
+        probabilities = obj.pop("measurementProbabilities", None) if probability_arrays else None
+        result = cls.parse_obj(obj)
+        if measurements is not None:
+            try:
+                result.measurements = measurements_to_array(measurements)
+            except ValueError as e:
+                raise ValidationError([ErrorWrapper(e, loc="measurements")], cls)
+        if probabilities is not None:
+            try:
+                result.measurementProbabilities = MeasurementProbabilityArrays.from_dict(
+                    probabilities
+                )
+            except ValueError as e:
+                raise ValidationError([ErrorWrapper(e, loc="measurementProbabilities")], cls)
+        return result
+
+    @classmethod
+    def parse_raw_numpy(cls, json_str: str | bytes, **kwargs) -> Any:
+        """
+        Parses a JSON result with `measurements` decoded into a 2-D `uint8` numpy array.
+        See `parse_obj_numpy`.
+
+        Args:
+            json_str (str | bytes): The JSON string of the result.
+            **kwargs: Options of `parse_obj_numpy`, such as `probability_arrays`.
+
+        Returns:
+            Any: The result, whose `measurements` is a numpy array if present.
+
+        Raises:
+            ValidationError: If the result is not valid.
+        """
+        try:
+            obj = load_str_bytes(json_str, json_loads=cls.__config__.json_loads)
+        except (ValueError, TypeError, UnicodeDecodeError) as e:
+            raise ValidationError([ErrorWrapper(e, loc=ROOT_KEY)], cls)
+        return cls.parse_obj_numpy(obj, **kwargs)
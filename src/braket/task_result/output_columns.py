@@ -0,0 +1,174 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License
+
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import chain
+from operator import itemgetter
+from typing import Any
+
+from braket.schema_common._numpy import import_numpy
+
+_NoneType = type(None)
+
+# The dtype of a column by the Python types of its values, which may also include None
+_column_dtypes = {bool: "bool", int: "int64", float: "float64"}
+
+
+@dataclass(frozen=True, eq=False)
+class OutputColumn:
+    """
+    The values of one OpenQASM 3 output variable across all shots.
+
+    Attributes:
+        values (numpy.ndarray): A `bool`, `int64` or `float64` array of shape (shots,) for a
+            scalar variable, or (shots, width) for a register. Undefined values are 0.
+        mask (numpy.ndarray): A `bool` array of the same shape, `True` where the value is
+            undefined, represented by `None` in the per-shot form.
+    """
+
+    values: Any
+    mask: Any
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, OutputColumn):
+            return NotImplemented
+        np = import_numpy()
+        return np.array_equal(self.mask, other.mask) and np.array_equal(self.values, other.values)
+
+    def to_list(self) -> list:
+        """
+        Returns:
+            list: The value of each shot in the per-shot form, with `None` for undefined values.
+        """
+        if not self.mask.any():
+            return self.values.tolist()
+        values = self.values.astype(object)
+        values[self.mask] = None
+        return values.tolist()
+
+
+@dataclass(frozen=True, eq=False)
+class OutputColumns:
+    """
+    Columnar form of the `outputs` of a gate model result, with one typed array per output
+    variable instead of one dict per shot. Requires numpy.
+
+    Only regular outputs have a columnar form: every shot has the same variables in the same
+    order, and each variable has the same type in every shot, and the same width if it is a
+    register. Registers can not be undefined as a whole, only their elements.
+
+    Attributes:
+        shots (int): The number of shots.
+        columns (dict[str, OutputColumn]): The column of each output variable, in the order of
+            the variables in each shot.
+
+    Columns are compared element by element, and are equal to the same outputs in the
+    per-shot form.
+
+    Examples:
+        >>> columns = OutputColumns.from_outputs([{"c": [0, 1], "f": 0.5}, {"c": [1, None], "f": 1.5}])
+        >>> columns["c"].values
+        array([[0, 1],
+               [1, 0]])
+        >>> columns["c"].mask
+        array([[False, False],
+               [False,  True]])
+        >>> columns.to_outputs()
+        [{'c': [0, 1], 'f': 0.5}, {'c': [1, None], 'f': 1.5}]
+    """
+
+    shots: int
+    columns: dict[str, OutputColumn]
+
+    def __getitem__(self, name: str) -> OutputColumn:
+        return self.columns[name]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, list):
+            return self.to_outputs() == other
+        if not isinstance(other, OutputColumns):
+            return NotImplemented
+        return self.shots == other.shots and self.columns == other.columns
+
+    @classmethod
+    def from_outputs(cls, outputs: Any) -> OutputColumns:
+        """
+        Builds and validates the columns of per-shot outputs, checking the types and values
+        of each variable in bulk.
+
+        Args:
+            outputs (Any): The per-shot outputs, a list of dicts mapping each output variable
+                name to its value.
+
+        Returns:
+            OutputColumns: The outputs in columnar form.
+
+        Raises:
+            ValueError: If the outputs are not valid, or valid but not regular.
+        """
+        np = import_numpy()
+        if type(outputs) is not list or not outputs or type(outputs[0]) is not dict:
+            raise ValueError("outputs must be a non-empty list of dicts")
+        names = tuple(outputs[0])
+        if not names or not all(type(name) is str and name for name in names):
+            raise ValueError("output variable names must be non-empty strings")
+        if not all(type(shot) is dict and tuple(shot) == names for shot in outputs):
+            raise ValueError("every shot must have the same output variables")
+        columns = {}
+        for name in names:
+            shot_values = list(map(itemgetter(name), outputs))
+            width = None
+            if set(map(type, shot_values)) == {list}:
+                widths = set(map(len, shot_values))
+                if len(widths) != 1:
+                    raise ValueError(f"output register {name} must have the same width per shot")
+                width = widths.pop()
+                shot_values = list(chain.from_iterable(shot_values))
+            dtype = _column_dtype(set(map(type, shot_values)))
+            if dtype is None:
+                raise ValueError(f"output variable {name} must have the same type in every shot")
+            values = np.array(shot_values, dtype=object)
+            mask = np.equal(values, None)
+            values[mask] = 0
+            try:
+                values = values.astype(dtype)
+            except OverflowError:
+                raise ValueError(f"output variable {name} must fit in 64 bits")
+            if dtype == "float64" and not np.isfinite(values).all():
+                raise ValueError(f"output variable {name} must be finite")
+            if width is not None:
+                values = values.reshape(len(outputs), width)
+                mask = mask.reshape(len(outputs), width)
+            columns[name] = OutputColumn(values, mask.astype(bool))
+        return cls(len(outputs), columns)
+
+    def to_outputs(self) -> list[dict[str, Any]]:
+        """
+        Returns:
+            list[dict[str, Any]]: The outputs in the per-shot form, one dict per shot.
+        """
+        names = list(self.columns)
+        column_lists = [column.to_list() for column in self.columns.values()]
+        return [dict(zip(names, shot)) for shot in zip(*column_lists)]
+
+
+def _column_dtype(types: set[type]) -> str | None:
+    types.discard(_NoneType)
+    if not types:
+        return "bool"
+    if len(types) > 1:
+        return None
+    return _column_dtypes.get(types.pop())
@@ -0,0 +1,131 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License
+
+
+from __future__ import annotations
+
+import base64
+import binascii
+import math
+from typing import Any
+
+from pydantic.v1 import Field, PrivateAttr, conint, conlist, root_validator
+
+from braket.schema_common import BraketSchemaBase, BraketSchemaHeader
+from braket.schema_common._numpy import import_numpy
+
+# Bytes in one little endian complex128 value
+_COMPLEX_BYTES = 16
+
+
+class PackedComplexArray(BraketSchemaBase):
+    """
+    Binary encoding of a complex array, which can be used in place of the list of `[re, im]`
+    pairs in the value of a `StateVector` or `DensityMatrix` result type.
+
+    The values are stored as little endian complex128 in row-major order, base64 encoded.
+    Parsing only checks the length of the data; it is decoded into a read-only numpy array
+    on the first call to `to_array`, and the array is cached. Results whose state vector is
+    never read never decode it.
+
+    Attributes:
+        braketSchemaHeader (BraketSchemaHeader): Schema header. Users do not need
+            to set this value. Only default is allowed.
+        shape (list[int]): The shape of the array; one dimension for a state vector and two
+            for a density matrix.
+        data (str): The base64 encoded complex128 values.
+
+    Examples:
+        >>> packed = PackedComplexArray.from_values([[0.5, 0.5], [0.5, -0.5]])
+        >>> packed.shape
+        [2]
+        >>> packed.to_array()
+        array([0.5+0.5j, 0.5-0.5j])
+    """
+
+    _PACKED_COMPLEX_ARRAY_HEADER = BraketSchemaHeader(
+        name="braket.task_result.packed_complex_array", version="1"
+    )
+
+    braketSchemaHeader: BraketSchemaHeader = Field(
+        default=_PACKED_COMPLEX_ARRAY_HEADER, const=_PACKED_COMPLEX_ARRAY_HEADER
+    )
+    shape: conlist(conint(ge=1), min_items=1, max_items=2)
+    data: str
+
+    _array: Any = PrivateAttr(default=None)
+
+    @root_validator(skip_on_failure=True)
+    def validate_data_length(cls, values):
+        """
+        Checks that the data has the base64 length of one complex128 value per element,
+        without decoding it.
+        """
+        expected = 4 * -(-math.prod(values["shape"]) * _COMPLEX_BYTES // 3)
+        if len(values["data"]) != expected:
+            raise ValueError(f"data must have {expected} characters for shape {values['shape']}")
+        return values
+
+    @classmethod
+    def from_values(cls, values: Any) -> PackedComplexArray:
+        """
+        Packs a state vector or density matrix.
+
+        Args:
+            values (Any): The values, as nested lists of `[re, im]` pairs in the form of
+                result type values, or a complex numpy array. Requires numpy.
+
+        Returns:
+            PackedComplexArray: The packed array.
+
+        Raises:
+            ValueError: If the values are not a 1-D or 2-D array of complex numbers.
+        """
+        np = import_numpy()
+        if isinstance(values, (list, tuple)):
+            pairs = np.asarray(values, dtype=np.float64)
+            if pairs.ndim not in (2, 3) or pairs.shape[-1] != 2:
+                raise ValueError("values must be a list or matrix of [re, im] pairs")
+            array = pairs.view(np.complex128)[..., 0]
+        else:
+            array = np.asarray(values)
+            if array.ndim not in (1, 2) or array.dtype.kind not in "biufc":
+                raise ValueError("values must be a 1-D or 2-D numeric array")
+        data = np.ascontiguousarray(array, dtype="<c16").tobytes()
+        return cls(shape=list(array.shape), data=base64.b64encode(data).decode())
+
+    def to_array(self) -> Any:
+        """
+        Returns:
+            numpy.ndarray: The values as a read-only complex128 array with `shape`. It is
+            decoded on the first call and cached. Requires numpy.
+
+        Raises:
+            ValueError: If the data is not base64 encoded.
+        """
+        if self._array is None:
+            np = import_numpy()
+            try:
+                data = base64.b64decode(self.data, validate=True)
+            except binascii.Error:
+                raise ValueError("data must be base64 encoded")
+            self._array = np.frombuffer(data, dtype="<c16").reshape(self.shape)
+        return self._array
+
+    def to_values(self) -> list:
+        """
+        Returns:
+            list: The values as nested lists of `[re, im]` pairs, the list form of result
+            type values. Requires numpy.
+        """
+        return self.to_array().view(float).reshape(*self.shape, 2).tolist()
@@ -0,0 +1,179 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License
+
+
+from __future__ import annotations
+
+import base64
+import binascii
+from collections.abc import Iterator
+from itertools import chain
+from typing import Any
+
+from pydantic.v1 import Field, conint, conlist, root_validator
+
+from braket.schema_common import BraketSchemaBase, BraketSchemaHeader
+from braket.schema_common._numpy import import_numpy
+from braket.schema_common.schema_dispatch import SchemaDispatcher
+
+# The bits of each byte value, most significant bit first
+_byte_bits = [tuple((byte >> (7 - i)) & 1 for i in range(8)) for byte in range(256)]
+
+
+class PackedMeasurements(BraketSchemaBase):
+    """
+    Bit-packed encoding of gate model measurements, which can be used in place of the list of
+    shots in the `measurements` field of gate model and program set executable results.
+
+    Each shot is packed into `ceil(qubits / 8)` bytes, with the first qubit in the most
+    significant bit of the first byte and the unused bits of the last byte set to 0; this is
+    the layout of `numpy.packbits(measurements, axis=1)`. The packed shots are concatenated
+    and base64 encoded.
+
+    Attributes:
+        braketSchemaHeader (BraketSchemaHeader): Schema header. Users do not need
+            to set this value. Only default is allowed.
+        shape (list[int]): The number of shots and the number of qubits in each shot.
+        data (str): The base64 encoded bit-packed shots.
+
+    Examples:
+        >>> PackedMeasurements.from_measurements([[1, 0, 1], [0, 1, 1]])
+        PackedMeasurements(..., shape=[2, 3], data='oGA=')
+        >>> payload = result.dict()
+        >>> payload["measurements"] = PackedMeasurements.from_measurements(
+        ...     result.measurements
+        ... ).dict()
+        >>> GateModelTaskResult.parse_obj(payload) == result
+        True
+    """
+
+    _PACKED_MEASUREMENTS_HEADER = BraketSchemaHeader(
+        name="braket.task_result.packed_measurements", version="1"
+    )
+
+    braketSchemaHeader: BraketSchemaHeader = Field(
+        default=_PACKED_MEASUREMENTS_HEADER, const=_PACKED_MEASUREMENTS_HEADER
+    )
+    shape: conlist(conint(ge=1), min_items=2, max_items=2)
+    data: str
+
+    @root_validator(skip_on_failure=True)
+    def validate_data(cls, values):
+        """
+        Checks that the data decodes to exactly one packed row per shot,
+        with the padding bits of every row set to 0.
+        """
+        shots, qubits = values["shape"]
+        try:
+            packed = base64.b64decode(values["data"], validate=True)
+        except binascii.Error:
+            raise ValueError("data must be base64 encoded")
+        row_bytes = -(-qubits // 8)
+        if len(packed) != shots * row_bytes:
+            raise ValueError(
+                f"data must contain {shots * row_bytes} bytes for shape {shots, qubits}"
+            )
+        padding_mask = (1 << (row_bytes * 8 - qubits)) - 1
+        if padding_mask and any(
+            packed[i] & padding_mask for i in range(row_bytes - 1, len(packed), row_bytes)
+        ):
+            raise ValueError("padding bits must be 0")
+        return values
+
+    @classmethod
+    def from_measurements(cls, measurements: Any) -> PackedMeasurements:
+        """
+        Packs measurements in list form, or a 2-D numpy array of 0s and 1s.
+
+        Args:
+            measurements (Any): The measurements, a list of shots, each a list of 0s and 1s
+                with the same number of qubits, or a 2-D numpy array.
+
+        Returns:
+            PackedMeasurements: The packed measurements.
+
+        Raises:
+            ValueError: If the shots do not all have the same number of qubits or contain
+                values other than 0 and 1.
+        """
+        if not isinstance(measurements, (list, tuple)):
+            np = import_numpy()
+            array = np.asarray(measurements)
+            if array.ndim != 2 or ((array != 0) & (array != 1)).any():
+                raise ValueError("measurements must be a 2-D array of 0s and 1s")
+            data = np.packbits(array.astype(np.uint8, copy=False), axis=1).tobytes()
+            return cls(shape=list(array.shape), data=base64.b64encode(data).decode())
+        shots, qubits = len(measurements), len(measurements[0]) if measurements else 0
+        row_bytes = -(-qubits // 8)
+        padding = row_bytes * 8 - qubits
+        packed = bytearray()
+        for shot in measurements:
+            if len(shot) != qubits or not set(shot) <= {0, 1}:
+                raise ValueError("every shot must have the same number of qubits, each 0 or 1")
+            value = 0
+            for bit in shot:
+                value = (value << 1) | bit
+            packed += (value << padding).to_bytes(row_bytes, "big")
+        return cls(shape=[shots, qubits], data=base64.b64encode(packed).decode())
+
+    def iter_measurements(self) -> Iterator[list[int]]:
+        """
+        Yields:
+            list[int]: The measurements of each shot in list form, decoded one shot at a time.
+        """
+        shots, qubits = self.shape
+        packed = base64.b64decode(self.data)
+        row_bytes = -(-qubits // 8)
+        for start in range(0, shots * row_bytes, row_bytes):
+            yield list(
+                chain.from_iterable(_byte_bits[byte] for byte in packed[start : start + row_bytes])
+            )[:qubits]
+
+    def to_measurements(self) -> list[list[int]]:
+        """
+        Returns:
+            list[list[int]]: The measurements in list form, one list of 0s and 1s per shot.
+        """
+        return list(self.iter_measurements())
+
+    def to_array(self) -> Any:
+        """
+        Returns:
+            numpy.ndarray: The measurements as a `uint8` array of shape (shots, qubits).
+            Requires numpy.
+        """
+        np = import_numpy()
+        shots, qubits = self.shape
+        packed = np.frombuffer(base64.b64decode(self.data), dtype=np.uint8)
+        return np.unpackbits(packed.reshape(shots, -1), axis=1, count=qubits)
+
+
+_packed_measurements = SchemaDispatcher(PackedMeasurements)
+
+
+def unpack_measurements(value: Any, as_array: bool = False) -> Any:
+    """
+    Decodes bit-packed measurements, leaving any other value unchanged.
+
+    Args:
+        value (Any): The measurements, in list form or as a packed measurements object or dict.
+        as_array (bool): Whether to decode packed measurements into a numpy array instead of
+            the list form. Default: False.
+
+    Returns:
+        Any: The decoded measurements if `value` is packed, otherwise `value`.
+    """
+    value = _packed_measurements(value)
+    if not isinstance(value, PackedMeasurements):
+        return value
+    return value.to_array() if as_array else value.to_measurements()
@@ -12,15 +12,21 @@
 # language governing permissions and limitations under the License
 
 
-from pydantic.v1 import Field
+from pydantic.v1 import Field, validator
 
 from braket.ir.openqasm import Program
 from braket.schema_common.schema_base import BraketSchemaBase
+from braket.schema_common.schema_dispatch import SchemaDispatcher
 from braket.schema_common.schema_header import BraketSchemaHeader
+from braket.schema_common.trusted_construction import skip_when_trusted
 from braket.task_result.additional_metadata import AdditionalMetadata
 from braket.task_result.program_set_executable_failure_v1 import ProgramSetExecutableFailure
 from braket.task_result.program_set_executable_result_v1 import ProgramSetExecutableResult
 
+_valid_executable_results = SchemaDispatcher(
+    ProgramSetExecutableResult, ProgramSetExecutableFailure
+)
+
 
 class ProgramResult(BraketSchemaBase):
     """
@@ -46,3 +52,17 @@ class ProgramResult(BraketSchemaBase):
     executableResults: list[str] | list[ProgramSetExecutableResult | ProgramSetExecutableFailure]
     source: str | Program
     additionalMetadata: AdditionalMetadata
+
+    class Config:
+        smart_union = True
+
+    @validator("executableResults", pre=True)
+    @skip_when_trusted()
+    def validate_executable_results(cls, value):
+        """
+        Resolves each executable result or failure with a lookup on the name of its
+        schema header, so only the matching model is validated.
+        """
+        if isinstance(value, list):
+            return [_valid_executable_results(item) for item in value]
+        return value
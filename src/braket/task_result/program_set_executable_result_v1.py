@@ -12,28 +12,37 @@
 # language governing permissions and limitations under the License
 
 
-from pydantic.v1 import BaseModel, Field, confloat, conint, conlist, constr
+from pydantic.v1 import BaseModel, Field, conint, conlist, validator
 
 from braket.schema_common.schema_base import BraketSchemaBase
 from braket.schema_common.schema_header import BraketSchemaHeader
+from braket.schema_common.trusted_construction import skip_when_trusted
+from braket.task_result.measurement_probabilities import MeasurementProbabilities
+from braket.task_result.numpy_parsing import NumpyParsingMixin, dumps_with_arrays
+from braket.task_result.packed_measurements_v1 import PackedMeasurements, unpack_measurements
 
 
 class ProgramSetExecutableResultMetadata(BaseModel):
     """Metadata for successful program executable."""
 
 
-class ProgramSetExecutableResult(BraketSchemaBase):
+class ProgramSetExecutableResult(NumpyParsingMixin, BraketSchemaBase):
     """
     The result of a successful program set executable
 
     Attributes:
         inputsIndex (int): A reference to the inputs the program was run with.
         measurements (List[List[int]]: List of lists, where each list represents a shot
-            and each index of the list represents a qubit. Default is `None`.
+            and each index of the list represents a qubit. Bit-packed `PackedMeasurements`
+            are also accepted and decoded into this form. Default is `None`.
+            When parsed with `parse_raw_numpy` or `parse_obj_numpy`, this is a 2-D `uint8`
+            numpy array of shape (shots, qubits) instead.
         measurementProbabilities (dict[str, float]): A dictionary of probabilistic results.
             Key is the measurements in a big endian binary string.
             Value is the probability the measurement occurred.
-            Default is `None`.
+            All keys must have the same length. Default is `None`.
+            When parsed in numpy mode with `probability_arrays=True`, this is a
+            `MeasurementProbabilityArrays` instead.
         measuredQubits (List[int]): The indices of the measured qubits.
             Indicates which qubits are in `measurements`. Default is `None`.
     """
@@ -46,8 +55,19 @@ class ProgramSetExecutableResult(BraketSchemaBase):
     )
 
     inputsIndex: int
-    measurements: conlist(conlist(conint(ge=0, le=1), min_items=1), min_items=1) | None
-    measurementProbabilities: (
-        dict[constr(regex="^[01]+$", min_length=1), confloat(ge=0, le=1)] | None
+    measurements: (
+        conlist(conlist(conint(ge=0, le=1), min_items=1), min_items=1) | PackedMeasurements | None
     )
+    measurementProbabilities: MeasurementProbabilities | None
     measuredQubits: conlist(conint(ge=0), min_items=1) | None
+
+    class Config:
+        json_dumps = dumps_with_arrays
+
+    @validator("measurements", pre=True)
+    @skip_when_trusted(decode=unpack_measurements)
+    def validate_measurements(cls, value):
+        """
+        Decodes bit-packed measurements into the list form.
+        """
+        return unpack_measurements(value)
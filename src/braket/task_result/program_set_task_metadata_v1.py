@@ -12,7 +12,7 @@
 # language governing permissions and limitations under the License
 
 
-from pydantic.v1 import BaseModel, Field, conint, constr
+from pydantic.v1 import BaseModel, Field, conint, constr, validator
 
 from braket.device_schema.common.gate_model_device_parameters_v1 import GateModelDeviceParameters
 from braket.device_schema.ionq.ionq_device_parameters_v1 import IonqDeviceParameters
@@ -22,13 +22,23 @@ from braket.device_schema.simulators.gate_model_simulator_device_parameters_v1 i
     GateModelSimulatorDeviceParameters,
 )
 from braket.schema_common.schema_base import BraketSchemaBase
+from braket.schema_common.schema_dispatch import SchemaDispatcher
 from braket.schema_common.schema_header import BraketSchemaHeader
+from braket.schema_common.trusted_construction import skip_when_trusted
 from braket.task_result.program_set_executable_cancellation_v1 import (
     ProgramSetExecutableCancellationMetadata,
 )
 from braket.task_result.program_set_executable_failure_v1 import ProgramSetExecutableFailureMetadata
 from braket.task_result.program_set_executable_result_v1 import ProgramSetExecutableResultMetadata
 
+_valid_device_parameters = SchemaDispatcher(
+    GateModelSimulatorDeviceParameters,
+    IonqDeviceParameters,
+    IqmDeviceParameters,
+    RigettiDeviceParameters,
+    GateModelDeviceParameters,
+)
+
 
 class ProgramMetadata(BaseModel):
     """
@@ -94,3 +104,15 @@ class ProgramSetTaskMetadata(BraketSchemaBase):
     endedAt: constr(min_length=1, max_length=24) | None
     status: constr(min_length=1, max_length=20) | None
     totalFailedExecutables: int
+
+    class Config:
+        smart_union = True
+
+    @validator("deviceParameters", pre=True)
+    @skip_when_trusted()
+    def validate_device_parameters(cls, value):
+        """
+        Resolves the device parameters with a lookup on the name of their schema header,
+        so only the matching device parameters model is validated.
+        """
+        return _valid_device_parameters(value)
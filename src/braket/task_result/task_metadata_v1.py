@@ -12,7 +12,7 @@
 # language governing permissions and limitations under the License
 
 
-from pydantic.v1 import Field, conint, constr
+from pydantic.v1 import Field, conint, constr, validator
 
 from braket.device_schema.common.gate_model_device_parameters_v1 import GateModelDeviceParameters
 from braket.device_schema.dwave import (
@@ -27,6 +27,21 @@ from braket.device_schema.rigetti import RigettiDeviceParameters
 from braket.device_schema.simulators import GateModelSimulatorDeviceParameters
 from braket.device_schema.xanadu import XanaduDeviceParameters
 from braket.schema_common import BraketSchemaBase, BraketSchemaHeader
+from braket.schema_common.schema_dispatch import SchemaDispatcher
+from braket.schema_common.trusted_construction import skip_when_trusted
+
+_valid_device_parameters = SchemaDispatcher(
+    DwaveDeviceParameters,
+    DwaveAdvantageDeviceParameters,
+    Dwave2000QDeviceParameters,
+    RigettiDeviceParameters,
+    IonqDeviceParameters,
+    OqcDeviceParameters,
+    GateModelSimulatorDeviceParameters,
+    XanaduDeviceParameters,
+    IqmDeviceParameters,
+    GateModelDeviceParameters,
+)
 
 
 class TaskMetadata(BraketSchemaBase):
@@ -83,3 +98,15 @@ class TaskMetadata(BraketSchemaBase):
     endedAt: constr(min_length=1, max_length=24) | None
     status: constr(min_length=1, max_length=20) | None
     failureReason: constr(min_length=1) | None
+
+    class Config:
+        smart_union = True
+
+    @validator("deviceParameters", pre=True)
+    @skip_when_trusted()
+    def validate_device_parameters(cls, value):
+        """
+        Resolves the device parameters with a lookup on the name of their schema header,
+        so only the matching device parameters model is validated.
+        """
+        return _valid_device_parameters(value)
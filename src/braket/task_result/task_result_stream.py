@@ -0,0 +1,213 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License
+
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import IO, Any
+
+from pydantic.v1 import ValidationError
+from pydantic.v1.error_wrappers import ErrorWrapper
+from pydantic.v1.errors import MissingError
+from pydantic.v1.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
+from pydantic.v1.utils import ROOT_KEY
+
+from braket.schema_common import BraketSchemaBase
+from braket.schema_common.json_stream import DEFAULT_CHUNK_SIZE, JsonChunkReader
+from braket.schema_common.schema_dispatch import SchemaDispatcher
+from braket.task_result.analog_hamiltonian_simulation_task_result_v1 import (
+    AnalogHamiltonianSimulationTaskResult,
+)
+from braket.task_result.gate_model_task_result_v1 import GateModelTaskResult
+from braket.task_result.packed_measurements_v1 import PackedMeasurements
+from braket.task_result.photonic_model_task_result_v1 import PhotonicModelTaskResult
+
+_streamable_results = (
+    GateModelTaskResult,
+    AnalogHamiltonianSimulationTaskResult,
+    PhotonicModelTaskResult,
+)
+_packed_measurements = SchemaDispatcher(PackedMeasurements)
+
+
+class TaskResultStream:
+    """
+    Reads a gate model, analog Hamiltonian simulation or photonic task result from a file
+    object in chunks, yielding its shots one at a time.
+
+    Each shot in `measurements` is decoded and validated on its own as it is read, so memory
+    stays bounded by the chunk size and the size of one shot rather than the size of the
+    file. All other fields are validated as soon as they are read, and make up `result`, a
+    normal model whose `measurements` is `None`.
+
+    The file is read in a single pass. If `result` is accessed before `shots`, the shots are
+    read and discarded to reach the fields after them; the file is then rewound so `shots`
+    can still be read. If it is accessed while the shots are being read, the fields are read
+    in a separate pass. Both require a seekable file: on a pipe or a compressed stream,
+    `shots` can no longer be called after `result`, and `result` can not be accessed until
+    all shots are read.
+
+    Args:
+        file (IO): A text or binary file object positioned at the start of the result.
+        schema_class (type[BraketSchemaBase]): The result schema, one of
+            `GateModelTaskResult`, `AnalogHamiltonianSimulationTaskResult` and
+            `PhotonicModelTaskResult`.
+        chunk_size (int): The number of characters or bytes to read at a time.
+            Default: 1 MiB.
+
+    Raises:
+        ValueError: If `schema_class` is not a result schema with per-shot measurements.
+
+    Examples:
+        >>> with open("results.json", "rb") as f:
+        ...     stream = TaskResultStream(f, GateModelTaskResult)
+        ...     counts = Counter("".join(map(str, shot)) for shot in stream.shots())
+        ...     task_id = stream.result.taskMetadata.id
+    """
+
+    def __init__(
+        self,
+        file: IO,
+        schema_class: type[BraketSchemaBase],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        if schema_class not in _streamable_results:
+            raise ValueError(f"{schema_class.__name__} results can not be streamed")
+        self._file = file
+        self._schema_class = schema_class
+        self._chunk_size = chunk_size
+        self._start = file.tell() if file.seekable() else None
+        self._shot_field = _shot_field(schema_class.__fields__["measurements"])
+        self._members = None
+        self._result = None
+        self._shots = self._read()
+        self._shots_requested = False
+
+    def shots(self) -> Iterator[Any]:
+        """
+        Reads the shots. Can only be called once.
+
+        Yields:
+            Any: The validated measurements of each shot, in the form of an element of the
+            schema's `measurements`.
+
+        Raises:
+            ValidationError: If the result or a shot is not valid.
+            RuntimeError: If the shots have already been read, or were skipped to read
+                `result` and the file is not seekable.
+        """
+        if self._shots_requested:
+            raise RuntimeError("shots can only be read once")
+        if self._shots is None:
+            raise RuntimeError(
+                "shots were skipped to read result and the file can not be rewound; "
+                "read shots before result"
+            )
+        self._shots_requested = True
+        return self._shots
+
+    @property
+    def result(self) -> BraketSchemaBase:
+        """
+        BraketSchemaBase: The result without its measurements. If the shots are being
+        read, the fields after them are read in a separate pass, and the shots continue
+        where they were. The fields are validated as they are read, so the result is
+        constructed from them without validating them again.
+
+        Raises:
+            ValidationError: If the result is not valid.
+            RuntimeError: If the shots are being read and the file is not seekable.
+        """
+        if self._result is None:
+            if self._members is None and not self._shots_requested:
+                for _ in self._shots:
+                    pass
+                if self._start is None:
+                    self._shots = None
+                else:
+                    self._file.seek(self._start)
+                    self._shots = self._read()
+            elif self._members is None:
+                # The shots are being read, so the fields after them are read in a
+                # separate pass that leaves the file where the shots are
+                if self._start is None:
+                    raise RuntimeError(
+                        "result can not be read while the shots of a file that is not "
+                        "seekable are being read; read all shots first"
+                    )
+                position = self._file.tell()
+                self._file.seek(self._start)
+                for _ in self._read():
+                    pass
+                self._file.seek(position)
+            missing = [
+                ErrorWrapper(MissingError(), loc=name)
+                for name, field in self._schema_class.__fields__.items()
+                if field.required and name not in self._members
+            ]
+            if missing:
+                raise ValidationError(missing, self._schema_class)
+            self._result = self._schema_class.construct(set(self._members), **self._members)
+        return self._result
+
+    def _read(self) -> Iterator[Any]:
+        reader = JsonChunkReader(self._file, self._chunk_size)
+        members = {}
+        try:
+            for key in reader.iter_object():
+                if key == "measurements":
+                    yield from self._read_shots(reader)
+                elif key in self._schema_class.__fields__:
+                    members[key] = self._validate(key, reader.decode_value())
+                else:
+                    reader.decode_value()
+            reader.end()
+        except ValidationError:
+            raise
+        except ValueError as e:
+            raise ValidationError([ErrorWrapper(e, loc=ROOT_KEY)], self._schema_class)
+        if self._members is None:
+            self._members = members
+
+    def _read_shots(self, reader: JsonChunkReader) -> Iterator[Any]:
+        if reader.peek() != "[":
+            # Bit-packed or null measurements
+            value = _packed_measurements(reader.decode_value())
+            if isinstance(value, PackedMeasurements):
+                yield from value.iter_measurements()
+            else:
+                yield from self._validate("measurements", value) or ()
+            return
+        shot_field = self._shot_field
+        index = -1
+        for index, shot in enumerate(reader.iter_array()):
+            shot, error = shot_field.validate(shot, {}, loc=("measurements", index))
+            if error:
+                raise ValidationError([error], self._schema_class)
+            yield shot
+        if index < 0:
+            self._validate("measurements", [])
+
+    def _validate(self, name: str, value: Any) -> Any:
+        value, error = self._schema_class.__fields__[name].validate(value, {}, loc=name)
+        if error:
+            raise ValidationError([error], self._schema_class)
+        return value
+
+
+def _shot_field(field: ModelField) -> ModelField:
+    if field.shape == SHAPE_SINGLETON and field.sub_fields:
+        # A union of the list form and the packed form
+        field = next(member for member in field.sub_fields if member.shape == SHAPE_LIST)
+    return field.sub_fields[0]
@@ -0,0 +1,153 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+"""
+Benchmarks are not part of the unit test run. Run them on a single process with
+
+    pytest test/benchmarks -n 0
+
+Each benchmark reports the best and mean wall time over its rounds at the end of the session,
+and the throughput of benchmarks that set `benchmark.extra_info["bytes"]`. To track
+regressions between releases, write the results to a JSON file and compare a later run to it:
+
+    pytest test/benchmarks -n 0 --benchmark-json=before.json
+    pytest test/benchmarks -n 0 --benchmark-compare=before.json
+"""
+
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from importlib.metadata import version
+
+import pytest
+
+_results = []
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks")
+    group.addoption(
+        "--benchmark-json",
+        metavar="PATH",
+        help="Write the benchmark results and the environment they were run in to a JSON file.",
+    )
+    group.addoption(
+        "--benchmark-compare",
+        metavar="PATH",
+        help="Report the ratio of each min time to the one in a file from --benchmark-json.",
+    )
+
+
+class Benchmark:
+    def __init__(self, name):
+        self._name = name
+        # Recorded with each timing; "bytes" is the payload size used to report throughput
+        self.extra_info = {}
+
+    def __call__(self, func, *args, label=None, rounds=5, **kwargs):
+        """
+        Times `func(*args, **kwargs)` over the given number of rounds.
+
+        Args:
+            func (Callable): The function to time.
+            label (str | None): Suffix distinguishing several timings within one benchmark.
+            rounds (int): The number of times to call `func`. Default: 5.
+
+        Returns:
+            The return value of the last call to `func`.
+        """
+        timings = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            timings.append(time.perf_counter() - start)
+        self.record(timings, label=label)
+        return result
+
+    def record(self, timings, label=None):
+        """
+        Records timings measured outside of the benchmark, such as in a subprocess.
+
+        Args:
+            timings (list[float]): The wall time of each round in seconds.
+            label (str | None): Suffix distinguishing several timings within one benchmark.
+        """
+        _results.append(
+            {
+                "name": f"{self._name}[{label}]" if label else self._name,
+                "rounds": len(timings),
+                "min": min(timings),
+                "mean": statistics.mean(timings),
+                "max": max(timings),
+                "extra_info": dict(self.extra_info),
+            }
+        )
+
+
+@pytest.fixture
+def benchmark(request):
+    return Benchmark(request.node.name)
+
+
+def _throughput(result):
+    size = result["extra_info"].get("bytes")
+    return f"{size / result['min'] / 1e6:.1f}" if size else ""
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not _results:
+        return
+    compare_path = config.getoption("benchmark_compare")
+    baseline = {}
+    if compare_path:
+        with open(compare_path) as f:
+            baseline = {result["name"]: result for result in json.load(f)["benchmarks"]}
+    terminalreporter.section("benchmarks")
+    width = max(len(result["name"]) for result in _results)
+    header = f"{'name':<{width}}  {'min (ms)':>12}  {'mean (ms)':>12}  {'MB/s':>8}"
+    terminalreporter.write_line(header + (f"  {'vs base':>8}" if baseline else ""))
+    for result in _results:
+        line = (
+            f"{result['name']:<{width}}  {result['min'] * 1e3:>12.3f}  "
+            f"{result['mean'] * 1e3:>12.3f}  {_throughput(result):>8}"
+        )
+        if baseline:
+            base = baseline.get(result["name"])
+            ratio = f"{result['min'] / base['min']:.2f}x" if base else "new"
+            line += f"  {ratio:>8}"
+        terminalreporter.write_line(line)
+    json_path = config.getoption("benchmark_json")
+    if json_path:
+        with open(json_path, "w") as f:
+            json.dump(
+                {
+                    "datetime": datetime.now(timezone.utc).isoformat(),
+                    "machine": {
+                        "python": sys.version,
+                        "platform": platform.platform(),
+                        "processor": platform.processor(),
+                    },
+                    "versions": {
+                        package: version(package)
+                        for package in ("amazon-braket-schemas", "pydantic")
+                    },
+                    "benchmarks": _results,
+                },
+                f,
+                indent=2,
+            )
+        terminalreporter.write_line(f"benchmark results written to {json_path}")
@@ -0,0 +1,60 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import pytest
+from pydantic.v1 import BaseModel
+
+from braket.ir.ahs import Program as AHSProgram
+from braket.ir.annealing import Problem, ProblemType
+from braket.ir.blackbird import Program as BlackbirdProgram
+from braket.ir.jaqcd import CNot, H
+from braket.ir.jaqcd import Program as JaqcdProgram
+from braket.ir.openqasm import Program as OpenQASMProgram
+from braket.task_result import AdditionalMetadata
+
+
+class TrialUnionMetadata(BaseModel):
+    """The previous definition of `AdditionalMetadata.action`, validated member by member."""
+
+    action: JaqcdProgram | OpenQASMProgram | BlackbirdProgram | Problem | AHSProgram | None
+
+
+_time_series = {"values": [0.0, 2.5e7, 2.5e7, 0.0], "times": [0.0, 3.0e-7, 2.7e-6, 3.0e-6]}
+
+_actions = {
+    "jaqcd": JaqcdProgram(instructions=[H(target=0), CNot(control=0, target=1)]),
+    "openqasm": OpenQASMProgram(source="OPENQASM 3.0; cnot $0, $1;"),
+    "blackbird": BlackbirdProgram(source="name Test\nversion 1.0\nCoherent(0.5) | 0"),
+    "annealing": Problem(type=ProblemType.QUBO, linear={0: 0.3}, quadratic={"0,1": 0.6}),
+    "ahs": AHSProgram(
+        setup={"ahs_register": {"sites": [[0.0, 0.0], [0.0, 3.0e-6]], "filling": [1, 1]}},
+        hamiltonian={
+            "drivingFields": [
+                {
+                    field: {"time_series": _time_series, "pattern": "uniform"}
+                    for field in ("amplitude", "phase", "detuning")
+                }
+            ],
+            "localDetuning": [],
+        },
+    ),
+}
+
+
+@pytest.mark.parametrize("action_type", list(_actions))
+def test_action_dispatch(benchmark, action_type):
+    payloads = [{"action": _actions[action_type].dict()}] * 1_000
+    new = benchmark(lambda: [AdditionalMetadata.parse_obj(p) for p in payloads], label="header")
+    old = benchmark(lambda: [TrialUnionMetadata.parse_obj(p) for p in payloads], label="union")
+    assert new[0].action == old[0].action
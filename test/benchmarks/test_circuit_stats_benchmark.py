@@ -0,0 +1,39 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import io
+
+import pytest
+
+from braket.ir.jaqcd import Program
+from braket.ir.jaqcd.circuit_stats import compute_circuit_stats
+from braket.synthetic_payloads import synthetic_payload, write_json
+
+INSTRUCTIONS = 200_000
+
+
+@pytest.fixture(scope="module")
+def program():
+    file = io.StringIO()
+    write_json(synthetic_payload(Program, size=INSTRUCTIONS, qubits=16), file)
+    return Program.parse_raw(file.getvalue())
+
+
+def test_compute_circuit_stats(benchmark, program):
+    benchmark.extra_info["instructions"] = len(program.instructions)
+    benchmark(compute_circuit_stats, program, rounds=3)
+
+
+def test_cached_circuit_stats(benchmark, program):
+    program.circuit_stats()
+    benchmark(program.circuit_stats)
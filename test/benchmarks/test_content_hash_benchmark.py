@@ -0,0 +1,41 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import hashlib
+
+import pytest
+
+from braket.ir.jaqcd import Program
+from braket.schema_common.content_hash import content_hash
+from braket.synthetic_payloads import materialize, synthetic_payload
+
+INSTRUCTIONS = 200_000
+
+
+@pytest.fixture(scope="module")
+def program():
+    return Program.parse_obj(materialize(synthetic_payload(Program, size=INSTRUCTIONS, qubits=32)))
+
+
+def test_sorted_json_hash(benchmark, program):
+    benchmark(lambda: hashlib.sha256(program.json(sort_keys=True).encode()).hexdigest(), rounds=3)
+
+
+def test_content_hash(benchmark, program):
+    benchmark(content_hash, program, rounds=3)
+
+
+def test_memoized_content_hash(benchmark, program):
+    program.content_hash()
+    benchmark(program.content_hash, rounds=3)
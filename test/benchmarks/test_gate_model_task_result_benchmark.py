@@ -0,0 +1,37 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import random
+
+import pytest
+
+from braket.ir.openqasm import Program as OpenQASMProgram
+from braket.task_result import AdditionalMetadata, GateModelTaskResult, TaskMetadata
+
+
+@pytest.fixture(params=[(1_000, 20), (10_000, 100), (100_000, 100)], ids=lambda p: f"{p[0]}x{p[1]}")
+def gate_model_result_json(request):
+    shots, qubits = request.param
+    rng = random.Random(0)
+    return GateModelTaskResult(
+        measurements=[[rng.randint(0, 1) for _ in range(qubits)] for _ in range(shots)],
+        measuredQubits=list(range(qubits)),
+        taskMetadata=TaskMetadata(id="task_id", shots=shots, deviceId="device_id"),
+        additionalMetadata=AdditionalMetadata(action=OpenQASMProgram(source="OPENQASM 3.0;")),
+    ).json()
+
+
+def test_parse_raw_measurements(benchmark, gate_model_result_json):
+    benchmark(GateModelTaskResult.parse_raw, gate_model_result_json, label="lists", rounds=1)
+    benchmark(GateModelTaskResult.parse_raw_numpy, gate_model_result_json, label="numpy")
@@ -0,0 +1,64 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import random
+
+import pytest
+
+from braket.ir.jaqcd import Expectation, parse_hamiltonian
+from braket.ir.jaqcd.shared_models import Observable
+
+TERMS = 10_000
+
+
+@pytest.fixture(scope="module")
+def hamiltonian():
+    rng = random.Random(0)
+    return " + ".join(
+        f"{rng.uniform(-1, 1):.6f} * " + " @ ".join(rng.choices("ixyz", k=4)) for _ in range(TERMS)
+    )
+
+
+def _validate(observable):
+    # Parsed Hamiltonians are cached, so clear the cache to measure parsing
+    parse_hamiltonian.cache_clear()
+    return Expectation(observable=observable, targets=[0, 1, 2, 3])
+
+
+def _reject(observable):
+    try:
+        Observable(observable=observable)
+    except ValueError:
+        return
+    raise AssertionError("observable was accepted")
+
+
+def test_long_hamiltonian(benchmark, hamiltonian):
+    benchmark.extra_info["bytes"] = len(hamiltonian)
+    benchmark(_validate, hamiltonian, rounds=5)
+
+
+@pytest.mark.parametrize(
+    "observable",
+    [
+        "1" * 100_000,
+        "1." * 50_000,
+        "x" + " @ x" * 25_000 + " +",
+        "2 * x + " * 12_500 + "foo",
+    ],
+    ids=["digits", "dots", "dangling_plus", "trailing_garbage"],
+)
+def test_adversarial_hamiltonian(benchmark, observable):
+    benchmark.extra_info["bytes"] = len(observable)
+    benchmark(_reject, observable, rounds=5)
@@ -0,0 +1,68 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+subpackages = [
+    "braket.schema_common",
+    "braket.ir.ahs",
+    "braket.ir.annealing",
+    "braket.ir.blackbird",
+    "braket.ir.jaqcd",
+    "braket.ir.openqasm",
+    "braket.device_schema",
+    "braket.device_schema.dwave",
+    "braket.device_schema.ionq",
+    "braket.device_schema.pulse",
+    "braket.device_schema.quera",
+    "braket.device_schema.rigetti",
+    "braket.device_schema.simulators",
+    "braket.task_result",
+    "braket.jobs_data",
+]
+
+# Times importing a package in a fresh interpreter and, for packages that export lazily, then
+# importing everything it exports
+_cold_import_script = """
+import json, time
+start = time.perf_counter()
+package = __import__("{package}", fromlist=["__all__"])
+imported = time.perf_counter() - start
+exports = getattr(package, "__all__", None)
+for name in exports or []:
+    getattr(package, name)
+print(json.dumps([imported, time.perf_counter() - start if exports else None]))
+"""
+
+
+def _cold_import(package):
+    output = subprocess.run(
+        [sys.executable, "-c", _cold_import_script.format(package=package)],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+@pytest.mark.parametrize("package", subpackages)
+def test_cold_import(benchmark, package):
+    imports, exports = zip(*(_cold_import(package) for _ in range(3)))
+    benchmark.record(imports, label="import")
+    if None not in exports:
+        benchmark.record(exports, label="all_exports")
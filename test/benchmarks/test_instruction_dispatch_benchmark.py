@@ -0,0 +1,38 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import pytest
+
+from braket.ir.jaqcd import Program
+from braket.synthetic_payloads import materialize, synthetic_payload
+
+INSTRUCTIONS = 1_000_000
+
+
+@pytest.fixture(scope="module")
+def instruction_dicts():
+    return materialize(synthetic_payload(Program, size=INSTRUCTIONS, qubits=32))["instructions"]
+
+
+@pytest.fixture(scope="module")
+def instruction_models(instruction_dicts):
+    return Program(instructions=instruction_dicts).instructions
+
+
+def test_dispatch_dicts(benchmark, instruction_dicts):
+    benchmark(Program, instructions=instruction_dicts, rounds=1)
+
+
+def test_dispatch_models(benchmark, instruction_models):
+    benchmark(Program, instructions=instruction_models, rounds=3)
@@ -0,0 +1,64 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import io
+import tracemalloc
+
+import pytest
+
+from braket.ir.jaqcd import Program, set_instruction_interning
+from braket.synthetic_payloads import synthetic_payload, write_json
+
+INSTRUCTIONS = 200_000
+
+
+@pytest.fixture(scope="module")
+def program_json():
+    file = io.StringIO()
+    write_json(synthetic_payload(Program, size=INSTRUCTIONS, qubits=16), file)
+    return file.getvalue()
+
+
+@pytest.fixture
+def interning():
+    set_instruction_interning(True)
+    yield
+    set_instruction_interning(False)
+
+
+def _traced_memory(json_str):
+    tracemalloc.start()
+    try:
+        program = Program.parse_raw(json_str)  # noqa: F841
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def test_parse_without_interning(benchmark, program_json):
+    benchmark.extra_info["bytes"] = len(program_json)
+    benchmark.extra_info["memory"] = _traced_memory(program_json)
+    benchmark(Program.parse_raw, program_json, rounds=3)
+
+
+def test_parse_with_interning(benchmark, program_json, interning):
+    benchmark.extra_info["bytes"] = len(program_json)
+    benchmark.extra_info["memory"] = _traced_memory(program_json)
+    benchmark(Program.parse_raw, program_json, rounds=3)
+
+
+def test_compare_instructions(benchmark, program_json, interning):
+    first = Program.parse_raw(program_json).instructions
+    second = Program.parse_raw(program_json).instructions
+    benchmark(first.__eq__, second, rounds=3)
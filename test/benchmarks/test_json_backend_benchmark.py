@@ -0,0 +1,56 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import random
+
+import pytest
+
+from braket.ir.jaqcd import Expectation, H
+from braket.ir.jaqcd import Program as JaqcdProgram
+from braket.schema_common import BraketSchemaBase, get_json_backend, set_json_backend
+from braket.task_result import AdditionalMetadata, GateModelTaskResult, TaskMetadata
+
+rng = random.Random(0)
+result = GateModelTaskResult(
+    measurements=[[rng.randint(0, 1) for _ in range(20)] for _ in range(10_000)],
+    measuredQubits=list(range(20)),
+    resultTypes=[
+        {"type": Expectation(targets=[i], observable=["z"]), "value": rng.random()}
+        for i in range(20)
+    ],
+    taskMetadata=TaskMetadata(id="task_id", shots=10_000, deviceId="device_id"),
+    additionalMetadata=AdditionalMetadata(action=JaqcdProgram(instructions=[H(target=0)])),
+)
+result_json = result.json()
+
+
+@pytest.fixture(params=["json", "orjson", "msgspec"])
+def backend(request):
+    if request.param != "json":
+        pytest.importorskip(request.param)
+    previous = get_json_backend()
+    yield set_json_backend(request.param)
+    set_json_backend(previous)
+
+
+def test_parse_raw(benchmark, backend):
+    assert benchmark(GateModelTaskResult.parse_raw, result_json) == result
+
+
+def test_parse_raw_schema_trusted(benchmark, backend):
+    assert benchmark(BraketSchemaBase.parse_raw_schema, result_json, trusted=True) == result
+
+
+def test_json(benchmark, backend):
+    benchmark(result.json)
@@ -0,0 +1,54 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import numpy as np
+import pytest
+
+from braket.ir.jaqcd import Unitary, set_matrix_tolerance
+
+QUBITS = 10
+
+
+@pytest.fixture(scope="module")
+def unitary():
+    rng = np.random.default_rng(0)
+    dimension = 2**QUBITS
+    unitary, _ = np.linalg.qr(
+        rng.normal(size=(dimension, dimension)) + 1j * rng.normal(size=(dimension, dimension))
+    )
+    return unitary
+
+
+@pytest.fixture(scope="module")
+def unitary_pairs(unitary):
+    return np.stack((unitary.real, unitary.imag), axis=-1).tolist()
+
+
+@pytest.fixture
+def tolerance():
+    set_matrix_tolerance(1e-8)
+    yield
+    set_matrix_tolerance(None)
+
+
+def test_unitary_pairs(benchmark, unitary_pairs):
+    benchmark(Unitary, targets=list(range(QUBITS)), matrix=unitary_pairs, rounds=3)
+
+
+def test_unitary_array(benchmark, unitary):
+    benchmark(Unitary, targets=list(range(QUBITS)), matrix=unitary, rounds=3)
+
+
+def test_unitary_checked(benchmark, unitary, tolerance):
+    benchmark(Unitary, targets=list(range(QUBITS)), matrix=unitary, rounds=3)
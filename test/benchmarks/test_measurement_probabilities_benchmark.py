@@ -0,0 +1,41 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import random
+
+import pytest
+from pydantic.v1 import BaseModel, confloat, constr
+
+from braket.task_result import MeasurementProbabilities, MeasurementProbabilityArrays
+
+
+class RegexDistribution(BaseModel):
+    probabilities: dict[constr(regex="^[01]+$", min_length=1), confloat(ge=0, le=1)]
+
+
+class BulkDistribution(BaseModel):
+    probabilities: MeasurementProbabilities
+
+
+@pytest.fixture(params=[10, 20], ids=lambda qubits: f"2^{qubits}")
+def probabilities(request):
+    qubits = request.param
+    rng = random.Random(0)
+    return {format(i, f"0{qubits}b"): rng.random() / 2**qubits for i in range(2**qubits)}
+
+
+def test_measurement_probabilities(benchmark, probabilities):
+    benchmark(RegexDistribution, probabilities=probabilities, label="regex", rounds=1)
+    benchmark(BulkDistribution, probabilities=probabilities, label="bulk")
+    benchmark(MeasurementProbabilityArrays.from_dict, probabilities, label="arrays")
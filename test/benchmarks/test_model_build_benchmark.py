@@ -0,0 +1,87 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import importlib
+import importlib.util
+import pkgutil
+import time
+
+import pytest
+from pydantic.v1 import BaseModel, class_validators
+
+packages = [
+    "braket.ir.ahs",
+    "braket.ir.annealing",
+    "braket.ir.jaqcd",
+    "braket.ir.openqasm",
+    "braket.device_schema",
+    "braket.task_result",
+    "braket.jobs_data",
+]
+
+
+class _ReusableValidators(set):
+    def __contains__(self, item):
+        return False
+
+
+@pytest.fixture(autouse=True)
+def allow_validator_reuse(monkeypatch):
+    # Validator functions are registered globally, and building a class again registers its
+    # validators again
+    monkeypatch.setattr(class_validators, "_FUNCS", _ReusableValidators())
+
+
+def _modules(package_name):
+    package = importlib.import_module(package_name)
+    modules = [
+        importlib.import_module(info.name)
+        for info in pkgutil.walk_packages(package.__path__, f"{package_name}.")
+        if not info.ispkg
+    ]
+    return [module for module in modules if _models(module)]
+
+
+def _models(module):
+    return [
+        value
+        for value in vars(module).values()
+        if isinstance(value, type)
+        and issubclass(value, BaseModel)
+        and value.__module__ == module.__name__
+    ]
+
+
+def _build(modules):
+    """
+    Executes each module again in a new module object, which is not added to `sys.modules`,
+    so that only the classes of the module itself are built; its imports are already loaded.
+    """
+    for module in modules:
+        copy = importlib.util.module_from_spec(module.__spec__)
+        module.__spec__.loader.exec_module(copy)
+
+
+@pytest.mark.parametrize("package", packages)
+def test_model_build(benchmark, package):
+    modules = _modules(package)
+    models = sum(len(_models(module)) for module in modules)
+    benchmark.extra_info["models"] = models
+    timings = []
+    for _ in range(5):
+        start = time.perf_counter()
+        _build(modules)
+        timings.append(time.perf_counter() - start)
+    benchmark.record(timings, label="all_models")
+    benchmark.record([timing / models for timing in timings], label="per_model")
@@ -0,0 +1,50 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import random
+
+import pytest
+
+from braket.ir.openqasm import Program as OpenQASMProgram
+from braket.task_result import AdditionalMetadata, GateModelTaskResult, TaskMetadata
+
+
+@pytest.fixture(params=[10_000, 100_000], ids=lambda shots: f"{shots}shots")
+def outputs_result_json(request):
+    shots = request.param
+    rng = random.Random(0)
+    return GateModelTaskResult(
+        outputs=[
+            {
+                "c": [rng.randint(0, 1) for _ in range(8)],
+                "flag": rng.random() < 0.5,
+                "count": rng.randint(0, 100),
+                "angle": rng.random(),
+                "undefined": None,
+            }
+            for _ in range(shots)
+        ],
+        taskMetadata=TaskMetadata(id="task_id", shots=shots, deviceId="device_id"),
+        additionalMetadata=AdditionalMetadata(action=OpenQASMProgram(source="OPENQASM 3.0;")),
+    ).json()
+
+
+def test_parse_raw_outputs(benchmark, outputs_result_json):
+    benchmark(GateModelTaskResult.parse_raw, outputs_result_json, label="per-shot", rounds=1)
+    benchmark(
+        GateModelTaskResult.parse_raw_numpy,
+        outputs_result_json,
+        output_columns=True,
+        label="columns",
+    )
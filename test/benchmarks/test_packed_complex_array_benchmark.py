@@ -0,0 +1,52 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import numpy as np
+import pytest
+
+from braket.ir.jaqcd import StateVector
+from braket.ir.openqasm import Program as OpenQASMProgram
+from braket.task_result import (
+    AdditionalMetadata,
+    GateModelTaskResult,
+    PackedComplexArray,
+    TaskMetadata,
+)
+
+
+@pytest.fixture(params=[16, 20], ids=lambda qubits: f"{qubits}q")
+def state_vector(request):
+    rng = np.random.default_rng(0)
+    size = 2**request.param
+    return rng.normal(size=size) + 1j * rng.normal(size=size)
+
+
+def _result_json(value):
+    return GateModelTaskResult(
+        resultTypes=[{"type": StateVector(), "value": value}],
+        taskMetadata=TaskMetadata(id="task_id", shots=0, deviceId="device_id"),
+        additionalMetadata=AdditionalMetadata(action=OpenQASMProgram(source="OPENQASM 3.0;")),
+    ).json()
+
+
+def _parse_state_vector(result_json):
+    return GateModelTaskResult.parse_raw(result_json).resultTypes[0].value.to_array()
+
+
+def test_parse_raw_state_vector(benchmark, state_vector):
+    pairs_json = _result_json(np.stack([state_vector.real, state_vector.imag], -1).tolist())
+    packed_json = _result_json(PackedComplexArray.from_values(state_vector))
+    benchmark(GateModelTaskResult.parse_raw, pairs_json, label="pairs", rounds=1)
+    benchmark(GateModelTaskResult.parse_raw, packed_json, label="packed")
+    benchmark(_parse_state_vector, packed_json, label="packed+to_array")
@@ -0,0 +1,51 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import io
+import tracemalloc
+
+import pytest
+
+from braket.ir.jaqcd import PackedProgram, Program
+from braket.synthetic_payloads import synthetic_payload, write_json
+
+
+@pytest.fixture(params=[100_000, 1_000_000], ids=lambda count: f"{count}instructions")
+def program_json(request):
+    file = io.StringIO()
+    write_json(synthetic_payload(Program, size=request.param, qubits=32), file)
+    return file.getvalue()
+
+
+def _traced_memory(func, *args):
+    tracemalloc.start()
+    try:
+        result = func(*args)
+        return result, tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def test_packed_program(benchmark, program_json):
+    benchmark.extra_info["bytes"] = len(program_json)
+    # Imports numpy outside of the traced allocations
+    PackedProgram.parse_obj({"instructions": []})
+    program, program_memory = _traced_memory(Program.parse_raw, program_json)
+    packed, packed_memory = _traced_memory(PackedProgram.parse_raw, program_json)
+    benchmark.extra_info["memory"] = {"models": program_memory, "packed": packed_memory}
+    assert packed_memory < program_memory / 5
+    del program
+    benchmark(Program.parse_raw, program_json, label="models", rounds=1)
+    benchmark(PackedProgram.parse_raw, program_json, label="packed", rounds=3)
+    benchmark(packed.to_program, label="to_program", rounds=1)
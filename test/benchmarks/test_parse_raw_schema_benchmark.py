@@ -0,0 +1,49 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import random
+
+import pytest
+
+from braket.ir.openqasm import Program as OpenQASMProgram
+from braket.schema_common import BraketSchemaBase
+from braket.task_result import AdditionalMetadata, GateModelTaskResult, TaskMetadata
+
+
+def _double_parse(json_str):
+    schema = BraketSchemaBase.parse_raw(json_str)
+    schema_class = BraketSchemaBase.get_registered_schema_class(schema.braketSchemaHeader)
+    return schema_class.parse_raw(json_str)
+
+
+@pytest.fixture(params=[(100, 10), (10_000, 20), (50_000, 40)], ids=lambda p: f"{p[0]}x{p[1]}")
+def gate_model_result_json(request):
+    shots, qubits = request.param
+    rng = random.Random(0)
+    return GateModelTaskResult(
+        measurements=[[rng.randint(0, 1) for _ in range(qubits)] for _ in range(shots)],
+        measuredQubits=list(range(qubits)),
+        taskMetadata=TaskMetadata(id="task_id", shots=shots, deviceId="device_id"),
+        additionalMetadata=AdditionalMetadata(
+            action=OpenQASMProgram(source="OPENQASM 3.0; bit[2] b; b = measure $0;")
+        ),
+    ).json()
+
+
+def test_parse_raw_schema(benchmark, gate_model_result_json):
+    single = benchmark(
+        BraketSchemaBase.parse_raw_schema, gate_model_result_json, label="single_decode"
+    )
+    double = benchmark(_double_parse, gate_model_result_json, label="double_decode")
+    assert single == double
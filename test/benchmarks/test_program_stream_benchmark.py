@@ -0,0 +1,59 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import io
+import tracemalloc
+
+import pytest
+
+from braket.ir.jaqcd import Program, iter_program
+from braket.synthetic_payloads import synthetic_payload, write_json
+
+INSTRUCTIONS = 200_000
+
+
+@pytest.fixture(scope="module")
+def program_bytes():
+    file = io.StringIO()
+    write_json(synthetic_payload(Program, size=INSTRUCTIONS, qubits=16), file)
+    return file.getvalue().encode()
+
+
+def _stream(program_bytes):
+    for _ in iter_program(io.BytesIO(program_bytes)):
+        pass
+
+
+def _parse(program_bytes):
+    Program.parse_raw(program_bytes)
+
+
+def _peak_memory(func, program_bytes):
+    tracemalloc.start()
+    try:
+        func(program_bytes)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_parse_program(benchmark, program_bytes):
+    benchmark.extra_info["bytes"] = len(program_bytes)
+    benchmark.extra_info["peak_memory"] = _peak_memory(_parse, program_bytes)
+    benchmark(_parse, program_bytes, rounds=3)
+
+
+def test_stream_program(benchmark, program_bytes):
+    benchmark.extra_info["bytes"] = len(program_bytes)
+    benchmark.extra_info["peak_memory"] = _peak_memory(_stream, program_bytes)
+    benchmark(_stream, program_bytes, rounds=3)
@@ -0,0 +1,51 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import pytest
+from pydantic.v1 import BaseModel
+
+from braket.ir.jaqcd import Expectation, H, Probability, StateVector, Variance
+from braket.ir.jaqcd.program_v1 import Program, Results
+from braket.task_result import ResultTypeValue
+
+
+class TrialUnionResults(BaseModel):
+    """The previous definition of `Program.results`, validated member by member."""
+
+    results: list[Results]
+
+
+def _results(count):
+    result_types = [
+        Probability(targets=[0]),
+        Expectation(targets=[0], observable=["z"]),
+        Variance(targets=[0], observable=["x"]),
+        StateVector(),
+    ]
+    return [result_types[i % len(result_types)].dict() for i in range(count)]
+
+
+@pytest.mark.parametrize("count", [10, 100, 1_000])
+def test_program_results(benchmark, count):
+    results = _results(count)
+    instructions = [H(target=0).dict()]
+    new = benchmark(Program.parse_obj, {"instructions": instructions, "results": results})
+    old = benchmark(TrialUnionResults.parse_obj, {"results": results}, label="union")
+    assert new.results == old.results
+
+
+@pytest.mark.parametrize("count", [1_000])
+def test_result_type_values(benchmark, count):
+    values = [{"type": result, "value": 0.5} for result in _results(count)]
+    benchmark(lambda: [ResultTypeValue.parse_obj(value) for value in values])
@@ -0,0 +1,271 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import json
+import math
+import random
+
+import pytest
+
+from braket.device_schema.dwave import DwaveDeviceCapabilities
+from braket.device_schema.pulse import NativeGateCalibrations
+from braket.device_schema.rigetti import RigettiDeviceCapabilities
+from braket.ir.ahs import Program as AHSProgram
+from braket.ir.jaqcd import Program as JaqcdProgram
+from braket.ir.openqasm import ProgramSet
+from braket.task_result import GateModelTaskResult
+
+ROUNDS = {"small": 20, "medium": 5, "huge": 1}
+
+_service = {
+    "executionWindows": [
+        {"executionDay": "Everyday", "windowStartHour": "09:00", "windowEndHour": "19:00"}
+    ],
+    "shotsRange": [1, 10_000],
+}
+
+
+def _gate_model_task_result(rng, size):
+    shots, qubits = {"small": (10, 4), "medium": (1_000, 20), "huge": (100_000, 32)}[size]
+    return {
+        "measurements": [[rng.randint(0, 1) for _ in range(qubits)] for _ in range(shots)],
+        "measuredQubits": list(range(qubits)),
+        "taskMetadata": {"id": "task_id", "shots": shots, "deviceId": "device_id"},
+        "additionalMetadata": {"action": {"source": "OPENQASM 3.0;"}},
+    }
+
+
+def _jaqcd_program(rng, size):
+    count = {"small": 10, "medium": 1_000, "huge": 100_000}[size]
+    gates = [
+        lambda: {"type": "h", "target": rng.randrange(32)},
+        lambda: {"type": "cnot", "control": rng.randrange(16), "target": 16 + rng.randrange(16)},
+        lambda: {"type": "rx", "target": rng.randrange(32), "angle": rng.uniform(0, math.tau)},
+    ]
+    return {
+        "instructions": [rng.choice(gates)() for _ in range(count)],
+        "results": [{"type": "probability", "targets": [0, 1]}],
+    }
+
+
+def _program_set(rng, size):
+    count = {"small": 2, "medium": 100, "huge": 10_000}[size]
+    source = "OPENQASM 3.0;\ninput float theta;\nqubit[2] q;\nh q[0];\nrx(theta) q[1];\n"
+    return {
+        "programs": [
+            {"source": source, "inputs": {"theta": [rng.uniform(0, math.tau) for _ in range(10)]}}
+            for _ in range(count)
+        ]
+    }
+
+
+def _ahs_program(rng, size):
+    atoms, points = {"small": (4, 4), "medium": (100, 100), "huge": (1_000, 10_000)}[size]
+    times = [i * 4e-6 / (points - 1) for i in range(points)]
+
+    def uniform_field():
+        return {
+            "time_series": {"values": [rng.uniform(0, 1.5e7) for _ in times], "times": times},
+            "pattern": "uniform",
+        }
+
+    return {
+        "setup": {
+            "ahs_register": {
+                "sites": [[(i % 32) * 5e-6, (i // 32) * 5e-6] for i in range(atoms)],
+                "filling": [rng.randint(0, 1) for _ in range(atoms)],
+            }
+        },
+        "hamiltonian": {
+            "drivingFields": [
+                {
+                    "amplitude": uniform_field(),
+                    "phase": uniform_field(),
+                    "detuning": uniform_field(),
+                }
+            ],
+            "localDetuning": [
+                {
+                    "magnitude": {
+                        "time_series": uniform_field()["time_series"],
+                        "pattern": [rng.random() for _ in range(atoms)],
+                    }
+                }
+            ],
+        },
+    }
+
+
+def _dwave_device_capabilities(rng, size):
+    qubits = {"small": 8, "medium": 2_000, "huge": 20_000}[size]
+    ranges = [-1.0, 1.0]
+    return {
+        "provider": {
+            "annealingOffsetStep": 1.45,
+            "annealingOffsetStepPhi0": 1.45,
+            "annealingOffsetRanges": [[-0.5, 0.5] for _ in range(qubits)],
+            "annealingDurationRange": [1, 2000],
+            "couplers": [[i, (i + step) % qubits] for i in range(qubits) for step in (1, 4, 8)],
+            "defaultAnnealingDuration": 20,
+            "defaultProgrammingThermalizationDuration": 1000,
+            "defaultReadoutThermalizationDuration": 0,
+            "extendedJRange": ranges,
+            "hGainScheduleRange": ranges,
+            "hRange": ranges,
+            "jRange": ranges,
+            "maximumAnnealingSchedulePoints": 12,
+            "maximumHGainSchedulePoints": 20,
+            "perQubitCouplingRange": ranges,
+            "programmingThermalizationDurationRange": [0, 10000],
+            "qubits": list(range(qubits)),
+            "qubitCount": qubits,
+            "quotaConversionRate": 1,
+            "readoutThermalizationDurationRange": [0, 10000],
+            "taskRunDurationRange": [0, 1000000],
+            "topology": {"type": "pegasus", "shape": [16]},
+        },
+        "service": _service,
+        "action": {
+            "braket.ir.annealing.problem": {
+                "actionType": "braket.ir.annealing.problem",
+                "version": ["1"],
+            }
+        },
+        "deviceParameters": {},
+    }
+
+
+def _rigetti_device_capabilities(rng, size):
+    qubits = {"small": 4, "medium": 100, "huge": 2_000}[size]
+    edges = [(i, i + 1) for i in range(qubits - 1)]
+    return {
+        "service": _service,
+        "action": {
+            "braket.ir.jaqcd.program": {
+                "actionType": "braket.ir.jaqcd.program",
+                "version": ["1"],
+                "supportedOperations": ["x", "rx", "rz", "cz"],
+            }
+        },
+        "paradigm": {
+            "qubitCount": qubits,
+            "nativeGateSet": ["rx", "rz", "cz"],
+            "connectivity": {
+                "fullyConnected": False,
+                "connectivityGraph": {str(i): [str(j)] for i, j in edges},
+            },
+        },
+        "deviceParameters": {},
+        "standardized": {
+            "oneQubitProperties": {
+                str(i): {
+                    "T1": {"value": rng.uniform(10, 50), "standardError": 0.01, "unit": "us"},
+                    "T2": {"value": rng.uniform(10, 50), "standardError": 0.02, "unit": "us"},
+                    "oneQubitFidelity": [
+                        {"fidelityType": {"name": "READOUT"}, "fidelity": rng.random()},
+                        {
+                            "fidelityType": {"name": "RANDOMIZED_BENCHMARKING"},
+                            "fidelity": rng.random(),
+                        },
+                    ],
+                }
+                for i in range(qubits)
+            },
+            "twoQubitProperties": {
+                f"{i}-{j}": {
+                    "twoQubitGateFidelity": [
+                        {
+                            "direction": {"control": i, "target": j},
+                            "gateName": "CZ",
+                            "fidelity": rng.random(),
+                            "fidelityType": {"name": "INTERLEAVED_RANDOMIZED_BENCHMARKING"},
+                        }
+                    ]
+                }
+                for i, j in edges
+            },
+        },
+    }
+
+
+def _native_gate_calibrations(rng, size):
+    qubits = {"small": 2, "medium": 100, "huge": 2_000}[size]
+
+    def play(qubit, waveform):
+        return {
+            "name": "play",
+            "arguments": [
+                {"name": "frame", "value": f"q{qubit}_rf_frame", "type": "frame"},
+                {"name": "waveform", "value": waveform, "type": "waveform"},
+            ],
+        }
+
+    gates = {
+        str(q): {
+            "rx": [
+                {
+                    "name": "rx",
+                    "qubits": [str(q)],
+                    "arguments": [str(angle)],
+                    "calibrations": [play(q, f"wf_drag_gaussian_{q}")],
+                }
+                for angle in (1.5707963267948966, -1.5707963267948966)
+            ],
+            "cz": [
+                {
+                    "name": "cz",
+                    "qubits": [str(q), str((q + 1) % qubits)],
+                    "arguments": [],
+                    "calibrations": [play(q, f"q{q}_cz")],
+                }
+            ],
+        }
+        for q in range(qubits)
+    }
+    waveforms = {}
+    for q in range(qubits):
+        waveforms[f"wf_drag_gaussian_{q}"] = {
+            "waveformId": f"wf_drag_gaussian_{q}",
+            "name": "drag_gaussian",
+            "arguments": [
+                {"name": name, "value": rng.random(), "type": "float"}
+                for name in ("length", "sigma", "amplitude", "beta")
+            ],
+        }
+        waveforms[f"q{q}_cz"] = {
+            "waveformId": f"q{q}_cz",
+            "amplitudes": [[rng.random(), 0.0] for _ in range(100)],
+        }
+    return {"gates": gates, "waveforms": waveforms}
+
+
+schemas = {
+    "gate_model_task_result": (GateModelTaskResult, _gate_model_task_result),
+    "jaqcd_program": (JaqcdProgram, _jaqcd_program),
+    "program_set": (ProgramSet, _program_set),
+    "ahs_program": (AHSProgram, _ahs_program),
+    "dwave_device_capabilities": (DwaveDeviceCapabilities, _dwave_device_capabilities),
+    "rigetti_device_capabilities": (RigettiDeviceCapabilities, _rigetti_device_capabilities),
+    "native_gate_calibrations": (NativeGateCalibrations, _native_gate_calibrations),
+}
+
+
+@pytest.mark.parametrize("size", ROUNDS)
+@pytest.mark.parametrize("schema", schemas)
+def test_throughput(benchmark, schema, size):
+    schema_class, build = schemas[schema]
+    json_str = json.dumps(build(random.Random(0), size))
+    benchmark.extra_info["bytes"] = len(json_str)
+    parsed = benchmark(schema_class.parse_raw, json_str, label="parse_raw", rounds=ROUNDS[size])
+    benchmark(parsed.json, label="json", rounds=ROUNDS[size])
@@ -0,0 +1,56 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import random
+
+import pytest
+
+from braket.ir.openqasm import Program as OpenQASMProgram
+from braket.task_result import (
+    AdditionalMetadata,
+    GateModelTaskResult,
+    TaskMetadata,
+    TaskResultStream,
+)
+
+
+@pytest.fixture(params=[(10_000, 100), (100_000, 100)], ids=lambda p: f"{p[0]}x{p[1]}")
+def gate_model_result_path(request, tmp_path):
+    shots, qubits = request.param
+    rng = random.Random(0)
+    path = tmp_path / "results.json"
+    path.write_text(
+        GateModelTaskResult(
+            measurements=[[rng.randint(0, 1) for _ in range(qubits)] for _ in range(shots)],
+            measuredQubits=list(range(qubits)),
+            taskMetadata=TaskMetadata(id="task_id", shots=shots, deviceId="device_id"),
+            additionalMetadata=AdditionalMetadata(action=OpenQASMProgram(source="OPENQASM 3.0;")),
+        ).json()
+    )
+    return path
+
+
+def _parse_file(path):
+    return GateModelTaskResult.parse_raw(path.read_bytes()).measurements
+
+
+def _stream_file(path):
+    with path.open("rb") as file:
+        for _ in TaskResultStream(file, GateModelTaskResult).shots():
+            pass
+
+
+def test_stream_gate_model_result(benchmark, gate_model_result_path):
+    benchmark(_parse_file, gate_model_result_path, label="parse_raw", rounds=1)
+    benchmark(_stream_file, gate_model_result_path, label="stream", rounds=1)
@@ -0,0 +1,149 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import json
+import random
+
+import pytest
+
+from braket.device_schema.simulators import GateModelSimulatorDeviceCapabilities
+from braket.ir.ahs import Program as AHSProgram
+from braket.ir.annealing import Problem, ProblemType
+from braket.ir.jaqcd import CNot, Expectation, H, Rx
+from braket.ir.jaqcd import Program as JaqcdProgram
+from braket.ir.openqasm import Program as OpenQASMProgram
+from braket.schema_common import BraketSchemaBase
+from braket.task_result import (
+    AdditionalMetadata,
+    AnalogHamiltonianSimulationTaskResult,
+    AnnealingTaskResult,
+    GateModelTaskResult,
+    PhotonicModelTaskResult,
+    TaskMetadata,
+)
+
+rng = random.Random(0)
+task_metadata = TaskMetadata(id="task_id", shots=1000, deviceId="device_id")
+jaqcd_program = JaqcdProgram(
+    instructions=[
+        [H(target=i % 20), CNot(control=i % 20, target=(i + 1) % 20), Rx(target=i % 20, angle=0.1)][
+            i % 3
+        ]
+        for i in range(10_000)
+    ],
+    results=[Expectation(targets=[0], observable=["z"])],
+)
+ahs_program = AHSProgram(
+    setup={"ahs_register": {"sites": [[i * 4e-6, 0] for i in range(100)], "filling": [1] * 100}},
+    hamiltonian={
+        "drivingFields": [
+            {
+                field: {
+                    "time_series": {
+                        "values": [0.0] + [1.5e7] * 98 + [0.0],
+                        "times": [i * 4e-8 for i in range(100)],
+                    },
+                    "pattern": "uniform",
+                }
+                for field in ("amplitude", "phase", "detuning")
+            }
+        ],
+        "localDetuning": [],
+    },
+)
+
+schemas = {
+    "jaqcd_program": jaqcd_program,
+    "openqasm_program": OpenQASMProgram(source="OPENQASM 3.0;\n" + "h $0;\n" * 10_000),
+    "ahs_program": ahs_program,
+    "annealing_problem": Problem(
+        type=ProblemType.QUBO,
+        linear={i: rng.random() for i in range(2_000)},
+        quadratic={f"{i},{i + 1}": rng.random() for i in range(2_000)},
+    ),
+    "gate_model_task_result": GateModelTaskResult(
+        measurements=[[rng.randint(0, 1) for _ in range(20)] for _ in range(1_000)],
+        measuredQubits=list(range(20)),
+        resultTypes=[
+            {"type": Expectation(targets=[i], observable=["z"]), "value": 0.5} for i in range(20)
+        ],
+        taskMetadata=task_metadata,
+        additionalMetadata=AdditionalMetadata(action=jaqcd_program),
+    ),
+    "annealing_task_result": AnnealingTaskResult(
+        solutions=[[rng.choice([-1, 1]) for _ in range(100)] for _ in range(1_000)],
+        solutionCounts=[1] * 1_000,
+        values=[rng.random() for _ in range(1_000)],
+        variableCount=100,
+        taskMetadata=task_metadata,
+        additionalMetadata={
+            "action": Problem(type=ProblemType.ISING, linear={0: 1.0}, quadratic={}).dict(),
+        },
+    ),
+    "ahs_task_result": AnalogHamiltonianSimulationTaskResult(
+        taskMetadata=task_metadata,
+        measurements=[
+            {
+                "shotMetadata": {"shotStatus": "Success"},
+                "shotResult": {"preSequence": [1] * 100, "postSequence": [0, 1] * 50},
+            }
+            for _ in range(1_000)
+        ],
+        additionalMetadata={"action": ahs_program},
+    ),
+    "photonic_model_task_result": PhotonicModelTaskResult(
+        measurements=[[[rng.randint(0, 3) for _ in range(8)]] for _ in range(1_000)],
+        taskMetadata=task_metadata,
+        additionalMetadata={"action": {"source": "Vac | q[0]"}},
+    ),
+    "gate_model_simulator_device_capabilities": GateModelSimulatorDeviceCapabilities.parse_obj(
+        {
+            "service": {
+                "executionWindows": [
+                    {
+                        "executionDay": "Everyday",
+                        "windowStartHour": "09:00",
+                        "windowEndHour": "11:00",
+                    }
+                ],
+                "shotsRange": [1, 10],
+            },
+            "action": {
+                "braket.ir.jaqcd.program": {
+                    "actionType": "braket.ir.jaqcd.program",
+                    "version": ["1"],
+                    "supportedOperations": ["x", "y", "h", "cnot"] * 10,
+                    "supportedResultTypes": [
+                        {"name": "expectation", "observables": ["x", "z"], "maxShots": 4}
+                    ],
+                }
+            },
+            "paradigm": {"qubitCount": 31},
+            "deviceParameters": {},
+        }
+    ),
+}
+
+
+@pytest.fixture(params=list(schemas), ids=list(schemas))
+def schema_json(request):
+    return schemas[request.param].json()
+
+
+def test_parse_raw_schema_trusted(benchmark, schema_json):
+    validated = benchmark(BraketSchemaBase.parse_raw_schema, schema_json, label="validated")
+    trusted = benchmark(
+        BraketSchemaBase.parse_raw_schema, schema_json, trusted=True, label="trusted"
+    )
+    assert json.loads(trusted.json()) == json.loads(validated.json())
@@ -0,0 +1,120 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import pytest
+
+from braket.ir.jaqcd import (
+    AdjointGradient,
+    BitFlip,
+    CCNot,
+    CircuitStats,
+    CNot,
+    EndVerbatimBox,
+    Expectation,
+    H,
+    Probability,
+    Rx,
+    StartVerbatimBox,
+    StateVector,
+    Swap,
+    TwoQubitDepolarizing,
+    Unitary,
+)
+from braket.ir.jaqcd.program_v1 import Program
+
+
+@pytest.fixture
+def program():
+    return Program(
+        instructions=[
+            H(target=0),
+            CNot(control=0, target=1),
+            StartVerbatimBox(),
+            Rx(angle=0.15, target=2),
+            Swap(targets=[2, 3]),
+            EndVerbatimBox(),
+            CCNot(controls=[0, 1], target=3),
+            H(target=4),
+        ],
+        basis_rotation_instructions=[H(target=5)],
+        results=[
+            Expectation(targets=[6], observable=["x"]),
+            StateVector(),
+            AdjointGradient(targets=[[7], [8]], observable=["x", "z"], parameters=["theta"]),
+        ],
+    )
+
+
+def test_circuit_stats(program):
+    stats = program.circuit_stats()
+    assert isinstance(stats, CircuitStats)
+    assert stats.qubits == frozenset(range(9))
+    assert stats.qubit_count == 9
+    assert stats.result_qubits == {6, 7, 8}
+    assert stats.instruction_counts == {
+        "h": 2,
+        "cnot": 1,
+        "start_verbatim_box": 1,
+        "rx": 1,
+        "swap": 1,
+        "end_verbatim_box": 1,
+        "ccnot": 1,
+    }
+    assert stats.two_qubit_gate_count == 2
+    assert not stats.has_noise
+    assert stats.verbatim_boxes == ((2, 5),)
+    assert stats.depth == 3
+
+
+def test_circuit_stats_cached(program):
+    assert program.circuit_stats() is program.circuit_stats()
+
+
+def test_circuit_stats_parsed(program):
+    assert Program.parse_raw(program.json()).circuit_stats() == program.circuit_stats()
+
+
+def test_circuit_stats_noise():
+    stats = Program(
+        instructions=[
+            BitFlip(target=0, probability=0.1),
+            TwoQubitDepolarizing(targets=[0, 1], probability=0.1),
+            Unitary(targets=[1], matrix=[[[0, 0], [1, 0]], [[1, 0], [0, 0]]]),
+        ]
+    ).circuit_stats()
+    assert stats.has_noise
+    assert stats.two_qubit_gate_count == 0
+    assert stats.depth == 3
+
+
+def test_circuit_stats_unclosed_verbatim_box():
+    stats = Program(
+        instructions=[StartVerbatimBox(), H(target=0), EndVerbatimBox(), StartVerbatimBox()]
+    ).circuit_stats()
+    assert stats.verbatim_boxes == ((0, 2), (3, None))
+    assert stats.depth == 1
+
+
+def test_circuit_stats_empty():
+    stats = Program(instructions=[], results=[Probability()]).circuit_stats()
+    assert stats.qubits == frozenset()
+    assert stats.qubit_count == 0
+    assert stats.instruction_counts == {}
+    assert stats.verbatim_boxes == ()
+    assert stats.depth == 0
+
+
+@pytest.mark.xfail(raises=TypeError)
+def test_circuit_stats_read_only(program):
+    program.circuit_stats().instruction_counts["h"] = 0
@@ -0,0 +1,129 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import copy
+import gc
+import pickle
+
+import pytest
+
+from braket.ir.jaqcd import (
+    CNot,
+    H,
+    Program,
+    Rx,
+    Swap,
+    get_instruction_interning,
+    set_instruction_interning,
+)
+from braket.ir.jaqcd import interning as interning_module
+
+instructions = [
+    {"type": "h", "target": 0},
+    {"type": "cnot", "control": 0, "target": 1},
+    {"type": "h", "target": 0},
+    {"type": "rx", "target": 0, "angle": 0.5},
+    {"type": "rx", "target": 0, "angle": 0.5},
+    {"type": "swap", "targets": [0, 1]},
+    {"type": "swap", "targets": [0, 1]},
+    {"type": "cnot", "control": 1, "target": 0},
+]
+
+
+@pytest.fixture
+def interning():
+    set_instruction_interning(True)
+    yield
+    set_instruction_interning(False)
+
+
+def test_interning_disabled_by_default():
+    assert not get_instruction_interning()
+    program = Program(instructions=instructions)
+    assert program.instructions[0] is not program.instructions[2]
+
+
+def test_interning(interning):
+    program = Program(instructions=instructions)
+    parsed = program.instructions
+    assert parsed[0] is parsed[2]
+    assert parsed[5] is parsed[6]
+    assert parsed[1] is not parsed[7]
+    assert parsed[3] is not parsed[4]
+    assert Program(instructions=[{"type": "h", "target": 0}]).instructions[0] is parsed[0]
+    assert parsed == [
+        H(target=0),
+        CNot(control=0, target=1),
+        H(target=0),
+        Rx(target=0, angle=0.5),
+        Rx(target=0, angle=0.5),
+        Swap(targets=[0, 1]),
+        Swap(targets=[0, 1]),
+        CNot(control=1, target=0),
+    ]
+    assert isinstance(parsed[0], H)
+    assert repr(parsed[0]) == repr(H(target=0))
+
+
+def test_interning_serialization(interning):
+    program = Program(instructions=instructions)
+    set_instruction_interning(False)
+    assert program.json() == Program(instructions=instructions).json()
+
+
+@pytest.mark.xfail(raises=TypeError)
+def test_interned_instruction_immutable(interning):
+    Program(instructions=instructions).instructions[0].target = 1
+
+
+@pytest.mark.xfail(raises=TypeError)
+def test_interned_instruction_list_immutable(interning):
+    Program(instructions=instructions).instructions[5].targets.append(2)
+
+
+def test_interned_instruction_lists(interning):
+    program = Program(instructions=instructions)
+    assert type(program.dict()["instructions"][5]["targets"]) is list
+    set_instruction_interning(False)
+    assert program.content_hash() == Program(instructions=instructions).content_hash()
+
+
+def test_interned_instruction_class(interning):
+    instruction = Program(instructions=instructions).instructions[0]
+    assert isinstance(instruction, H)
+    assert type(instruction) is not H
+
+
+def test_interning_pool_weak(interning):
+    program = Program(instructions=instructions)
+    assert len(interning_module._pool) == 4
+    del program
+    gc.collect()
+    assert not interning_module._pool
+
+
+def test_interned_instruction_copies_mutable(interning):
+    program = Program(instructions=instructions)
+    for copied in (pickle.loads(pickle.dumps(program)), copy.deepcopy(program)):
+        assert copied == program
+        assert type(copied.instructions[0]) is H
+        copied.instructions[0].target = 1
+        assert program.instructions[0].target == 0
+
+
+def test_disabling_interning_empties_pool(interning):
+    first = Program(instructions=instructions).instructions[0]
+    set_instruction_interning(False)
+    set_instruction_interning(True)
+    assert Program(instructions=instructions).instructions[0] is not first
@@ -0,0 +1,71 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import numpy as np
+import pytest
+from pydantic.v1 import ValidationError
+
+from braket.ir.jaqcd import Kraus, Unitary, get_matrix_tolerance, set_matrix_tolerance
+
+
+@pytest.fixture
+def tolerance():
+    set_matrix_tolerance(1e-8)
+    yield get_matrix_tolerance()
+    set_matrix_tolerance(None)
+
+
+def test_checks_disabled_by_default():
+    assert get_matrix_tolerance() is None
+    Unitary(targets=[0], matrix=[[[1, 0], [1, 0]], [[0, 0], [1, 0]]])
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_negative_tolerance():
+    set_matrix_tolerance(-1)
+
+
+def test_unitary(tolerance):
+    hadamard = np.array([[1, 1], [1, -1]]) / np.sqrt(2)
+    Unitary(targets=[0], matrix=hadamard)
+    Unitary(targets=[0, 1], matrix=np.kron(hadamard, [[0, 1j], [1j, 0]]))
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_non_unitary(tolerance):
+    Unitary(targets=[0], matrix=[[[1, 0], [1, 0]], [[0, 0], [1, 0]]])
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_unitary_wrong_dimension(tolerance):
+    Unitary(targets=[0, 1], matrix=np.eye(2))
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_unitary_ragged(tolerance):
+    Unitary(targets=[0], matrix=[[[1, 0]], [[0, 0], [1, 0]]])
+
+
+def test_kraus(tolerance):
+    Kraus(targets=[0], matrices=np.array([np.eye(2), [[0, 1], [1, 0]]]) * np.sqrt(0.5))
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_kraus_incomplete(tolerance):
+    Kraus(targets=[0], matrices=np.array([np.eye(2), [[0, 1], [1, 0]]], dtype=complex))
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_kraus_wrong_dimension(tolerance):
+    Kraus(targets=[0, 1], matrices=np.eye(2, dtype=complex)[np.newaxis])
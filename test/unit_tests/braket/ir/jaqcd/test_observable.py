@@ -11,9 +11,11 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
+import numpy as np
 import pytest
 from pydantic.v1 import ValidationError
 
+from braket.ir.jaqcd import HERMITIAN_CODE, HamiltonianTerms
 from braket.ir.jaqcd.shared_models import Observable
 
 
@@ -83,6 +85,12 @@ def test_hamiltonian_regex(observable):
     assert obj.observable == observable
 
 
+@pytest.mark.parametrize("observable", ["xy", "x + foo", "2 * x +", "1" * 100_000])
+@pytest.mark.xfail(raises=ValidationError)
+def test_invalid_hamiltonian(observable):
+    Observable(observable=observable)
+
+
 def test_list_2d_matrix():
     observable = [[[[1.0, 0], [0, 1]], [[0.0, 1], [1, 0]]]]
     obj = Observable(observable=observable)
@@ -91,3 +99,59 @@ def test_list_2d_matrix():
 
 def test_list_extra_params():
     Observable(observable=["x", "y"], foo="bar")
+
+
+def test_observable_terms_hamiltonian():
+    obj = Observable(observable="2 * x @ y - z")
+    terms = obj.observable_terms()
+    assert terms.coefficients == (2.0, -1.0)
+    assert terms.codes == (bytes([1, 2]), bytes([3]))
+    assert obj.observable_terms() is terms
+
+
+def test_hamiltonian_terms():
+    obj = Observable(observable="2 * x @ y - z")
+    terms = obj.hamiltonian_terms()
+    assert isinstance(terms, HamiltonianTerms)
+    assert terms.coefficients == (2.0, -1.0)
+    assert terms.codes == (bytes([1, 2]), bytes([3]))
+    assert obj.hamiltonian_terms() is terms
+
+
+def test_hamiltonian_terms_list():
+    assert Observable(observable=["x"]).hamiltonian_terms() is None
+
+
+def test_observable_terms_list():
+    terms = Observable(
+        observable=["x", [[[0, 0], [1, 0]], [[1, 0], [0, 0]]], "z"]
+    ).observable_terms()
+    assert terms.coefficients == (1.0,)
+    assert terms.observables(0) == ("x", "hermitian", "z")
+    np.testing.assert_array_equal(terms.matrices[0], [[0, 1], [1, 0]])
+    assert not terms.matrices[0].flags.writeable
+
+
+def test_observable_terms_two_qubit_matrix():
+    matrix = np.stack((np.eye(4), np.zeros((4, 4))), axis=-1).tolist()
+    terms = Observable(observable=[matrix]).observable_terms()
+    assert terms.codes == (bytes([HERMITIAN_CODE, HERMITIAN_CODE]),)
+    assert terms.matrices[0].shape == (4, 4)
+
+
+def test_observable_terms_equality():
+    x_matrix = [[[0, 0], [1, 0]], [[1, 0], [0, 0]]]
+    z_matrix = [[[1, 0], [0, 0]], [[0, 0], [-1, 0]]]
+    x_terms = Observable(observable=["x", x_matrix]).observable_terms()
+    z_terms = Observable(observable=["x", z_matrix]).observable_terms()
+    assert x_terms != z_terms
+    assert len({x_terms, z_terms}) == 2
+    same_terms = Observable(observable=["x", [[[0, -0.0], [1, 0]], x_matrix[1]]]).observable_terms()
+    assert same_terms == x_terms
+    assert hash(same_terms) == hash(x_terms)
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_observable_terms_matrix_not_power_of_two():
+    matrix = np.stack((np.eye(3), np.zeros((3, 3))), axis=-1).tolist()
+    Observable(observable=[matrix]).observable_terms()
@@ -0,0 +1,216 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import dataclasses
+import json
+
+import numpy as np
+import pytest
+
+from braket.ir.jaqcd import (
+    INSTRUCTION_TYPES,
+    CCNot,
+    CNot,
+    EndVerbatimBox,
+    Expectation,
+    GeneralizedAmplitudeDamping,
+    H,
+    Kraus,
+    PackedInstructions,
+    PackedProgram,
+    PauliChannel,
+    Program,
+    Rx,
+    StartVerbatimBox,
+    Swap,
+    Unitary,
+)
+from braket.synthetic_payloads import materialize, synthetic_payload
+
+
+@pytest.fixture
+def program():
+    return Program(
+        instructions=[
+            H(target=0),
+            CNot(control=0, target=1),
+            Rx(target=1, angle=0.15),
+            CCNot(controls=[0, 1], target=2),
+            Swap(targets=[1, 2]),
+            Unitary(targets=[0], matrix=[[[0, 0], [1, 0]], [[1, 0], [0, 0]]]),
+            PauliChannel(target=0, probX=0.1, probY=0.2, probZ=0.3),
+            GeneralizedAmplitudeDamping(target=1, gamma=0.2, probability=0.3),
+            Kraus(targets=[0], matrices=[[[[1, 0], [0, 0]], [[0, 0], [1, 0]]]]),
+            StartVerbatimBox(),
+            EndVerbatimBox(directive="EndVerbatimBlock"),
+        ],
+        results=[Expectation(targets=[1], observable=["x"])],
+        basis_rotation_instructions=[H(target=1)],
+    )
+
+
+def test_columns(program):
+    instructions = PackedProgram.from_program(program).instructions
+    assert len(instructions) == 11
+    assert [INSTRUCTION_TYPES[opcode] for opcode in instructions.opcodes[:5]] == [
+        "h",
+        "cnot",
+        "rx",
+        "ccnot",
+        "swap",
+    ]
+    np.testing.assert_array_equal(instructions.targets, [0, 1, 1, 2, 1, 2, 0, 0, 1, 0])
+    np.testing.assert_array_equal(
+        instructions.target_offsets, [0, 1, 2, 3, 4, 6, 7, 8, 9, 10, 10, 10]
+    )
+    np.testing.assert_array_equal(instructions.controls, [0, 0, 1])
+    np.testing.assert_array_equal(instructions.parameters, [0.15, 0.1, 0.2, 0.3, 0.3, 0.2])
+    assert set(instructions.extras) == {5, 8, 10}
+
+
+def test_round_trip(program):
+    packed = PackedProgram.from_program(program)
+    assert packed.to_program() == program
+    assert packed.to_program().json() == program.json()
+    assert PackedProgram.parse_raw(program.json()).to_program() == program
+
+
+def test_round_trip_without_optional_fields():
+    program = Program(instructions=[H(target=0)])
+    assert PackedProgram.parse_obj(program.dict()).to_program() == program
+    assert PackedProgram.from_program(program).basis_rotation_instructions is None
+
+
+def test_synthetic_program():
+    payload = materialize(synthetic_payload(Program, size=1000))
+    assert PackedProgram.parse_obj(payload).to_program() == Program.parse_obj(payload)
+
+
+@pytest.mark.parametrize("exclude_none", [False, True])
+def test_round_trip_exclude_unset(program, exclude_none):
+    payload = json.loads(program.json(exclude_none=exclude_none))
+    unpacked = PackedProgram.parse_obj(payload).to_program()
+    parsed = Program.parse_obj(payload)
+    assert unpacked.json(exclude_unset=True) == parsed.json(exclude_unset=True)
+    assert Program.parse_raw(unpacked.json(exclude_unset=True)) == program
+
+
+def test_round_trip_exclude_unset_synthetic():
+    payload = materialize(synthetic_payload(Program, size=1000))
+    unpacked = PackedProgram.parse_obj(payload).to_program()
+    assert unpacked.json(exclude_unset=True) == Program.parse_obj(payload).json(exclude_unset=True)
+
+
+def test_to_program_fields_set():
+    packed = PackedProgram(PackedInstructions.from_instructions([H(target=0)]))
+    assert packed.to_program().__fields_set__ == {"instructions"}
+
+
+def test_empty_instructions():
+    packed = PackedInstructions.from_instructions([])
+    assert len(packed) == 0
+    assert packed.to_instructions() == []
+
+
+@pytest.mark.parametrize(
+    "instruction",
+    [
+        "h",
+        {"target": 0},
+        {"type": "foo", "target": 0},
+        {"type": "h"},
+        {"type": "h", "target": -1},
+        {"type": "h", "target": "a"},
+        {"type": "cnot", "control": -1, "target": 0},
+        {"type": "swap", "targets": [0]},
+        {"type": "ccnot", "controls": [0, 1, 2], "target": 3},
+        {"type": "rx", "target": 0, "angle": float("inf")},
+        {"type": "bit_flip", "target": 0, "probability": 0.6},
+        {"type": "pauli_channel", "target": 0, "probX": 0.5, "probY": 0.5, "probZ": 0.5},
+        {"type": "unitary", "targets": [0]},
+        {"type": "unitary", "targets": [0], "matrix": [[[1, 0, 0]]]},
+    ],
+)
+@pytest.mark.xfail(raises=ValueError)
+def test_invalid_instruction(instruction):
+    PackedInstructions.from_instructions([{"type": "h", "target": 0}, instruction])
+
+
+def test_invalid_instruction_index():
+    with pytest.raises(ValueError, match="Instruction rx at index 2 has a parameter out of range"):
+        PackedInstructions.from_instructions(
+            [H(target=0), {"type": "h", "target": 1}, {"type": "rx", "target": 0, "angle": "nan"}]
+        )
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_invalid_offsets():
+    packed = PackedInstructions.from_instructions([H(target=0), H(target=1)])
+    PackedInstructions(
+        packed.opcodes,
+        packed.targets,
+        np.array([0, 2, 2]),
+        packed.controls,
+        packed.control_offsets,
+        packed.parameters,
+        packed.parameter_offsets,
+    )
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_invalid_opcode():
+    packed = PackedInstructions.from_instructions([H(target=0)])
+    PackedInstructions(
+        np.array([len(INSTRUCTION_TYPES)], dtype=np.uint8),
+        packed.targets,
+        packed.target_offsets,
+        packed.controls,
+        packed.control_offsets,
+        packed.parameters,
+        packed.parameter_offsets,
+    )
+
+
+@pytest.mark.parametrize(
+    "column, value",
+    [
+        ("targets", np.array([0.5])),
+        ("opcodes", [0]),
+        ("parameters", np.array(["x"])),
+    ],
+)
+@pytest.mark.xfail(raises=ValueError)
+def test_invalid_column(column, value):
+    packed = PackedInstructions.from_instructions([H(target=0)])
+    dataclasses.replace(packed, **{column: value})
+
+
+def test_validated_construction():
+    packed = PackedInstructions.from_instructions([H(target=0), Rx(target=1, angle=0.5)])
+    assert len(dataclasses.replace(packed)) == 2
+
+
+@pytest.mark.parametrize(
+    "program_data",
+    [
+        [],
+        {"instructions": "h"},
+        {"instructions": [], "basis_rotation_instructions": "h"},
+        {"instructions": [], "results": [{"type": "expectation"}]},
+        {"braketSchemaHeader": {"name": "braket.ir.openqasm.program", "version": "1"}},
+    ],
+)
+@pytest.mark.xfail(raises=ValueError)
+def test_invalid_program(program_data):
+    PackedProgram.parse_obj(program_data)
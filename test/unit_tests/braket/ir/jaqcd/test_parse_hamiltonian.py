@@ -0,0 +1,102 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import re
+
+import pytest
+
+from braket.ir.gate_model_shared.shared_models import Observable
+from braket.ir.jaqcd import ObservableTerms, parse_hamiltonian
+
+
+@pytest.mark.parametrize(
+    "hamiltonian, coefficients, observables",
+    [
+        ("x", (1.0,), ["x"]),
+        ("2*x", (2.0,), ["x"]),
+        ("20.10 * x", (20.1,), ["x"]),
+        ("-2 * x @ y + 3.1 * z @ i + h@h", (-2.0, 3.1, 1.0), ["xy", "zi", "hh"]),
+        ("2 * x @ - 2 * y @ z", (-4.0,), ["xyz"]),
+        ("2 * x @ y - z @ i", (2.0, -1.0), ["xy", "zi"]),
+        ("0.5 * x + -y - -0.25 * z", (0.5, -1.0, 0.25), ["x", "y", "z"]),
+        ("x\t@\ny ", (1.0,), ["xy"]),
+        ("-*x + .*y", (-1.0, 1.0), ["x", "y"]),
+    ],
+)
+def test_parse_hamiltonian(hamiltonian, coefficients, observables):
+    terms = parse_hamiltonian(hamiltonian)
+    assert terms.coefficients == coefficients
+    assert ["".join(terms.observables(term)) for term in range(len(terms))] == observables
+
+
+def test_codes():
+    assert parse_hamiltonian("i @ x @ y @ z @ h + z") == ObservableTerms(
+        coefficients=(1.0, 1.0), codes=(bytes([0, 1, 2, 3, 4]), bytes([3]))
+    )
+
+
+def test_long_hamiltonian():
+    hamiltonian = " + ".join(f"{term} * x @ y" for term in range(10_000))
+    terms = parse_hamiltonian(hamiltonian)
+    assert len(terms) == 10_000
+    assert terms.coefficients[-1] == pytest.approx(9999)
+    assert terms.codes[-1] == bytes([1, 2])
+
+
+@pytest.mark.parametrize(
+    "hamiltonian",
+    ["", " x", "X", "xy", "x +", "x @", "x + foo", "2 x", "1e3 * x", "2 * * x", "1" * 100_000],
+)
+@pytest.mark.xfail(raises=ValueError)
+def test_invalid_hamiltonian(hamiltonian):
+    parse_hamiltonian(hamiltonian)
+
+
+@pytest.mark.parametrize(
+    "hamiltonian",
+    [
+        "x",
+        "-2 * x @ y + 3.1 * z @ i + h@h",
+        "2 * x @ - 2 * y @ z",
+        "x - y",
+        "- x",
+        "x @ 2 * y",
+        "0.5 * x + -y - -0.25 * z",
+        "x\t@\ny ",
+        "-*x + .*y",
+        "",
+        " x",
+        "xy",
+        "x +",
+        "x + foo",
+        "2 x",
+        "1e3 * x",
+        "2 * * x",
+        "x + + y",
+    ],
+)
+def test_schema_pattern_matches_parser(hamiltonian):
+    pattern = Observable.schema()["properties"]["observable"]["anyOf"][1]["pattern"]
+    try:
+        parse_hamiltonian(hamiltonian)
+        valid = True
+    except ValueError:
+        valid = False
+    assert bool(re.search(pattern, hamiltonian)) == valid
+
+
+def test_long_hamiltonian_not_cached():
+    hamiltonian = " + ".join(["x @ y"] * 1000)
+    assert parse_hamiltonian(hamiltonian) is not parse_hamiltonian(hamiltonian)
+    assert parse_hamiltonian("x @ y") is parse_hamiltonian("x @ y")
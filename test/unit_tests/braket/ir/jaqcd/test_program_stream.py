@@ -0,0 +1,128 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import io
+import json
+
+import pytest
+from pydantic.v1 import ValidationError
+
+from braket.ir.jaqcd import (
+    BitFlip,
+    CNot,
+    EndVerbatimBox,
+    Expectation,
+    H,
+    Probability,
+    StartVerbatimBox,
+    iter_program,
+)
+from braket.ir.jaqcd.program_v1 import Program
+
+
+@pytest.fixture
+def program():
+    return Program(
+        instructions=[
+            H(target=0),
+            StartVerbatimBox(),
+            CNot(control=0, target=1),
+            EndVerbatimBox(),
+            BitFlip(target=1, probability=0.1),
+        ],
+        results=[Probability(targets=[0]), Expectation(targets=[1], observable=["x"])],
+        basis_rotation_instructions=[H(target=1)],
+    )
+
+
+def _sections(text, chunk_size=16, binary=True):
+    file = io.BytesIO(text.encode()) if binary else io.StringIO(text)
+    return list(iter_program(file, chunk_size=chunk_size))
+
+
+@pytest.mark.parametrize("binary", [False, True])
+@pytest.mark.parametrize("chunk_size", [1, 16, 1 << 20])
+def test_iter_program(program, binary, chunk_size):
+    sections = _sections(program.json(), chunk_size, binary)
+    assert sections == (
+        [("instructions", instruction) for instruction in program.instructions]
+        + [("results", result) for result in program.results]
+        + [
+            ("basis_rotation_instructions", instruction)
+            for instruction in program.basis_rotation_instructions
+        ]
+    )
+    assert [type(item) for _, item in sections] == [
+        *map(type, program.instructions),
+        *map(type, program.results),
+        *map(type, program.basis_rotation_instructions),
+    ]
+
+
+def test_iter_program_document_order(program):
+    document = json.loads(program.json())
+    text = json.dumps(
+        {
+            "results": None,
+            "basis_rotation_instructions": document["basis_rotation_instructions"],
+            "instructions": document["instructions"],
+            "extra": [1, 2],
+        }
+    )
+    assert _sections(text) == [("basis_rotation_instructions", H(target=1))] + [
+        ("instructions", instruction) for instruction in program.instructions
+    ]
+
+
+def test_iter_program_empty():
+    assert _sections('{"instructions": []}') == []
+
+
+def test_iter_program_lazy():
+    sections = iter_program(
+        io.StringIO('{"instructions": [{"type": "h", "target": 0}, {"type": "foo"}]}')
+    )
+    assert next(sections) == ("instructions", H(target=0))
+    with pytest.raises(ValidationError):
+        next(sections)
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_iter_program_missing_instructions():
+    _sections('{"results": []}')
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_iter_program_invalid_instruction():
+    _sections('{"instructions": [{"type": "h", "target": -1}]}')
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_iter_program_invalid_result():
+    _sections('{"instructions": [], "results": [{"type": "expectation", "states": ["01"]}]}')
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_iter_program_null_instructions():
+    _sections('{"instructions": null}')
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_iter_program_invalid_header():
+    _sections('{"braketSchemaHeader": {"name": "foo", "version": "1"}, "instructions": []}')
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_iter_program_invalid_json():
+    _sections('{"instructions": [{"type": "h", "target": 0},')
@@ -14,7 +14,21 @@
 import pytest
 from pydantic.v1 import ValidationError
 
-from braket.ir.jaqcd import BitFlip, CNot, EndVerbatimBox, Expectation, H, StartVerbatimBox
+from braket.ir.jaqcd import (
+    AdjointGradient,
+    Amplitude,
+    BitFlip,
+    CNot,
+    DensityMatrix,
+    EndVerbatimBox,
+    Expectation,
+    H,
+    Probability,
+    Sample,
+    StartVerbatimBox,
+    StateVector,
+    Variance,
+)
 from braket.ir.jaqcd.program_v1 import Program
 
 
@@ -91,3 +105,29 @@ def test_end_verbatim_box_instruction():
 
 def test_type_validation_for_compiler_directive():
     Program(instructions=[{"type": "end_verbatim_box"}])
+
+
+def test_results_dispatch():
+    results = [
+        Amplitude(states=["01"]),
+        Expectation(targets=[1], observable=["x"]),
+        Probability(targets=[0]),
+        Sample(targets=[1], observable=["z"]),
+        StateVector(),
+        DensityMatrix(targets=[0]),
+        Variance(targets=[1], observable=["y"]),
+        AdjointGradient(targets=[[0]], observable="x", parameters=["theta"]),
+    ]
+    program = Program.parse_raw(Program(instructions=[H(target=0)], results=results).json())
+    assert program.results == results
+    assert [type(result) for result in program.results] == [type(result) for result in results]
+
+
+def test_results_without_type():
+    program = Program(instructions=[H(target=0)], results=[{"states": ["01"]}])
+    assert program.results == [Amplitude(states=["01"])]
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_invalid_result_for_type():
+    Program(instructions=[H(target=0)], results=[{"type": "expectation", "states": ["01"]}])
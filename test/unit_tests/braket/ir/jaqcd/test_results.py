@@ -85,3 +85,28 @@ def test_result_in_program(testclass, subclasses, type):
     result = create_valid_class_instance(testclass, subclasses, type)
     program = Program(instructions=[], results=[result])
     assert program.results == [result]
+
+
+@pytest.mark.parametrize("testclass", [Expectation, Sample, Variance])
+def test_observable_terms(testclass):
+    result = testclass(targets=[0, 1], observable=["x", "y"])
+    terms = result.observable_terms()
+    assert terms.codes == (bytes([1, 2]),)
+    assert result.observable_terms() is terms
+    assert result == testclass.parse_raw(result.json())
+
+
+def test_adjoint_gradient_observable_terms():
+    program = Program.parse_raw(
+        Program(
+            instructions=[],
+            results=[
+                AdjointGradient(
+                    targets=[[0, 1], [2]], observable="2 * x @ y + z", parameters=["theta"]
+                )
+            ],
+        ).json()
+    )
+    terms = program.results[0].observable_terms()
+    assert terms.coefficients == (2.0, 1.0)
+    assert [terms.observables(term) for term in range(len(terms))] == [("x", "y"), ("z",)]
@@ -11,6 +11,7 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
+import numpy as np
 import pytest
 from pydantic.v1 import ValidationError
 
@@ -50,3 +51,26 @@ def test_list_gte_zero():
 
 def test_list_extra_params():
     TwoDimensionalMatrix(matrix=[[[1.0, 0], [0, 1]], [[0.0, 1], [1, 0]]], foo="bar")
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_infinite_element():
+    TwoDimensionalMatrix(matrix=[[[1.0, 0], [float("inf"), 1]]])
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_numpy_nan_element():
+    TwoDimensionalMatrix(matrix=np.array([[1, np.nan]]))
+
+
+def test_ragged_matrix():
+    matrix = [[[1.0, 0]], [[0.0, 1], [1, 0]]]
+    assert TwoDimensionalMatrix(matrix=matrix).matrix == matrix
+
+
+def test_numpy_complex_matrix():
+    matrix = np.array([[1, 1j], [-1j, 0.5]])
+    obj = TwoDimensionalMatrix(matrix=matrix)
+    assert obj.matrix == [[[1.0, 0.0], [0.0, 1.0]], [[0.0, -1.0], [0.5, 0.0]]]
+    assert type(obj.matrix[0][0][0]) is float
+    np.testing.assert_array_equal(obj.to_array(), matrix)
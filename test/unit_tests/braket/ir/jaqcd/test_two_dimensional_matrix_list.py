@@ -11,6 +11,7 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
+import numpy as np
 import pytest
 from pydantic.v1 import ValidationError
 
@@ -60,3 +61,15 @@ def test_list_extra_params():
         matrices=[[[[1, 0], [0, 0]], [[0, 0], [1, 0]]], [[[0, 0], [1, 0]], [[1, 0], [0, 0]]]],
         foo="bar",
     )
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_matrix_size_gt_four():
+    TwoDimensionalMatrixList(matrices=np.eye(8, dtype=complex)[np.newaxis])
+
+
+def test_numpy_complex_matrices():
+    matrices = np.array([np.eye(2), [[0, 1j], [-1j, 0]]])
+    obj = TwoDimensionalMatrixList(matrices=matrices)
+    assert obj.matrices[1] == [[[0.0, 0.0], [0.0, 1.0]], [[0.0, -1.0], [0.0, 0.0]]]
+    np.testing.assert_array_equal(obj.to_array(), matrices)
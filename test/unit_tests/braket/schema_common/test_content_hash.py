@@ -0,0 +1,149 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import hashlib
+import json
+from decimal import Decimal
+
+import pytest
+
+from braket.device_schema.device_action_properties import DeviceActionType
+from braket.ir.ahs import Program as AhsProgram
+from braket.ir.annealing import Problem
+from braket.ir.blackbird import Program as BlackbirdProgram
+from braket.ir.jaqcd import Program as JaqcdProgram
+from braket.ir.openqasm import Program as OpenQASMProgram
+from braket.ir.openqasm import ProgramSet
+from braket.schema_common.content_hash import content_hash
+
+jaqcd_program = {
+    "instructions": [
+        {"type": "rx", "target": 0, "angle": 0.5},
+        {"type": "cnot", "control": 0, "target": 1},
+    ],
+    "results": [{"type": "expectation", "observable": ["z"], "targets": [1]}],
+}
+
+
+def test_content_hash_encoding():
+    # The encoding is stable across releases, so this must never change
+    encoding = b"M2:S1:aTS1:bL3:D1.5;S1:xN"
+    assert content_hash({"b": [1.5, "x", None], "a": True}) == hashlib.sha256(encoding).hexdigest()
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        ({"a": 1, "b": 2}, {"b": 2, "a": 1}),
+        ([1, 2.0, 3e0], [1.0, 2, Decimal("3.00")]),
+        ([0.1, 1e-7, -0.0], [Decimal("0.10"), Decimal("1E-7"), 0]),
+        ({0: "x"}, {"0": "x"}),
+        ({DeviceActionType.JAQCD: 1}, {"braket.ir.jaqcd.program": 1}),
+        (
+            [float("nan"), float("inf"), float("-inf")],
+            [Decimal("NaN"), Decimal("Infinity"), Decimal("-Infinity")],
+        ),
+        ([float("nan")], [Decimal("sNaN")]),
+    ],
+)
+def test_content_hash_equal(first, second):
+    assert content_hash(first) == content_hash(second)
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        ([1, 2], [2, 1]),
+        (["1"], [1]),
+        ([None], []),
+        ([True], [1]),
+        (["ab", "c"], ["a", "bc"]),
+        ([[1], 2], [1, [2]]),
+        ({"a": {}}, {"a": []}),
+    ],
+)
+def test_content_hash_different(first, second):
+    assert content_hash(first) != content_hash(second)
+
+
+@pytest.mark.xfail(raises=TypeError)
+def test_content_hash_unsupported_type():
+    content_hash([object()])
+
+
+def test_jaqcd_program_content_hash():
+    program = JaqcdProgram.parse_obj(jaqcd_program)
+    reordered = json.dumps(
+        {
+            "results": [{"targets": [1], "observable": ["z"], "type": "expectation"}],
+            "instructions": [
+                {"angle": 5e-1, "target": 0, "type": "rx"},
+                {"target": 1, "control": 0, "type": "cnot"},
+            ],
+        }
+    )
+    assert JaqcdProgram.parse_raw(reordered).content_hash() == program.content_hash()
+    assert program.content_hash() is program.content_hash()
+    changed = dict(jaqcd_program, instructions=[{"type": "rx", "target": 0, "angle": 0.25}])
+    assert JaqcdProgram.parse_obj(changed).content_hash() != program.content_hash()
+
+
+def test_content_hash_ignores_unset_optional_fields():
+    program = OpenQASMProgram(source="OPENQASM 3.0; cnot $0, $1;")
+    assert program.content_hash() == OpenQASMProgram.parse_raw(program.json()).content_hash()
+    assert (
+        program.content_hash() != OpenQASMProgram(source=program.source, inputs={}).content_hash()
+    )
+
+
+def test_program_set_content_hash():
+    program_set = ProgramSet(
+        programs=[OpenQASMProgram(source="OPENQASM 3.0;", inputs={"a": [0.5]})]
+    )
+    assert program_set.content_hash() == ProgramSet.parse_raw(program_set.json()).content_hash()
+
+
+def test_problem_content_hash():
+    problem = Problem(type="QUBO", linear={0: 1, 1: -0.5}, quadratic={"0,1": 2})
+    reordered = Problem(type="QUBO", linear={1: -0.5, 0: 1.0}, quadratic={"0,1": 2.0})
+    assert problem.content_hash() == reordered.content_hash()
+
+
+def test_blackbird_program_content_hash():
+    program = BlackbirdProgram(source="Vac | q[0]")
+    assert program.content_hash() == BlackbirdProgram.parse_raw(program.json()).content_hash()
+
+
+def _ahs_program(values, times):
+    return AhsProgram(
+        setup={"ahs_register": {"sites": [[0, 0], [0, 4e-6]], "filling": [1, 0]}},
+        hamiltonian={
+            "drivingFields": [
+                {
+                    field: {"time_series": {"values": values, "times": times}, "pattern": "uniform"}
+                    for field in ("amplitude", "phase", "detuning")
+                }
+            ],
+            "localDetuning": [],
+        },
+    )
+
+
+def test_ahs_program_content_hash():
+    program = _ahs_program([0, 1.5e7], [0, 4e-6])
+    assert program.content_hash() == AhsProgram.parse_raw(program.json()).content_hash()
+    assert (
+        program.content_hash()
+        == _ahs_program(["0.0", "15000000"], ["0", "0.000004"]).content_hash()
+    )
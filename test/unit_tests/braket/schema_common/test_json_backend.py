@@ -0,0 +1,120 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import json
+import sys
+from importlib.util import find_spec
+
+import pytest
+from pydantic.v1 import ValidationError
+
+from braket.device_schema.error_mitigation import Debias
+from braket.device_schema.ionq import IonqProviderProperties
+from braket.ir.ahs.time_series import TimeSeries
+from braket.ir.jaqcd import CNot, H
+from braket.ir.jaqcd import Program as JaqcdProgram
+from braket.schema_common import BraketSchemaBase, get_json_backend, json_backend, set_json_backend
+from braket.task_result import GateModelTaskResult, TaskMetadata
+
+
+@pytest.fixture(autouse=True)
+def restore_backend():
+    backend = get_json_backend()
+    yield
+    set_json_backend(backend)
+
+
+@pytest.fixture(params=["json", "orjson", "msgspec"])
+def backend(request):
+    if request.param != "json":
+        pytest.importorskip(request.param)
+    return set_json_backend(request.param)
+
+
+@pytest.fixture
+def program():
+    return JaqcdProgram(instructions=[H(target=0), CNot(control=0, target=1)])
+
+
+def test_default_backend(program):
+    assert get_json_backend() == "json"
+    assert program.json() == json.dumps(program.dict())
+
+
+def test_auto_backend():
+    expected = next(name for name in ("orjson", "msgspec", "json") if find_spec(name))
+    assert set_json_backend() == expected == get_json_backend()
+
+
+def test_round_trip(backend, program):
+    assert get_json_backend() == backend
+    assert json.loads(program.json()) == program.dict()
+    assert BraketSchemaBase.parse_raw_schema(program.json()) == program
+
+
+def test_gate_model_task_result(backend, program):
+    result = GateModelTaskResult(
+        measurements=[[0, 1], [1, 0]],
+        measuredQubits=[0, 1],
+        taskMetadata=TaskMetadata(id="task_id", shots=2, deviceId="device_id"),
+        additionalMetadata={"action": program},
+    )
+    assert GateModelTaskResult.parse_raw(result.json()) == result
+
+
+def test_decimal_fields(backend):
+    time_series = TimeSeries(values=[0, 2.51327e7], times=[0.0, 3.0e-6])
+    assert TimeSeries.parse_raw(time_series.json()) == time_series
+
+
+def test_ionq_error_mitigation(backend):
+    provider = IonqProviderProperties(
+        fidelity={"1Q": {"mean": 0.99717}},
+        timing={"T1": 10000000000, "T2": 500000},
+        errorMitigation={Debias: {"minimumShots": 2500}},
+    )
+    serialized = provider.json()
+    assert "braket.device_schema.error_mitigation.debias.Debias" in serialized
+    assert IonqProviderProperties.parse_raw(serialized) == provider
+
+
+def test_dumps_keyword_arguments(backend, program):
+    dumped = program.json(indent=2, sort_keys=True)
+    assert dumped == json.dumps(program.dict(), indent=2, sort_keys=True)
+    assert program.json(separators=(",", ":")) == json.dumps(program.dict(), separators=(",", ":"))
+
+
+def test_dumps_falls_back(backend):
+    payload = {"big": 1 << 70, 1: "one"}
+    assert json.loads(json_backend.dumps(payload)) == {"big": 1 << 70, "1": "one"}
+
+
+def test_loads_falls_back(backend):
+    assert json_backend.loads('{"value": NaN, "big": 1180591620717411303424}')["big"] == 1 << 70
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_invalid_json(backend):
+    BraketSchemaBase.parse_raw_schema('{"braketSchemaHeader": ')
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_unknown_backend():
+    set_json_backend("simplejson")
+
+
+@pytest.mark.xfail(raises=ImportError)
+def test_backend_not_installed(monkeypatch):
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    set_json_backend("orjson")
@@ -0,0 +1,78 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import io
+import json
+
+import pytest
+
+from braket.schema_common.json_stream import JsonChunkReader
+
+document = {
+    "shots": [[0, 1, 1], [1, 0, 0], {"value": 12345.678e-3, "text": "é" * 100}],
+    "metadata": {"id": "task", "long": "x" * 300, "nested": [{"a": None}, True]},
+    "count": 1234567890,
+    "empty": [],
+}
+
+
+def _read(reader):
+    values = {}
+    for key in reader.iter_object():
+        values[key] = (
+            list(reader.iter_array()) if key in ("shots", "empty") else reader.decode_value()
+        )
+    reader.end()
+    return values
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 1 << 20])
+@pytest.mark.parametrize("binary", [False, True])
+def test_read(chunk_size, binary):
+    text = json.dumps(document, indent=2)
+    file = io.BytesIO(text.encode()) if binary else io.StringIO(text)
+    assert _read(JsonChunkReader(file, chunk_size)) == document
+
+
+def test_empty_object():
+    reader = JsonChunkReader(io.StringIO(" {} "))
+    assert list(reader.iter_object()) == []
+    reader.end()
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"a": [1, x]}',
+        '{"a": 1',
+        '{"a": 1} x',
+        "{a: 1}",
+        '{"a" 1}',
+        '["a"]',
+        '{"a": "unterminated',
+        "",
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [2, 1 << 20])
+def test_invalid(text, chunk_size):
+    with pytest.raises(json.JSONDecodeError):
+        _read(JsonChunkReader(io.StringIO(text), chunk_size))
+
+
+def test_bounded_buffer():
+    text = json.dumps({"shots": [[i % 2] * 10 for i in range(10_000)]})
+    reader = JsonChunkReader(io.StringIO(text), 256)
+    for key in reader.iter_object():
+        for _ in reader.iter_array():
+            assert len(reader._buffer) < 1024
@@ -12,8 +12,10 @@
 # language governing permissions and limitations under the License.
 
 import pytest
-from pydantic.v1 import ValidationError
+from pydantic.v1 import Field, ValidationError
 
+from braket.device_schema.error_mitigation import Debias, ErrorMitigationProperties
+from braket.device_schema.ionq import IonqProviderProperties
 from braket.schema_common import BraketSchemaBase, BraketSchemaHeader
 from braket.task_result.task_metadata_v1 import TaskMetadata
 
@@ -116,6 +118,8 @@ def test_get_schema_class_invalid_name():
         "braket.task_result.annealing_task_result",
         "braket.task_result.dwave_metadata",
         "braket.task_result.gate_model_task_result",
+        "braket.task_result.packed_complex_array",
+        "braket.task_result.packed_measurements",
         "braket.task_result.rigetti_metadata",
         "braket.task_result.simulator_metadata",
         "braket.task_result.task_metadata",
@@ -124,3 +128,62 @@ def test_get_schema_class_invalid_name():
 )
 def test_no_header_typos(name):
     BraketSchemaHeader(name=name, version=1).import_schema_module()
+
+
+def test_get_registered_schema_class():
+    header = TaskMetadata.__fields__["braketSchemaHeader"].default
+    assert BraketSchemaBase.get_registered_schema_class(header) is TaskMetadata
+    assert BraketSchemaBase.get_registered_schema_class(header) is TaskMetadata
+
+
+@pytest.mark.xfail(raises=ModuleNotFoundError)
+def test_get_registered_schema_class_not_found():
+    BraketSchemaBase.get_registered_schema_class(
+        BraketSchemaHeader(name="braket.task_result.task_metadata", version="0.0")
+    )
+
+
+def test_register_schema():
+    header = BraketSchemaHeader(name="thirdparty.custom_result", version="1")
+
+    @BraketSchemaBase.register_schema
+    class CustomResult(BraketSchemaBase):
+        braketSchemaHeader: BraketSchemaHeader = Field(default=header, const=header)
+        value: int
+
+    schema = CustomResult(value=3)
+    parsed = BraketSchemaBase.parse_raw_schema(schema.json())
+    assert isinstance(parsed, CustomResult)
+    assert parsed == schema
+
+
+def test_register_schema_explicit_header():
+    header = BraketSchemaHeader(name="thirdparty.aliased_metadata", version="1")
+    BraketSchemaBase.register_schema(TaskMetadata, header)
+    assert BraketSchemaBase.get_registered_schema_class(header) is TaskMetadata
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_register_schema_without_header():
+    BraketSchemaBase.register_schema(BraketSchemaBase)
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_parse_raw_schema_invalid_json():
+    BraketSchemaBase.parse_raw_schema("{not json")
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_parse_raw_schema_missing_header():
+    BraketSchemaBase.parse_raw_schema('{"id": "test_id"}')
+
+
+def test_parse_raw_schema_custom_json_loads():
+    properties = IonqProviderProperties(
+        fidelity={"1Q": {"mean": 0.99717}},
+        timing={"T1": 10000000000},
+        errorMitigation={Debias: {"minimumShots": 2500}},
+    )
+    parsed = BraketSchemaBase.parse_raw_schema(properties.json())
+    assert isinstance(parsed, IonqProviderProperties)
+    assert parsed.errorMitigation == {Debias: ErrorMitigationProperties(minimumShots=2500)}
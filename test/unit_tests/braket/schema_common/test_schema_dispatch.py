@@ -0,0 +1,74 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import pytest
+from pydantic.v1 import ValidationError
+
+from braket.ir.jaqcd import Program as JaqcdProgram
+from braket.ir.openqasm import Program as OpenQASMProgram
+from braket.schema_common import BraketSchemaHeader
+from braket.schema_common.schema_dispatch import SchemaDispatcher
+
+
+@pytest.fixture
+def dispatch():
+    return SchemaDispatcher(JaqcdProgram, OpenQASMProgram)
+
+
+@pytest.fixture
+def openqasm_program():
+    return OpenQASMProgram(source="OPENQASM 3.0; cnot $0, $1;")
+
+
+def test_dispatch_dict(dispatch, openqasm_program):
+    resolved = dispatch(openqasm_program.dict())
+    assert isinstance(resolved, OpenQASMProgram)
+    assert resolved == openqasm_program
+
+
+def test_dispatch_header_model(dispatch, openqasm_program):
+    value = {
+        "braketSchemaHeader": openqasm_program.braketSchemaHeader,
+        "source": openqasm_program.source,
+    }
+    assert dispatch(value) == openqasm_program
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        "source",
+        {"source": "OPENQASM 3.0;"},
+        {"braketSchemaHeader": None, "source": "OPENQASM 3.0;"},
+        {"braketSchemaHeader": {"name": ["unhashable"]}},
+        {"braketSchemaHeader": {"name": "braket.ir.ahs.program", "version": "1"}},
+    ],
+)
+def test_dispatch_unresolved(dispatch, value):
+    assert dispatch(value) is value
+
+
+def test_dispatch_model(dispatch, openqasm_program):
+    assert dispatch(openqasm_program) is openqasm_program
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_dispatch_invalid(dispatch):
+    dispatch(
+        {
+            "braketSchemaHeader": BraketSchemaHeader(name="braket.ir.jaqcd.program", version="1"),
+            "source": "OPENQASM 3.0;",
+        }
+    )
@@ -0,0 +1,221 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import json
+from decimal import Decimal
+
+import pytest
+from pydantic.v1 import BaseModel, ValidationError, validator
+
+from braket.device_schema.error_mitigation import Debias
+from braket.device_schema.ionq import IonqDeviceParameters
+from braket.ir.ahs import Program as AHSProgram
+from braket.ir.annealing import Problem, ProblemType
+from braket.ir.jaqcd import CNot, Expectation, H, Kraus, StartVerbatimBox
+from braket.ir.jaqcd import Program as JaqcdProgram
+from braket.ir.openqasm import Program as OpenQASMProgram
+from braket.schema_common import BraketSchemaBase
+from braket.schema_common.trusted_construction import construct_trusted, skip_when_trusted
+from braket.task_result import (
+    AdditionalMetadata,
+    GateModelTaskResult,
+    PackedComplexArray,
+    ProgramResult,
+    ProgramSetExecutableFailure,
+    ProgramSetExecutableResult,
+    TaskMetadata,
+)
+
+
+def _assert_same(expected, actual):
+    assert type(actual) is type(expected)
+    if isinstance(expected, BaseModel):
+        for name in expected.__fields__:
+            _assert_same(getattr(expected, name), getattr(actual, name))
+    elif isinstance(expected, (list, tuple)):
+        assert len(actual) == len(expected)
+        for expected_item, actual_item in zip(expected, actual):
+            _assert_same(expected_item, actual_item)
+    elif isinstance(expected, dict):
+        assert list(actual) == list(expected)
+        for key in expected:
+            _assert_same(expected[key], actual[key])
+    else:
+        assert actual == expected
+
+
+@pytest.fixture
+def task_metadata():
+    return TaskMetadata(id="task_id", shots=2, deviceId="device_id")
+
+
+@pytest.fixture
+def jaqcd_program():
+    return JaqcdProgram(
+        instructions=[
+            StartVerbatimBox(),
+            CNot(control=0, target=1),
+            Kraus(targets=[0], matrices=[[[[1, 0], [0, 0]], [[0, 0], [1, 0]]]]),
+        ],
+        results=[{"states": ["01"]}, Expectation(targets=[0], observable=["x"])],
+        basis_rotation_instructions=[H(target=0)],
+    )
+
+
+@pytest.fixture
+def ahs_program():
+    return AHSProgram(
+        setup={"ahs_register": {"sites": [[0, 0], [0, 4e-6]], "filling": [1, 0]}},
+        hamiltonian={
+            "drivingFields": [
+                {
+                    field: {
+                        "time_series": {"values": [0, 1.5e7], "times": [0, 4e-6]},
+                        "pattern": "uniform",
+                    }
+                    for field in ("amplitude", "phase", "detuning")
+                }
+            ],
+            "localDetuning": [],
+        },
+    )
+
+
+@pytest.fixture
+def gate_model_result(task_metadata, jaqcd_program):
+    return GateModelTaskResult(
+        measurements=[[0, 1], [1, 1]],
+        measurementProbabilities={"01": 0.5, "11": 0.5},
+        measuredQubits=[0, 1],
+        resultTypes=[
+            {"type": Expectation(targets=[0], observable=["z"]), "value": 1},
+            {"type": {"type": "statevector"}, "value": PackedComplexArray.from_values([[1, 0]])},
+            {"type": {"type": "amplitude", "states": ["01"]}, "value": {"01": [0.5, 0.5]}},
+        ],
+        outputs=[{"c": [0, None], "f": 0.5}, {"c": [1, 1], "f": 1.5}],
+        taskMetadata=task_metadata,
+        additionalMetadata=AdditionalMetadata(action=jaqcd_program),
+    )
+
+
+def test_parse_raw_schema_trusted(jaqcd_program, ahs_program, gate_model_result):
+    schemas = [
+        jaqcd_program,
+        ahs_program,
+        gate_model_result,
+        OpenQASMProgram(source="OPENQASM 3.0;", inputs={"theta": 0.5}),
+        Problem(type=ProblemType.QUBO, linear={0: 1, 4: -0.5}, quadratic={"0,4": 1}),
+        IonqDeviceParameters(
+            paradigmParameters={"qubitCount": 2}, errorMitigation=[Debias().dict()]
+        ),
+    ]
+    for schema in schemas:
+        json_str = schema.json()
+        _assert_same(
+            BraketSchemaBase.parse_raw_schema(json_str),
+            BraketSchemaBase.parse_raw_schema(json_str, trusted=True),
+        )
+
+
+def test_trusted_types(ahs_program, gate_model_result):
+    problem = construct_trusted(Problem, {"type": "QUBO", "linear": {"0": 1}, "quadratic": {}})
+    assert problem.type is ProblemType.QUBO
+    assert problem.linear == {0: 1.0}
+    assert type(problem.linear[0]) is float
+    ahs = construct_trusted(AHSProgram, json.loads(ahs_program.json()))
+    assert type(ahs.hamiltonian.drivingFields[0].amplitude.time_series.values[1]) is Decimal
+    result = construct_trusted(GateModelTaskResult, json.loads(gate_model_result.json()))
+    assert type(result.resultTypes[0].value) is float
+    assert type(result.resultTypes[1].value) is PackedComplexArray
+    assert type(result.additionalMetadata.action.instructions[1]) is CNot
+
+
+def test_program_result_union(task_metadata, gate_model_result):
+    result = ProgramResult(
+        source="source.json",
+        additionalMetadata=gate_model_result.additionalMetadata,
+        executableResults=[
+            ProgramSetExecutableResult(inputsIndex=0, measurements=[[0, 1]]),
+            ProgramSetExecutableFailure(
+                inputsIndex=1,
+                failureMetadata={
+                    "failureReason": "failed",
+                    "retryable": False,
+                    "category": "DEVICE",
+                },
+            ),
+        ],
+    )
+    _assert_same(result, construct_trusted(ProgramResult, json.loads(result.json())))
+    paths = ProgramResult(
+        source="source.json",
+        additionalMetadata=gate_model_result.additionalMetadata,
+        executableResults=["0.json"],
+    )
+    _assert_same(paths, construct_trusted(ProgramResult, json.loads(paths.json())))
+
+
+def test_skips_validation():
+    program = construct_trusted(
+        JaqcdProgram, {"instructions": [{"type": "cnot", "control": 0, "target": -1}]}
+    )
+    assert program.instructions == [CNot.construct(control=0, target=-1)]
+
+
+def test_packed_measurements_validated(gate_model_result):
+    payload = json.loads(gate_model_result.json())
+    payload["measurements"] = {
+        "braketSchemaHeader": {"name": "braket.task_result.packed_measurements", "version": "1"},
+        "shape": [2, 2],
+        "data": "QMA=",
+    }
+    assert construct_trusted(GateModelTaskResult, payload).measurements == [[0, 1], [1, 1]]
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_missing_required_field():
+    construct_trusted(JaqcdProgram, {"results": []})
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_unresolved_instruction():
+    construct_trusted(JaqcdProgram, {"instructions": [{"type": "foo"}]})
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_not_a_dict():
+    construct_trusted(JaqcdProgram, "invalid")
+
+
+class Model(BaseModel):
+    checked: int
+    normalized: int
+
+    @validator("checked")
+    @skip_when_trusted()
+    def validate_checked(cls, value):
+        if value < 0:
+            raise ValueError("negative")
+        return value
+
+    @validator("normalized")
+    def validate_normalized(cls, value):
+        return abs(value)
+
+
+def test_skip_when_trusted():
+    model = construct_trusted(Model, {"checked": -1, "normalized": -1})
+    assert model.checked == -1
+    assert model.normalized == 1
+    assert model.__fields_set__ == {"checked", "normalized"}
@@ -0,0 +1,158 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import io
+import json
+import sys
+
+import pytest
+from pydantic.v1 import BaseModel
+
+from braket.device_schema.dwave import DwaveProviderProperties
+from braket.device_schema.pulse import NativeGateCalibrations
+from braket.ir.ahs import Program as AHSProgram
+from braket.ir.jaqcd import Program as JaqcdProgram
+from braket.ir.openqasm import Program as OpenQASMProgram
+from braket.ir.openqasm import ProgramSet
+from braket.schema_common import BraketSchemaBase
+from braket.synthetic_payloads import (
+    LazyArray,
+    LazyObject,
+    UnsupportedFieldError,
+    materialize,
+    register_generator,
+    schema_classes,
+    synthetic_payload,
+    write_json,
+    write_synthetic_payload,
+)
+from braket.synthetic_payloads.generators import _generators
+from braket.task_result import GateModelTaskResult, PackedMeasurements
+
+
+@pytest.mark.parametrize("size", [1, 3])
+@pytest.mark.parametrize("schema", schema_classes(), ids=lambda schema: schema.__module__)
+def test_every_schema_valid(schema, size):
+    payload = json.dumps(materialize(synthetic_payload(schema, size=size)))
+    assert isinstance(BraketSchemaBase.parse_raw_schema(payload), schema)
+
+
+def test_nested_schema_headers():
+    payload = materialize(synthetic_payload(GateModelTaskResult, size=2))
+    assert payload["taskMetadata"]["braketSchemaHeader"] == {
+        "name": "braket.task_result.task_metadata",
+        "version": "1",
+    }
+    result = BraketSchemaBase.parse_raw_schema(json.dumps(payload))
+    assert isinstance(result.additionalMetadata.action, OpenQASMProgram)
+    program_set = materialize(synthetic_payload(ProgramSet, size=2))
+    assert all(
+        program["braketSchemaHeader"]["name"] == "braket.ir.openqasm.program"
+        for program in program_set["programs"]
+    )
+
+
+def test_schema_classes_only_this_package(tmp_path, monkeypatch):
+    other = tmp_path / "braket" / "other_distribution"
+    other.mkdir(parents=True)
+    (other / "__init__.py").write_text('raise ImportError("optional dependency")\n')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    classes = schema_classes()
+    assert "braket.other_distribution" not in sys.modules
+    assert JaqcdProgram in classes
+    assert all(schema.__module__.startswith("braket.") for schema in classes)
+
+
+def test_schema_classes_excludes_other_modules():
+    class OtherSchema(JaqcdProgram):
+        pass
+
+    assert OtherSchema not in schema_classes()
+
+
+def test_deterministic():
+    first = materialize(synthetic_payload(GateModelTaskResult, size=10, seed=1))
+    assert first == materialize(synthetic_payload(GateModelTaskResult, size=10, seed=1))
+    assert first != materialize(synthetic_payload(GateModelTaskResult, size=10, seed=2))
+
+
+def test_sizes():
+    result = GateModelTaskResult.parse_obj(
+        materialize(synthetic_payload(GateModelTaskResult, size=50, qubits=6))
+    )
+    assert len(result.measurements) == 50
+    assert {len(shot) for shot in result.measurements} == {6}
+    program = materialize(synthetic_payload(JaqcdProgram, size=40))
+    assert len(JaqcdProgram.parse_obj(program).instructions) == 40
+    ahs_program = AHSProgram.parse_obj(materialize(synthetic_payload(AHSProgram, size=30)))
+    assert len(ahs_program.setup.ahs_register.sites) == 30
+    provider = materialize(synthetic_payload(DwaveProviderProperties, size=20))
+    assert len(DwaveProviderProperties.parse_obj(provider).couplers) == 20
+    calibrations = materialize(synthetic_payload(NativeGateCalibrations, size=5))
+    assert len(NativeGateCalibrations.parse_obj(calibrations).waveforms) == 5
+    packed = PackedMeasurements.parse_obj(synthetic_payload(PackedMeasurements, size=9, qubits=3))
+    assert packed.shape == [9, 3]
+
+
+@pytest.mark.parametrize("schema", [GateModelTaskResult, NativeGateCalibrations, AHSProgram])
+def test_write_synthetic_payload(schema, tmp_path):
+    path = tmp_path / "payload.json"
+    write_synthetic_payload(path, schema, size=2000, seed=5)
+    expected = json.dumps(materialize(synthetic_payload(schema, size=2000, seed=5)))
+    assert path.read_text() == expected
+    assert isinstance(BraketSchemaBase.parse_raw_schema(path.read_text()), schema)
+
+
+def test_write_json():
+    lazy = LazyArray(3, lambda rng, count: ({"value": i} for i in range(count)), seed=0)
+    payload = {
+        1: LazyObject(2, lambda rng, count: ((str(i), [lazy]) for i in range(count)), seed=0),
+        "empty": LazyArray(0, lambda rng, count: iter(()), seed=0),
+    }
+    file = io.StringIO()
+    write_json(payload, file)
+    assert file.getvalue() == json.dumps(materialize(payload))
+    assert json.loads(file.getvalue()) == {
+        "1": {
+            "0": [[{"value": 0}, {"value": 1}, {"value": 2}]],
+            "1": [[{"value": 0}, {"value": 1}, {"value": 2}]],
+        },
+        "empty": [],
+    }
+
+
+def test_lazy_array_repeatable():
+    shots = LazyArray(1000, lambda rng, count: (rng.random() for _ in range(count)), seed=7)
+    assert len(shots) == 1000
+    assert list(shots) == list(shots)
+
+
+def test_register_generator(monkeypatch):
+    monkeypatch.setitem(_generators, JaqcdProgram, _generators[JaqcdProgram])
+
+    @register_generator(JaqcdProgram)
+    def single_h(size, rng, **options):
+        return {"instructions": [{"type": "h", "target": 0}] * size}
+
+    assert synthetic_payload(JaqcdProgram, size=2) == {
+        "instructions": [{"type": "h", "target": 0}] * 2
+    }
+
+
+@pytest.mark.xfail(raises=UnsupportedFieldError)
+def test_unsupported_field():
+    class Unsupported(BaseModel):
+        value: bytes
+
+    synthetic_payload(Unsupported)
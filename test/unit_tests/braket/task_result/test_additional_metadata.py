@@ -91,3 +91,24 @@ def test_incorrect_action(dwave_metadata):
 @pytest.mark.xfail(raises=ValidationError)
 def test_incorrect_dwave_metadata(jacqd_program):
     AdditionalMetadata(dwaveMetadata=jacqd_program)
+
+
+def test_additional_metadata_action_dispatch(
+    jacqd_program, openqasm_program, blackbird_program, problem, ahs_program
+):
+    for action in jacqd_program, openqasm_program, blackbird_program, problem, ahs_program:
+        metadata = AdditionalMetadata.parse_obj({"action": action.dict()})
+        assert type(metadata.action) is type(action)
+        assert metadata.action == action
+
+
+def test_additional_metadata_action_without_header(openqasm_program):
+    metadata = AdditionalMetadata.parse_obj({"action": {"source": openqasm_program.source}})
+    assert metadata.action == openqasm_program
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_incorrect_action_for_header(openqasm_program):
+    action = openqasm_program.dict()
+    action["braketSchemaHeader"]["name"] = "braket.ir.jaqcd.program"
+    AdditionalMetadata.parse_obj({"action": action})
@@ -11,11 +11,14 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
+import numpy as np
 import pytest
 from pydantic.v1 import ValidationError
 
-from braket.ir.jaqcd.results import Probability
+from braket.ir.jaqcd.results import Expectation, Probability
 from braket.task_result.gate_model_task_result_v1 import GateModelTaskResult, ResultTypeValue
+from braket.task_result.measurement_probabilities import MeasurementProbabilityArrays
+from braket.task_result.output_columns import OutputColumns
 
 
 @pytest.fixture
@@ -329,3 +332,165 @@ def test_outputs_default_is_none(
         additionalMetadata=additional_metadata_gate_model,
     )
     assert result.outputs is None
+
+
+def test_result_type_value_dispatch():
+    result_type = ResultTypeValue.parse_obj(
+        {"type": {"type": "expectation", "targets": [0], "observable": ["z"]}, "value": 0.5}
+    )
+    assert type(result_type.type) is Expectation
+    assert result_type.type == Expectation(targets=[0], observable=["z"])
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_result_type_value_invalid_for_type():
+    ResultTypeValue.parse_obj({"type": {"type": "probability", "targets": [-1]}, "value": 0.5})
+
+
+def test_parse_raw_numpy(task_metadata, additional_metadata_gate_model, measured_qubits):
+    result = GateModelTaskResult(
+        measurements=[[1, 0], [0, 1], [1, 1]],
+        measuredQubits=measured_qubits,
+        taskMetadata=task_metadata,
+        additionalMetadata=additional_metadata_gate_model,
+    )
+    parsed = GateModelTaskResult.parse_raw_numpy(result.json())
+    assert isinstance(parsed.measurements, np.ndarray)
+    assert parsed.measurements.dtype == np.uint8
+    np.testing.assert_array_equal(parsed.measurements, [[1, 0], [0, 1], [1, 1]])
+    assert parsed.taskMetadata == task_metadata
+    assert parsed.json() == result.json()
+    assert GateModelTaskResult.parse_raw(parsed.json()) == result
+
+
+def test_parse_raw_numpy_equality(task_metadata, additional_metadata_gate_model, measured_qubits):
+    result = GateModelTaskResult(
+        measurements=[[1, 0], [0, 1], [1, 1]],
+        measuredQubits=measured_qubits,
+        taskMetadata=task_metadata,
+        additionalMetadata=additional_metadata_gate_model,
+    )
+    parsed = GateModelTaskResult.parse_raw_numpy(result.json())
+    assert parsed == GateModelTaskResult.parse_raw(result.json())
+    assert result == parsed
+    assert parsed == GateModelTaskResult.parse_raw_numpy(result.json())
+    assert parsed != result.copy(update={"measurements": [[1, 0], [0, 1], [0, 1]]})
+    assert parsed != result.copy(update={"measurements": [[1, 0], [0, 1]]})
+    assert parsed != result.copy(update={"measurements": [[1, 0], [0, 1], [1]]})
+    assert parsed != result.copy(update={"measurements": None})
+
+
+def test_parse_obj_numpy_without_measurements(
+    task_metadata, additional_metadata_gate_model, measured_qubits, measurement_probabilities
+):
+    result = GateModelTaskResult(
+        measurementProbabilities=measurement_probabilities,
+        measuredQubits=measured_qubits,
+        taskMetadata=task_metadata,
+        additionalMetadata=additional_metadata_gate_model,
+    )
+    assert GateModelTaskResult.parse_obj_numpy(result.dict()) == result
+
+
+@pytest.mark.parametrize(
+    "measurements",
+    [[[1, 0], [1]], [[1, 2]], [[0, -1]], [["0", "1"]], [[0.0, 1.0]], [], [[]], [0, 1]],
+)
+@pytest.mark.xfail(raises=ValidationError)
+def test_parse_obj_numpy_invalid_measurements(
+    measurements, task_metadata, additional_metadata_gate_model
+):
+    GateModelTaskResult.parse_obj_numpy(
+        {
+            "measurements": measurements,
+            "taskMetadata": task_metadata,
+            "additionalMetadata": additional_metadata_gate_model,
+        }
+    )
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_parse_raw_numpy_invalid_json():
+    GateModelTaskResult.parse_raw_numpy("{not json")
+
+
+def test_parse_raw_numpy_probability_arrays(
+    task_metadata, additional_metadata_gate_model, measured_qubits, measurement_probabilities
+):
+    result = GateModelTaskResult(
+        measurementProbabilities=measurement_probabilities,
+        measuredQubits=measured_qubits,
+        taskMetadata=task_metadata,
+        additionalMetadata=additional_metadata_gate_model,
+    )
+    parsed = GateModelTaskResult.parse_raw_numpy(result.json(), probability_arrays=True)
+    assert isinstance(parsed.measurementProbabilities, MeasurementProbabilityArrays)
+    np.testing.assert_array_equal(parsed.measurementProbabilities.indices, [2, 1])
+    assert parsed.json() == result.json()
+    assert parsed == result
+    assert result == parsed
+    assert parsed != result.copy(update={"measurementProbabilities": {"10": 1.0}})
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_parse_obj_numpy_invalid_probability_arrays(task_metadata, additional_metadata_gate_model):
+    GateModelTaskResult.parse_obj_numpy(
+        {
+            "measurementProbabilities": {"0": 0.5, "11": 0.5},
+            "taskMetadata": task_metadata,
+            "additionalMetadata": additional_metadata_gate_model,
+        },
+        probability_arrays=True,
+    )
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_measurement_probabilities_different_lengths(task_metadata, additional_metadata_gate_model):
+    GateModelTaskResult(
+        measurementProbabilities={"0": 0.5, "11": 0.5},
+        taskMetadata=task_metadata,
+        additionalMetadata=additional_metadata_gate_model,
+    )
+
+
+def test_parse_raw_numpy_output_columns(task_metadata, additional_metadata_gate_model):
+    outputs = [{"c": [0, 1], "f": 1.57}, {"c": [None, 1], "f": 0.5}]
+    result = GateModelTaskResult(
+        outputs=outputs,
+        taskMetadata=task_metadata,
+        additionalMetadata=additional_metadata_gate_model,
+    )
+    parsed = GateModelTaskResult.parse_raw_numpy(result.json(), output_columns=True)
+    assert isinstance(parsed.outputs, OutputColumns)
+    np.testing.assert_array_equal(parsed.outputs["c"].mask, [[False, False], [True, False]])
+    assert parsed.json() == result.json()
+    assert parsed == result
+    assert result == parsed
+    assert parsed != result.copy(
+        update={"outputs": [{"c": [0, 1], "f": 1.57}, {"c": [1, 1], "f": 0.5}]}
+    )
+
+
+def test_parse_obj_numpy_irregular_outputs(task_metadata, additional_metadata_gate_model):
+    outputs = [{"c": 1}, {"c": 1.5, "d": True}]
+    result = GateModelTaskResult.parse_obj_numpy(
+        {
+            "outputs": outputs,
+            "taskMetadata": task_metadata,
+            "additionalMetadata": additional_metadata_gate_model,
+        },
+        output_columns=True,
+    )
+    assert result.outputs == outputs
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_parse_obj_numpy_invalid_outputs(task_metadata, additional_metadata_gate_model):
+    GateModelTaskResult.parse_obj_numpy(
+        {
+            "outputs": [{"c": "not-a-scalar"}],
+            "taskMetadata": task_metadata,
+            "additionalMetadata": additional_metadata_gate_model,
+        },
+        output_columns=True,
+    )
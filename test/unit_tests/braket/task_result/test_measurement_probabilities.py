@@ -0,0 +1,105 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import numpy as np
+import pytest
+from pydantic.v1 import BaseModel, ValidationError
+
+from braket.task_result import MeasurementProbabilities, MeasurementProbabilityArrays
+
+
+class Distribution(BaseModel):
+    probabilities: MeasurementProbabilities
+
+
+def test_valid():
+    probabilities = {"00": 0.25, "01": 0.25, "10": 0, "11": "0.5"}
+    assert Distribution(probabilities=probabilities).probabilities == {
+        "00": 0.25,
+        "01": 0.25,
+        "10": 0.0,
+        "11": 0.5,
+    }
+
+
+def test_empty():
+    assert Distribution(probabilities={}).probabilities == {}
+
+
+@pytest.mark.parametrize(
+    "probabilities",
+    [
+        "invalid",
+        {"": 1.0},
+        {"02": 1.0},
+        {"0b": 1.0},
+        {"00": 0.5, "1": 0.5},
+        {"0": -0.1},
+        {"0": 1.1},
+        {"0": float("nan")},
+        {"0": None},
+        {"0": "a"},
+    ],
+)
+@pytest.mark.xfail(raises=ValidationError)
+def test_invalid(probabilities):
+    Distribution(probabilities=probabilities)
+
+
+def test_arrays_from_dict():
+    arrays = MeasurementProbabilityArrays.from_dict({"110": 0.5, "001": 0.25, "000": 0.25})
+    assert arrays.qubit_count == 3
+    assert arrays.indices.dtype == np.uint64
+    np.testing.assert_array_equal(arrays.indices, [6, 1, 0])
+    np.testing.assert_array_equal(arrays.probabilities, [0.5, 0.25, 0.25])
+
+
+def test_arrays_equality():
+    arrays = MeasurementProbabilityArrays.from_dict({"10": 0.5, "01": 0.5})
+    reordered = MeasurementProbabilityArrays.from_dict({"01": 0.5, "10": 0.5})
+    assert arrays == reordered
+    assert hash(arrays) == hash(reordered)
+    assert arrays == {"01": 0.5, "10": 0.5}
+    assert {"10": 0.5, "01": 0.5} == arrays
+    assert arrays != MeasurementProbabilityArrays.from_dict({"10": 0.25, "01": 0.75})
+    assert arrays != MeasurementProbabilityArrays.from_dict({"010": 0.5, "001": 0.5})
+    assert arrays != {"10": 0.5}
+    assert len({arrays, reordered}) == 1
+
+
+def test_arrays_round_trip():
+    probabilities = {"1" * 64: 0.5, "0" * 63 + "1": 0.5}
+    arrays = MeasurementProbabilityArrays.from_dict(probabilities)
+    assert arrays.indices[0] == np.iinfo(np.uint64).max
+    assert arrays.to_dict() == probabilities
+    assert list(arrays.to_dict()) == list(probabilities)
+
+
+@pytest.mark.parametrize(
+    "probabilities",
+    [
+        {},
+        [0.5, 0.5],
+        {"0": 0.5, "11": 0.5},
+        {"2": 1.0},
+        {"é": 1.0},
+        {0: 1.0},
+        {"0" * 65: 1.0},
+        {"0": 1.5},
+        {"0": "a"},
+    ],
+)
+def test_arrays_from_dict_invalid(probabilities):
+    with pytest.raises(ValueError):
+        MeasurementProbabilityArrays.from_dict(probabilities)
@@ -0,0 +1,88 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import numpy as np
+import pytest
+
+from braket.task_result import OutputColumns
+
+
+@pytest.mark.parametrize(
+    "outputs",
+    [
+        [{"c1": 1, "c2": [0, 1], "f": 1.57}, {"c1": 0, "c2": [0, 0], "f": -1.5}],
+        [{"flag": True}, {"flag": None}],
+        [{"c": [None, 1], "n": None}, {"c": [0, None], "n": None}],
+        [{"c": [True, False]}, {"c": [None, True]}],
+        [{"empty": []}, {"empty": []}],
+    ],
+)
+def test_round_trip(outputs):
+    columns = OutputColumns.from_outputs(outputs)
+    assert columns.shots == len(outputs)
+    assert list(columns.columns) == list(outputs[0])
+    assert columns.to_outputs() == outputs
+
+
+def test_equality():
+    outputs = [{"c1": 1, "c2": [0, 1], "f": 1.57}, {"c1": 0, "c2": [0, 0], "f": -1.5}]
+    columns = OutputColumns.from_outputs(outputs)
+    assert columns == OutputColumns.from_outputs(outputs)
+    assert columns == outputs
+    assert outputs == columns
+    assert columns != OutputColumns.from_outputs(outputs[:1])
+    assert columns != outputs[:1]
+
+
+def test_equality_undefined_values():
+    columns = OutputColumns.from_outputs([{"b": [0, None]}, {"b": [1, 1]}])
+    assert columns != OutputColumns.from_outputs([{"b": [0, 0]}, {"b": [1, 1]}])
+    assert columns["b"] != OutputColumns.from_outputs([{"b": [0, 0]}, {"b": [1, 1]}])["b"]
+
+
+def test_columns():
+    columns = OutputColumns.from_outputs(
+        [{"c": [0, 1], "f": 0.5, "b": True}, {"c": [1, None], "f": 1.5, "b": None}]
+    )
+    assert columns["c"].values.dtype == np.int64
+    np.testing.assert_array_equal(columns["c"].values, [[0, 1], [1, 0]])
+    np.testing.assert_array_equal(columns["c"].mask, [[False, False], [False, True]])
+    assert columns["f"].values.dtype == np.float64
+    np.testing.assert_array_equal(columns["f"].values, [0.5, 1.5])
+    assert columns["b"].values.dtype == bool
+    np.testing.assert_array_equal(columns["b"].mask, [False, True])
+
+
+@pytest.mark.parametrize(
+    "outputs",
+    [
+        [],
+        "invalid",
+        [{}],
+        [{"": 1}],
+        [{"c": "not-a-scalar"}],
+        [{"c": [1, 1.5]}],
+        [{"c": [[0, 1]]}],
+        [{"c": float("inf")}],
+        [{"c": 2**64}],
+        [{"a": 1}, {"b": 1}],
+        [{"a": 1, "b": 1}, {"b": 1, "a": 1}],
+        [{"c": 1}, {"c": 1.5}],
+        [{"c": [1]}, {"c": [1, 0]}],
+        [{"c": [1]}, {"c": None}],
+    ],
+)
+def test_invalid_or_irregular(outputs):
+    with pytest.raises(ValueError):
+        OutputColumns.from_outputs(outputs)
@@ -0,0 +1,126 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import base64
+
+import numpy as np
+import pytest
+from pydantic.v1 import ValidationError
+
+from braket.ir.jaqcd import DensityMatrix, Probability, StateVector
+from braket.task_result import GateModelTaskResult, PackedComplexArray, ResultTypeValue
+
+
+@pytest.fixture
+def state_vector():
+    return [[0.5, 0.5], [0.0, 0.0], [0.0, -0.5], [0.5, 0.0]]
+
+
+def test_from_values(state_vector):
+    packed = PackedComplexArray.from_values(state_vector)
+    assert packed.shape == [4]
+    assert packed.to_values() == state_vector
+    np.testing.assert_array_equal(packed.to_array(), [0.5 + 0.5j, 0, -0.5j, 0.5])
+
+
+def test_from_array():
+    matrix = np.array([[0.5, 0.5j], [-0.5j, 0.5]])
+    packed = PackedComplexArray.from_values(matrix)
+    assert packed.shape == [2, 2]
+    np.testing.assert_array_equal(packed.to_array(), matrix)
+    assert packed.to_values() == [[[0.5, 0.0], [0.0, 0.5]], [[0.0, -0.5], [0.5, 0.0]]]
+
+
+def test_to_array_cached(state_vector):
+    packed = PackedComplexArray.parse_raw(PackedComplexArray.from_values(state_vector).json())
+    array = packed.to_array()
+    assert packed.to_array() is array
+    assert array.dtype == np.complex128
+    assert not array.flags.writeable
+
+
+@pytest.mark.parametrize("values", [[], [1.0, 2.0], [[1.0, 2.0, 3.0]], np.zeros((2, 2, 2))])
+def test_from_values_invalid(values):
+    with pytest.raises(ValueError):
+        PackedComplexArray.from_values(values)
+
+
+@pytest.mark.parametrize(
+    "shape, data",
+    [
+        ([2], base64.b64encode(bytes(16)).decode()),
+        ([1, 1, 1], base64.b64encode(bytes(16)).decode()),
+        ([0], ""),
+    ],
+)
+@pytest.mark.xfail(raises=ValidationError)
+def test_invalid(shape, data):
+    PackedComplexArray(shape=shape, data=data)
+
+
+def test_to_array_invalid_base64():
+    packed = PackedComplexArray(shape=[1], data="!" * 24)
+    with pytest.raises(ValueError):
+        packed.to_array()
+
+
+def test_result_type_value(state_vector):
+    packed = PackedComplexArray.from_values(state_vector)
+    result_type = ResultTypeValue.parse_raw(
+        ResultTypeValue(type=StateVector(), value=packed).json()
+    )
+    assert result_type.value == packed
+    assert type(result_type.value) is PackedComplexArray
+
+
+def test_result_type_value_density_matrix():
+    packed = PackedComplexArray.from_values(np.eye(2))
+    result_type = ResultTypeValue.parse_obj(
+        {"type": {"type": "densitymatrix"}, "value": packed.dict()}
+    )
+    np.testing.assert_array_equal(result_type.value.to_array(), np.eye(2))
+
+
+@pytest.mark.parametrize(
+    "result_type, values",
+    [
+        (StateVector(), np.eye(2)),
+        (DensityMatrix(), np.ones(2)),
+        (Probability(), np.ones(2)),
+    ],
+)
+@pytest.mark.xfail(raises=ValidationError)
+def test_result_type_value_invalid(result_type, values):
+    ResultTypeValue(type=result_type, value=PackedComplexArray.from_values(values).dict())
+
+
+def test_result_type_value_invalid_type_only(state_vector):
+    packed = PackedComplexArray.from_values(state_vector)
+    with pytest.raises(ValidationError) as error:
+        ResultTypeValue.parse_obj({"type": {"type": "notatype"}, "value": packed.dict()})
+    assert all(e["loc"][0] == "type" for e in error.value.errors())
+
+
+def test_gate_model_task_result(state_vector, task_metadata, additional_metadata_gate_model):
+    result = GateModelTaskResult(
+        resultTypes=[
+            {"type": StateVector(), "value": PackedComplexArray.from_values(state_vector)},
+            {"type": Probability(), "value": [0.5, 0.5]},
+        ],
+        taskMetadata=task_metadata,
+        additionalMetadata=additional_metadata_gate_model,
+    )
+    parsed = GateModelTaskResult.parse_raw(result.json())
+    assert parsed == result
+    assert parsed.resultTypes[0].value.to_values() == state_vector
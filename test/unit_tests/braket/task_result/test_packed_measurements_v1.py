@@ -0,0 +1,133 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import base64
+import json
+import random
+
+import numpy as np
+import pytest
+from jsonschema import ValidationError as SchemaValidationError
+from jsonschema import validate
+from pydantic.v1 import ValidationError
+
+from braket.schema_common import BraketSchemaBase
+from braket.task_result import GateModelTaskResult, PackedMeasurements, ProgramSetExecutableResult
+from braket.task_result.packed_measurements_v1 import unpack_measurements
+
+
+@pytest.fixture(params=[1, 3, 8, 9, 17])
+def measurements(request):
+    rng = random.Random(request.param)
+    return [[rng.randint(0, 1) for _ in range(request.param)] for _ in range(5)]
+
+
+def test_round_trip(measurements):
+    packed = PackedMeasurements.from_measurements(measurements)
+    assert packed.shape == [len(measurements), len(measurements[0])]
+    assert packed.to_measurements() == measurements
+    assert PackedMeasurements.parse_raw(packed.json()) == packed
+    np.testing.assert_array_equal(packed.to_array(), measurements)
+    assert packed.to_array().dtype == np.uint8
+
+
+def test_from_array(measurements):
+    packed = PackedMeasurements.from_measurements(np.array(measurements))
+    assert packed == PackedMeasurements.from_measurements(measurements)
+
+
+def test_packed_layout():
+    packed = PackedMeasurements.from_measurements([[1, 0, 1], [0, 1, 1]])
+    assert base64.b64decode(packed.data) == bytes([0b10100000, 0b01100000])
+
+
+@pytest.mark.parametrize(
+    "shape, data",
+    [
+        ([2, 3], base64.b64encode(bytes([0b10100000])).decode()),
+        ([1, 3], "not base64!"),
+        ([1, 3], base64.b64encode(bytes([0b10100001])).decode()),
+        ([0, 3], ""),
+        ([2], "oGA="),
+    ],
+)
+@pytest.mark.xfail(raises=ValidationError)
+def test_invalid_packed_measurements(shape, data):
+    PackedMeasurements(shape=shape, data=data)
+
+
+@pytest.mark.parametrize(
+    "measurements", [[[1, 0], [1]], [[0, 2]], np.array([[0, 2]]), np.array([0, 1])]
+)
+@pytest.mark.xfail(raises=ValueError)
+def test_from_invalid_measurements(measurements):
+    PackedMeasurements.from_measurements(measurements)
+
+
+def test_unpack_measurements(measurements):
+    packed = PackedMeasurements.from_measurements(measurements)
+    assert unpack_measurements(packed) == measurements
+    assert unpack_measurements(packed.dict()) == measurements
+    np.testing.assert_array_equal(unpack_measurements(packed, as_array=True), measurements)
+    assert unpack_measurements(measurements) is measurements
+    assert unpack_measurements(None) is None
+
+
+def test_gate_model_task_result(measurements, task_metadata, additional_metadata_gate_model):
+    result = GateModelTaskResult(
+        measurements=measurements,
+        taskMetadata=task_metadata,
+        additionalMetadata=additional_metadata_gate_model,
+    )
+    payload = result.dict()
+    payload["measurements"] = PackedMeasurements.from_measurements(measurements).dict()
+    packed_json = GateModelTaskResult.__config__.json_dumps(payload)
+    assert BraketSchemaBase.parse_raw_schema(packed_json) == result
+    assert GateModelTaskResult.parse_raw_numpy(packed_json).json() == result.json()
+
+
+def test_program_set_executable_result(measurements):
+    result = ProgramSetExecutableResult(
+        inputsIndex=0,
+        measurements=PackedMeasurements.from_measurements(measurements),
+    )
+    assert result.measurements == measurements
+
+
+def test_gate_model_task_result_schema(measurements, task_metadata, additional_metadata_gate_model):
+    result = GateModelTaskResult(
+        measurements=measurements,
+        taskMetadata=task_metadata,
+        additionalMetadata=additional_metadata_gate_model,
+    )
+    payload = json.loads(result.json(exclude_none=True))
+    validate(payload, GateModelTaskResult.schema())
+    payload["measurements"] = json.loads(PackedMeasurements.from_measurements(measurements).json())
+    validate(payload, GateModelTaskResult.schema())
+    assert GateModelTaskResult.parse_obj(payload) == result
+
+
+def test_program_set_executable_result_schema(measurements):
+    payload = {
+        "inputsIndex": 0,
+        "measurements": json.loads(PackedMeasurements.from_measurements(measurements).json()),
+    }
+    validate(payload, ProgramSetExecutableResult.schema())
+    assert ProgramSetExecutableResult.parse_obj(payload).measurements == measurements
+
+
+@pytest.mark.xfail(raises=SchemaValidationError)
+def test_invalid_packed_measurements_schema():
+    payload = {"inputsIndex": 0, "measurements": {"shape": "invalid", "data": 1}}
+    validate(payload, ProgramSetExecutableResult.schema())
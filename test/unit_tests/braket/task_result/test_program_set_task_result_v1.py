@@ -11,9 +11,11 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
+import numpy as np
 import pytest
 from pydantic.v1 import ValidationError
 
+from braket.device_schema.iqm import IqmDeviceParameters
 from braket.ir.openqasm import Program
 from braket.task_result.program_result_v1 import ProgramResult
 from braket.task_result.program_set_executable_cancellation_v1 import (
@@ -147,6 +149,35 @@ def test_program_result_with_mixed_results(
     assert isinstance(subtask_result.executableResults[1], ProgramSetExecutableFailure)
 
 
+def test_program_result_dispatch(
+    valid_batch_executable_result, valid_executable_failure, additional_metadata_gate_model
+):
+    subtask_result = ProgramResult.parse_obj(
+        {
+            "source": "source.json",
+            "additionalMetadata": additional_metadata_gate_model.dict(),
+            "executableResults": [
+                valid_batch_executable_result.dict(),
+                valid_executable_failure.dict(),
+            ],
+        }
+    )
+    assert subtask_result.executableResults == [
+        valid_batch_executable_result,
+        valid_executable_failure,
+    ]
+    assert type(subtask_result.executableResults[1]) is ProgramSetExecutableFailure
+
+
+def test_program_set_task_metadata_device_parameters_dispatch(valid_task_metadata):
+    task_metadata = valid_task_metadata.dict()
+    task_metadata["deviceParameters"] = IqmDeviceParameters(
+        paradigmParameters={"qubitCount": 3}
+    ).dict()
+    parsed = ProgramSetTaskMetadata.parse_obj(task_metadata)
+    assert type(parsed.deviceParameters) is IqmDeviceParameters
+
+
 def test_missing_properties():
     with pytest.raises(ValidationError):
         ProgramSetTaskResult()
@@ -215,3 +246,18 @@ def test_invalid_device_parameters():
             totalFailedExecutables=0,
         )
     assert "deviceParameters" in str(exc_info.value)
+
+
+def test_executable_result_parse_raw_numpy(valid_batch_executable_result):
+    parsed = ProgramSetExecutableResult.parse_raw_numpy(
+        valid_batch_executable_result.json(), probability_arrays=True
+    )
+    np.testing.assert_array_equal(parsed.measurements, [[0, 1], [1, 0]])
+    np.testing.assert_array_equal(parsed.measurementProbabilities.indices, [0, 1, 2, 3])
+    assert parsed.json() == valid_batch_executable_result.json()
+    assert parsed == valid_batch_executable_result
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_executable_result_invalid_measurement_probabilities():
+    ProgramSetExecutableResult(inputsIndex=0, measurementProbabilities={"02": 1.0})
@@ -14,6 +14,9 @@
 import pytest
 from pydantic.v1 import ValidationError
 
+from braket.device_schema.iqm import IqmDeviceParameters
+from braket.device_schema.rigetti import RigettiDeviceParameters
+from braket.device_schema.xanadu import XanaduDeviceParameters
 from braket.task_result.task_metadata_v1 import TaskMetadata
 
 
@@ -108,3 +111,37 @@ def test_correct_metadata_all(device_parameters, id, device_id, shots):
 def test_incorrect_shots(id, device_id, shots):
     with pytest.raises(ValidationError):
         TaskMetadata(id=id, deviceId=device_id, shots=shots)
+
+
+@pytest.mark.parametrize(
+    "device_parameters_class",
+    [RigettiDeviceParameters, XanaduDeviceParameters, IqmDeviceParameters],
+)
+def test_device_parameters_dispatch(device_parameters_class, id, device_id, shots):
+    device_parameters = device_parameters_class.parse_obj({"paradigmParameters": {"qubitCount": 1}})
+    metadata = TaskMetadata.parse_obj(
+        {
+            "id": id,
+            "deviceId": device_id,
+            "shots": shots,
+            "deviceParameters": device_parameters.dict(),
+        }
+    )
+    assert type(metadata.deviceParameters) is device_parameters_class
+    assert metadata.deviceParameters == device_parameters
+
+
+def test_incorrect_device_parameters_for_header(id, device_id, shots):
+    with pytest.raises(ValidationError):
+        TaskMetadata(
+            id=id,
+            deviceId=device_id,
+            shots=shots,
+            deviceParameters={
+                "braketSchemaHeader": {
+                    "name": "braket.device_schema.rigetti.rigetti_device_parameters",
+                    "version": "1",
+                },
+                "paradigmParameters": {"qubitCount": -1},
+            },
+        )
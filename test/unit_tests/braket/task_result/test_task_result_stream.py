@@ -0,0 +1,207 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import io
+import json
+
+import pytest
+from pydantic.v1 import ValidationError
+
+from braket.task_result import (
+    AnalogHamiltonianSimulationShotMeasurement,
+    AnalogHamiltonianSimulationTaskResult,
+    AnnealingTaskResult,
+    GateModelTaskResult,
+    PackedMeasurements,
+    PhotonicModelTaskResult,
+    TaskResultStream,
+)
+
+
+@pytest.fixture
+def gate_model_result(task_metadata, additional_metadata_gate_model):
+    return GateModelTaskResult(
+        measurements=[[0, 1, 1], [1, 0, 1], [1, 1, 1], [0, 0, 0]],
+        measuredQubits=[0, 1, 2],
+        taskMetadata=task_metadata,
+        additionalMetadata=additional_metadata_gate_model,
+    )
+
+
+@pytest.fixture
+def ahs_result(task_metadata):
+    shot = {
+        "shotMetadata": {"shotStatus": "Success"},
+        "shotResult": {"preSequence": [1, 1, 0], "postSequence": [0, 1, 0]},
+    }
+    return AnalogHamiltonianSimulationTaskResult(
+        taskMetadata=task_metadata, measurements=[shot, shot]
+    )
+
+
+@pytest.fixture
+def photonic_result(task_metadata, additional_metadata_photonic_model):
+    return PhotonicModelTaskResult(
+        measurements=[[[1, 2, 0]], [[0, 0, 3]]],
+        taskMetadata=task_metadata,
+        additionalMetadata=additional_metadata_photonic_model,
+    )
+
+
+def _stream(result, chunk_size=16, binary=True):
+    text = result.json()
+    file = io.BytesIO(text.encode()) if binary else io.StringIO(text)
+    return TaskResultStream(file, type(result), chunk_size=chunk_size)
+
+
+@pytest.mark.parametrize("binary", [False, True])
+@pytest.mark.parametrize("chunk_size", [1, 16, 1 << 20])
+def test_gate_model(gate_model_result, binary, chunk_size):
+    stream = _stream(gate_model_result, chunk_size, binary)
+    assert list(stream.shots()) == gate_model_result.measurements
+    assert stream.result == gate_model_result.copy(update={"measurements": None})
+
+
+def test_ahs(ahs_result):
+    stream = _stream(ahs_result)
+    shots = list(stream.shots())
+    assert all(isinstance(shot, AnalogHamiltonianSimulationShotMeasurement) for shot in shots)
+    assert shots == ahs_result.measurements
+    assert stream.result.taskMetadata == ahs_result.taskMetadata
+
+
+def test_photonic(photonic_result):
+    stream = _stream(photonic_result)
+    assert list(stream.shots()) == photonic_result.measurements
+    assert stream.result.additionalMetadata == photonic_result.additionalMetadata
+
+
+def test_result_before_shots(gate_model_result):
+    stream = _stream(gate_model_result)
+    assert stream.result.taskMetadata == gate_model_result.taskMetadata
+    assert list(stream.shots()) == gate_model_result.measurements
+
+
+def test_result_before_shots_not_seekable(gate_model_result):
+    file = io.BytesIO(gate_model_result.json().encode())
+    file.seekable = lambda: False
+    stream = TaskResultStream(file, GateModelTaskResult)
+    assert stream.result.taskMetadata == gate_model_result.taskMetadata
+    with pytest.raises(RuntimeError):
+        stream.shots()
+
+
+def test_shots_before_result_not_seekable(gate_model_result):
+    file = io.BytesIO(gate_model_result.json().encode())
+    file.seekable = lambda: False
+    stream = TaskResultStream(file, GateModelTaskResult)
+    assert list(stream.shots()) == gate_model_result.measurements
+    assert stream.result.taskMetadata == gate_model_result.taskMetadata
+
+
+def test_result_matches_parsed(gate_model_result):
+    payload = json.loads(gate_model_result.json(exclude_none=True))
+    payload["unknown"] = {"a": 1}
+    stream = TaskResultStream(io.StringIO(json.dumps(payload)), GateModelTaskResult)
+    del payload["measurements"]
+    expected = GateModelTaskResult.parse_obj(payload)
+    assert stream.result == expected
+    assert stream.result.__fields_set__ == expected.__fields_set__
+    assert stream.result.json(exclude_unset=True) == expected.json(exclude_unset=True)
+
+
+@pytest.mark.parametrize("binary", [False, True])
+@pytest.mark.parametrize("chunk_size", [1, 16, 1 << 20])
+def test_result_during_shots(gate_model_result, binary, chunk_size):
+    stream = _stream(gate_model_result, chunk_size, binary)
+    shots = stream.shots()
+    assert next(shots) == gate_model_result.measurements[0]
+    assert stream.result.measuredQubits == [0, 1, 2]
+    assert list(shots) == gate_model_result.measurements[1:]
+
+
+def test_result_before_iterating_shots(gate_model_result):
+    stream = _stream(gate_model_result)
+    shots = stream.shots()
+    assert stream.result.measuredQubits == [0, 1, 2]
+    assert list(shots) == gate_model_result.measurements
+
+
+def test_result_during_shots_not_seekable(gate_model_result):
+    file = io.BytesIO(gate_model_result.json().encode())
+    file.seekable = lambda: False
+    stream = TaskResultStream(file, GateModelTaskResult, chunk_size=16)
+    shots = stream.shots()
+    assert next(shots) == gate_model_result.measurements[0]
+    with pytest.raises(RuntimeError):
+        assert stream.result
+    assert list(shots) == gate_model_result.measurements[1:]
+    assert stream.result.measuredQubits == [0, 1, 2]
+
+
+def test_shots_read_once(gate_model_result):
+    stream = _stream(gate_model_result)
+    list(stream.shots())
+    with pytest.raises(RuntimeError):
+        stream.shots()
+
+
+def test_packed_measurements(gate_model_result):
+    payload = gate_model_result.dict()
+    payload["measurements"] = PackedMeasurements.from_measurements(
+        gate_model_result.measurements
+    ).dict()
+    stream = TaskResultStream(io.StringIO(json.dumps(payload)), GateModelTaskResult)
+    assert list(stream.shots()) == gate_model_result.measurements
+
+
+def test_no_measurements(gate_model_result):
+    stream = _stream(gate_model_result.copy(update={"measurements": None}))
+    assert list(stream.shots()) == []
+    assert stream.result.measurements is None
+
+
+@pytest.mark.parametrize("measurements", [[[0, 1], [0, 2]], [], [[]], "invalid"])
+@pytest.mark.xfail(raises=ValidationError)
+def test_invalid_measurements(gate_model_result, measurements):
+    payload = json.loads(gate_model_result.json())
+    payload["measurements"] = measurements
+    list(TaskResultStream(io.StringIO(json.dumps(payload)), GateModelTaskResult).shots())
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_invalid_header(gate_model_result, braket_schema_header):
+    payload = json.loads(gate_model_result.json())
+    payload["braketSchemaHeader"] = braket_schema_header.dict()
+    next(TaskResultStream(io.StringIO(json.dumps(payload)), GateModelTaskResult).shots())
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_invalid_json(gate_model_result):
+    list(TaskResultStream(io.StringIO(gate_model_result.json()[:-10]), GateModelTaskResult).shots())
+
+
+def test_missing_task_metadata(gate_model_result):
+    payload = json.loads(gate_model_result.json())
+    del payload["taskMetadata"]
+    stream = TaskResultStream(io.StringIO(json.dumps(payload)), GateModelTaskResult)
+    with pytest.raises(ValidationError):
+        assert stream.result
+    with pytest.raises(ValidationError):
+        assert stream.result
+
+
+def test_unsupported_schema():
+    with pytest.raises(ValueError):
+        TaskResultStream(io.StringIO("{}"), AnnealingTaskResult)
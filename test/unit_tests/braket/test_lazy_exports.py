@@ -0,0 +1,181 @@
+# Copyright Amazon.com Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+import ast
+import importlib
+import inspect
+import json
+import subprocess
+import sys
+
+import pytest
+
+packages = ["braket.device_schema", "braket.task_result"]
+
+# Importing a package, once pydantic and braket.schema_common are loaded, must take less than
+# this fraction of the time taken to then build all of its exports
+IMPORT_TIME_BUDGET = 0.5
+
+_import_time_script = """
+import json, sys, time
+import braket.schema_common
+start = time.perf_counter()
+package = __import__("{package}", fromlist=["__all__"])
+imported = time.perf_counter()
+modules = [name for name in sys.modules if name.startswith("{package}.")]
+for name in package.__all__:
+    getattr(package, name)
+built = time.perf_counter()
+print(json.dumps({{
+    "import": imported - start,
+    "exports": built - imported,
+    "modules": modules,
+}}))
+"""
+
+
+@pytest.mark.parametrize("package", packages)
+def test_import_time(package):
+    output = subprocess.run(
+        [sys.executable, "-c", _import_time_script.format(package=package)],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    timings = json.loads(output)
+    assert timings["modules"] == []
+    assert timings["import"] < IMPORT_TIME_BUDGET * timings["exports"]
+
+
+@pytest.mark.parametrize("package", packages)
+def test_exports(package):
+    module = importlib.import_module(package)
+    for name in module.__all__:
+        export = getattr(module, name)
+        assert getattr(inspect.getmodule(export), export.__name__) is export
+        assert name in dir(module)
+
+
+@pytest.mark.parametrize("package", packages)
+def test_type_checking_imports_match_exports(package):
+    module = importlib.import_module(package)
+    tree = ast.parse(inspect.getsource(module))
+    type_checking = next(node for node in tree.body if isinstance(node, ast.If))
+    imported = {
+        alias.asname or alias.name
+        for node in type_checking.body
+        for alias in node.names
+        if node.module.startswith(f"{package}.")
+    }
+    assert imported == set(module.__all__)
+
+
+def test_from_import():
+    from braket.device_schema import StandardizedGateModelQpuDevicePropertiesV3
+    from braket.device_schema.standardized_gate_model_qpu_device_properties_v3 import (
+        StandardizedGateModelQpuDeviceProperties,
+    )
+    from braket.task_result import GateModelTaskResult
+    from braket.task_result.gate_model_task_result_v1 import GateModelTaskResult as Result
+
+    assert StandardizedGateModelQpuDevicePropertiesV3 is StandardizedGateModelQpuDeviceProperties
+    assert GateModelTaskResult is Result
+
+
+_submodule_script = """
+import {package}
+print({package}.{submodule}.__name__)
+"""
+
+
+@pytest.mark.parametrize(
+    "package, submodule",
+    [
+        ("braket.device_schema", "dwave"),
+        ("braket.device_schema", "device_capabilities"),
+        ("braket.task_result", "gate_model_task_result_v1"),
+    ],
+)
+def test_submodule_attribute(package, submodule):
+    output = subprocess.run(
+        [sys.executable, "-c", _submodule_script.format(package=package, submodule=submodule)],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    assert output.strip() == f"{package}.{submodule}"
+
+
+@pytest.mark.parametrize("package", packages)
+def test_unknown_attribute(package):
+    module = importlib.import_module(package)
+    assert not hasattr(module, "not_a_submodule")
+    assert not hasattr(module, "__not_a_dunder__")
+
+
+@pytest.mark.parametrize("package", packages)
+@pytest.mark.xfail(raises=AttributeError)
+def test_unknown_export(package):
+    assert importlib.import_module(package).NotAnExport
+
+
+_eager_package_script = """
+import json, sys
+import {package}
+print(json.dumps([name for name in sys.modules if name.startswith("{package}.")]))
+"""
+
+
+def test_jaqcd_lazy_modules_not_imported():
+    output = subprocess.run(
+        [sys.executable, "-c", _eager_package_script.format(package="braket.ir.jaqcd")],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    imported = set(json.loads(output))
+    for module in ("circuit_stats", "packed_program", "program_stream"):
+        assert f"braket.ir.jaqcd.{module}" not in imported
+
+
+@pytest.mark.parametrize(
+    "package, names",
+    [
+        (
+            "braket.ir.jaqcd",
+            [
+                "CircuitStats",
+                "get_instruction_interning",
+                "set_instruction_interning",
+                "INSTRUCTION_TYPES",
+                "PackedInstructions",
+                "PackedProgram",
+                "iter_program",
+                "Program",
+                "H",
+            ],
+        ),
+        (
+            "braket.schema_common",
+            ["get_json_backend", "set_json_backend", "content_hash", "BraketSchemaBase"],
+        ),
+    ],
+)
+def test_partially_lazy_exports(package, names):
+    module = importlib.import_module(package)
+    for name in names:
+        export = getattr(module, name)
+        assert name in dir(module)
+        if hasattr(export, "__name__"):
+            assert getattr(inspect.getmodule(export), export.__name__) is export